@@ -0,0 +1,12 @@
+"""
+面试题解合集
+
+每道题是一个独立模块（lcNNN_* 对应 LeetCode 题号），按需导入：
+
+    from py_intv.fenwick_tree import FenwickTree
+    from py_intv.graph.reachability import prune_adjacency
+
+导入任何模块都不会打印输出或运行演示；第三方依赖（numpy、sortedcontainers、
+readerwriterlock）只在真正用到的函数/构造器里才导入。演示和基准测试通过
+``python -m py_intv <名称>`` 运行，见 py_intv/__main__.py。
+"""
@@ -0,0 +1,69 @@
+"""
+运行演示和基准测试：
+
+    python -m py_intv                      # 列出所有演示
+    python -m py_intv fenwick_tree --full  # 其余参数原样传给演示（sys.argv[1:]）
+
+名称到入口函数的映射用字符串保存，只有被选中的模块才会导入。
+"""
+import importlib
+import sys
+
+
+DEMOS = {
+    "lc54": "lc54_spiral_matrix:main",
+    "lc364": "lc364_nested_list_weight_sum_ii:main",
+    "lc432": "lc432_all_o_one:main",
+    "lc716": "lc716_max_stack:main",
+    "lc751": "lc751_ip_to_cidr:main",
+    "lc751_explain": "lc751_explain_int_to_ip:main",
+    "lc1188": "by_company.linkedin.lc1188_bounded_blocking_queue:main",
+    "lc1188_async": "by_company.linkedin.lc1188_async_bounded_queue:main",
+    "lc1188_shm": "by_company.linkedin.lc1188_shared_memory_ring_queue:main",
+    "fibonacci_tree_path": "fibonacci_tree_path:main",
+    "fenwick_tree": "fenwick_tree:main",
+    "hit_counter": "hit_counter:main",
+    "hit_history": "hit_history:main",
+    "rate_limiter": "rate_limiter:main",
+    "csr_graph": "graph.csr_graph:main",
+    "directed_all_paths": "graph.directed_all_paths_source_target:main",
+    "undirected_all_paths": "graph.undirected_all_paths_source_target:main",
+    "reachability": "graph.reachability:main",
+    "path_counting": "graph.path_counting:main",
+    "path_trie": "graph.path_trie:main",
+    "parallel_paths": "graph.parallel_paths:main",
+    "benchmark_all_paths": "graph.benchmark_all_paths:main",
+    "insertion_sort": "sort.insertion_sort:main",
+    "sorted_buffer": "sort.sorted_buffer:main",
+    "external_sort": "sort.external_sort:main",
+    "benchmark_sorts": "sort.benchmark_sorts:main",
+    "benchmark": "benchmark_runner:main",
+    "benchmark_imports": "benchmark_imports:main",
+    "instrumentation": "instrumentation:main",
+}
+
+
+def load(name):
+    """按名称导入演示模块并返回入口函数"""
+    module_name, func_name = DEMOS[name].split(":")
+    module = importlib.import_module(f"{__package__}.{module_name}")
+    return getattr(module, func_name)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in DEMOS:
+        if argv and argv[0] not in ("-h", "--help"):
+            print(f"未知的演示: {argv[0]}", file=sys.stderr)
+        print("用法: python -m py_intv <名称> [参数...]\n\n可用的演示:")
+        for name, target in DEMOS.items():
+            print(f"  {name:<22s} {target}")
+        return 0 if not argv or argv[0] in ("-h", "--help") else 2
+    entry = load(argv[0])
+    # 演示自己读取 sys.argv（如 --full）或接收 argv 参数，两种都照顾到
+    sys.argv = [f"py_intv {argv[0]}"] + argv[1:]
+    return entry()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
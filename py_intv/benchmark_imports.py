@@ -0,0 +1,138 @@
+"""
+导入开销基准测试：每个模块在全新的解释器里导入，统计
+
+    - 导入耗时：python -X importtime 报告的该模块累计耗时（含它拉进来的所有依赖）
+    - 导入时的标准输出：必须为空，导入不应该运行任何演示
+    - 重量级第三方依赖：导入后 sys.modules 里不应该出现 numpy/sortedcontainers/readerwriterlock
+
+有副作用（打印输出或提前导入第三方依赖）的模块会让退出码为1，可以直接用作检查。
+
+用法：
+    python -m py_intv.benchmark_imports                         # 打印表格
+    python -m py_intv.benchmark_imports --module fenwick_tree   # 只测指定模块，可以重复
+    python -m py_intv.benchmark_imports --output imports.json   # 同时写JSON
+"""
+import argparse
+import json
+import os
+import pkgutil
+import platform
+import subprocess
+import sys
+
+
+PACKAGE = __package__ or "py_intv"
+HEAVY_MODULES = ("numpy", "sortedcontainers", "readerwriterlock")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 子进程里执行：导入目标模块，汇报它往stdout写了多少以及带进来了哪些重量级依赖
+_PROBE = """
+import io, json, sys
+buf = io.StringIO()
+stdout, sys.stdout = sys.stdout, buf
+try:
+    import {module}
+finally:
+    sys.stdout = stdout
+print(json.dumps({{"stdout": buf.getvalue(),
+                  "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def discover_modules():
+    """列出包内所有模块（不含 __main__ 和本模块），子包的 __init__ 很轻，遍历时导入无妨"""
+    package = __import__(PACKAGE)
+    names = []
+    for info in pkgutil.walk_packages(package.__path__, PACKAGE + "."):
+        short = info.name[len(PACKAGE) + 1:]
+        if info.ispkg or short in ("__main__", "benchmark_imports"):
+            continue
+        names.append(short)
+    return sorted(names)
+
+
+def _run(args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True)
+
+
+def import_time_us(module):
+    """用 -X importtime 测一次模块的累计导入耗时（微秒）"""
+    result = _run(["-X", "importtime", "-c", f"import {module}"])
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+    # 每行格式: "import time:   self [us] | cumulative | imported package"
+    for line in reversed(result.stderr.splitlines()):
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def measure(short_name, repeat=5):
+    """
+    测量一个模块的导入开销
+
+    Args:
+        short_name: str - 相对包的模块名，如 "graph.csr_graph"
+        repeat: int - 计时重复次数，取最快一次（第一次可能还要编译.pyc）
+
+    Returns:
+        dict - module, import_ms, stdout_chars, heavy, error
+    """
+    module = f"{PACKAGE}.{short_name}"
+    row = {"module": short_name, "import_ms": None, "stdout_chars": 0, "heavy": [], "error": None}
+    try:
+        row["import_ms"] = min(import_time_us(module) for _ in range(repeat)) / 1000
+    except (ImportError, RuntimeError) as exc:
+        row["error"] = str(exc)
+        return row
+    probe = _run(["-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)])
+    report = json.loads(probe.stdout)
+    row["stdout_chars"] = len(report["stdout"])
+    row["heavy"] = report["heavy"]
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="模块导入开销基准测试")
+    parser.add_argument("--module", action="append", help="只测指定模块（相对包名），可以重复")
+    parser.add_argument("--repeat", type=int, default=5, help="计时重复次数，取最快一次")
+    parser.add_argument("--output", help="把结果写成JSON文件")
+    args = parser.parse_args(argv)
+
+    modules = args.module or discover_modules()
+    print(f"{'module':<52s} {'import ms':>10s} {'stdout':>7s}  heavy deps")
+    print("-" * 88)
+    rows = []
+    for name in modules:
+        row = measure(name, repeat=args.repeat)
+        rows.append(row)
+        if row["error"]:
+            print(f"{name:<52s} {'ERROR':>10s}          {row['error']}")
+            continue
+        print(f"{name:<52s} {row['import_ms']:>10.2f} {row['stdout_chars']:>7d}  "
+              f"{', '.join(row['heavy']) or '-'}")
+
+    bad = [row["module"] for row in rows
+           if row["error"] or row["stdout_chars"] or row["heavy"]]
+    if bad:
+        print(f"\n❌ 导入时有副作用或失败: {bad}")
+
+    if args.output:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "machine": platform.machine(),
+                "repeat": args.repeat,
+            },
+            "results": rows,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"\n结果已写入 {args.output}")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
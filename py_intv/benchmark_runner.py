@@ -0,0 +1,289 @@
+"""
+统一的基准测试运行器：按模块注册的场景 + 预热/重复统计 + tracemalloc 内存 + 基线对比
+
+场景在 benchmark_scenarios.py 里用 @scenario 注册。场景函数负责准备数据（不计时），
+返回一个无参可调用对象，运行器只对它计时：
+
+    @scenario("lc716_max_stack", "push_pop_20k")
+    def _max_stack():
+        values = ...
+        def run():
+            ...
+        return run
+
+每个场景的测量流程：
+    1. 校准：调整每个样本内的调用次数 number，使一个样本至少 --min-time 秒
+    2. 预热 --warmup 个样本，再采集 --repeat 个样本（采样期间关闭GC，与 timeit 相同）
+    3. 单独再跑一次，用 tracemalloc 记录峰值内存（tracemalloc 本身很慢，不与计时混在一起）
+
+与基线对比时，最快样本（min，受机器上其它负载的干扰最小）变慢超过 --threshold、或峰值内存增长超过 --memory-threshold
+（且绝对增长超过 64KB）都算回归，打印报告并以退出码1结束。基线与机器相关，
+默认保存在仓库根目录的 .benchmarks/baseline.json（不进版本库）。
+
+用法：
+    python -m py_intv.benchmark_runner --list                     # 列出所有场景
+    python -m py_intv.benchmark_runner                            # 运行并与基线对比
+    python -m py_intv.benchmark_runner --save-baseline            # 运行并把结果存为基线
+    python -m py_intv.benchmark_runner -k graph -k sort           # 只跑名字包含graph或sort的场景
+    python -m py_intv.benchmark_runner --threshold 0.1 --output run.json
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, ".benchmarks", "baseline.json")
+MEMORY_NOISE_BYTES = 64 * 1024
+
+
+class Scenario:
+    __slots__ = ("module", "name", "setup", "description")
+
+    def __init__(self, module, name, setup, description=""):
+        self.module = module
+        self.name = name
+        self.setup = setup
+        self.description = description
+
+    @property
+    def id(self):
+        return f"{self.module}.{self.name}"
+
+
+SCENARIOS = {}
+
+
+def scenario(module, name, description=""):
+    """
+    注册一个场景的装饰器
+
+    Args:
+        module: str - 被测模块（相对 py_intv 的名字），用于分组和过滤
+        name: str - 场景名，module 内唯一
+        description: str - 可选说明，默认取函数docstring的第一行
+    """
+    def register(setup):
+        doc = description or (setup.__doc__ or "").strip().split("\n")[0]
+        item = Scenario(module, name, setup, doc)
+        if item.id in SCENARIOS:
+            raise ValueError(f"duplicate benchmark scenario {item.id!r}")
+        SCENARIOS[item.id] = item
+        return setup
+    return register
+
+
+def load_scenarios():
+    """导入场景模块（注册发生在导入时），返回按注册顺序排列的场景"""
+    # 通过场景模块取注册表：python -m 运行时本文件是 __main__，
+    # 场景注册到的是包里的 py_intv.benchmark_runner.SCENARIOS
+    from . import benchmark_scenarios
+    return list(benchmark_scenarios.SCENARIOS.values())
+
+
+def _sample(run, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        run()
+    return (time.perf_counter() - start) / number
+
+
+def measure(item, repeat=7, warmup=1, min_time=0.02):
+    """
+    测量一个场景
+
+    Args:
+        item: Scenario
+        repeat: 采集多少个样本
+        warmup: 正式采样前丢弃多少个样本
+        min_time: 每个样本至少多少秒，不够时在样本内重复调用
+
+    Returns:
+        dict - id, number, samples 以及 min/median/mean/stdev（秒/次）、peak_bytes；
+        缺少可选依赖时只有 id 和 skipped（原因）
+    """
+    try:
+        run = item.setup()
+    except ImportError as exc:
+        return {"id": item.id, "skipped": f"missing dependency: {exc.name or exc}"}
+
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        # 校准：单次调用够长就不在样本内重复
+        first = _sample(run, 1)
+        number = max(1, math.ceil(min_time / first)) if first < min_time else 1
+        for _ in range(warmup):
+            _sample(run, number)
+        samples = [_sample(run, number) for _ in range(repeat)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "id": item.id,
+        "number": number,
+        "samples": samples,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "peak_bytes": max(0, peak - base),
+    }
+
+
+def compare(result, baseline, threshold=0.2, memory_threshold=0.2):
+    """
+    与基线中的同一场景比较
+
+    Returns:
+        (status, 说明)，status 为 "ok" / "new" / "regressed" / "improved" / "skipped"
+    """
+    if "skipped" in result:
+        return "skipped", result["skipped"]
+    base = baseline.get(result["id"])
+    if base is None:
+        return "new", "no baseline"
+    ratio = result["min"] / base["min"]
+    notes = [f"time x{ratio:.2f}"]
+    regressed = ratio > 1 + threshold
+    if base.get("peak_bytes"):
+        mem_ratio = result["peak_bytes"] / base["peak_bytes"]
+        notes.append(f"mem x{mem_ratio:.2f}")
+        if (mem_ratio > 1 + memory_threshold
+                and result["peak_bytes"] - base["peak_bytes"] > MEMORY_NOISE_BYTES):
+            regressed = True
+    if regressed:
+        return "regressed", ", ".join(notes)
+    if ratio < 1 / (1 + threshold):
+        return "improved", ", ".join(notes)
+    return "ok", ", ".join(notes)
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path, results, meta):
+    """把结果合并进基线文件：只跑了部分场景时，其它场景的基线保持不变"""
+    merged = load_baseline(path)
+    for result in results:
+        if "skipped" not in result:
+            merged[result["id"]] = {key: result[key] for key in
+                                    ("number", "min", "median", "mean", "stdev", "peak_bytes")}
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": merged}, f, indent=2, sort_keys=True)
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} us"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="py_intv 统一基准测试")
+    parser.add_argument("-k", "--filter", action="append",
+                        help="只跑id包含该子串的场景，可以重复")
+    parser.add_argument("--list", action="store_true", help="列出场景后退出")
+    parser.add_argument("--repeat", type=int, default=7, help="每个场景采集的样本数")
+    parser.add_argument("--warmup", type=int, default=1, help="预热样本数")
+    parser.add_argument("--min-time", type=float, default=0.02, help="每个样本至少多少秒")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基线JSON文件")
+    parser.add_argument("--save-baseline", action="store_true", help="把本次结果写入基线")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="最快样本变慢超过该比例算回归（默认0.2，即20%%）")
+    parser.add_argument("--memory-threshold", type=float, default=0.2,
+                        help="峰值内存增长超过该比例算回归")
+    parser.add_argument("--output", help="把本次结果（含全部样本）写成JSON文件")
+    args = parser.parse_args(argv)
+
+    items = [item for item in load_scenarios()
+             if not args.filter or any(f in item.id for f in args.filter)]
+    width = max([len(item.id) for item in items] + [len("scenario")])
+    if args.list:
+        for item in items:
+            print(f"{item.id:<{width}s}  {item.description}")
+        return 0
+    if not items:
+        print("没有匹配的场景")
+        return 2
+
+    baseline = {} if args.save_baseline else load_baseline(args.baseline)
+    print(f"{'scenario':<{width}s} {'median':>12s} {'±stdev':>8s} {'number':>7s} "
+          f"{'peak KB':>10s}  status")
+    print("-" * (width + 58))
+    results, report = [], []
+    for item in items:
+        result = measure(item, repeat=args.repeat, warmup=args.warmup, min_time=args.min_time)
+        results.append(result)
+        status, note = compare(result, baseline, args.threshold, args.memory_threshold)
+        report.append((item.id, status, note))
+        if status == "skipped":
+            print(f"{item.id:<{width}s} {'-':>12s} {'-':>8s} {'-':>7s} {'-':>10s}  skipped ({note})")
+            continue
+        spread = result["stdev"] / result["median"] * 100 if result["median"] else 0.0
+        marker = {"regressed": "❌ ", "improved": "✅ "}.get(status, "")
+        status_text = status if status == "new" else f"{marker}{status} ({note})"
+        print(f"{item.id:<{width}s} {format_seconds(result['median']):>12s} {spread:>7.1f}% "
+              f"{result['number']:>7d} {result['peak_bytes'] / 1024:>10.1f}  {status_text}")
+
+    meta = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "min_time": args.min_time,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+        print(f"\n结果已写入 {args.output}")
+    if args.save_baseline:
+        save_baseline(args.baseline, results, meta)
+        print(f"\n基线已写入 {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\n没有基线（{args.baseline}），用 --save-baseline 保存一份后再对比")
+        return 0
+    regressions = [(scenario_id, note) for scenario_id, status, note in report
+                   if status == "regressed"]
+    if regressions:
+        print(f"\n❌ {len(regressions)} 个场景相对基线回归"
+              f"（时间阈值 +{args.threshold:.0%}，内存阈值 +{args.memory_threshold:.0%}）：")
+        for scenario_id, note in regressions:
+            print(f"  {scenario_id}: {note}")
+        return 1
+    print(f"\n✅ 没有回归（对比 {args.baseline}）")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,535 @@
+"""
+benchmark_runner 的场景注册表，按被测模块分组
+
+每个场景函数准备好数据后返回要计时的无参函数；被测模块在场景函数里才导入，
+这样 --list 和 -k 过滤都不会导入用不到的模块，缺少可选依赖的场景会被标记为 skipped。
+数据都用固定种子生成，不同机器、不同版本之间跑的是同一份输入。
+"""
+import atexit
+import os
+import random
+import shutil
+import tempfile
+from array import array
+
+from .benchmark_runner import SCENARIOS, scenario  # noqa: F401  (SCENARIOS 供运行器读取)
+
+
+# ---------------------------------------------------------------- lc716 MaxStack
+
+@scenario("lc716_max_stack", "push_then_pop_max_20k")
+def _max_stack_pop_max():
+    """压入2万个随机数，再交替 popMax / pop 直到清空"""
+    from .lc716_max_stack import MaxStack
+
+    rng = random.Random(0)
+    values = [rng.randrange(1_000_000) for _ in range(20_000)]
+
+    def run():
+        stack = MaxStack()
+        for v in values:
+            stack.push(v)
+        for i in range(len(values)):
+            if i & 1:
+                stack.pop()
+            else:
+                stack.popMax()
+    return run
+
+
+@scenario("lc716_max_stack", "mixed_top_peek_20k")
+def _max_stack_mixed():
+    """push / top / peekMax 混合，栈深度保持在1000左右"""
+    from .lc716_max_stack import MaxStack
+
+    rng = random.Random(1)
+    ops = [rng.random() for _ in range(20_000)]
+
+    def run():
+        stack = MaxStack()
+        for i, op in enumerate(ops):
+            if op < 0.5 or i < 1000:
+                stack.push(i)
+            elif op < 0.75:
+                stack.top()
+                stack.pop()
+            else:
+                stack.peekMax()
+    return run
+
+
+# ---------------------------------------------------------------- HitCounter / HitHistory / RateLimiter
+
+@scenario("hit_counter", "hit_get_hits_100k")
+def _hit_counter():
+    """10万次 hit（每秒约3次），每100次调用一次 getHits"""
+    from .hit_counter import HitCounter
+
+    HitCounter(keep_history=False)   # readerwriterlock 在构造时才导入，缺少时在准备阶段就报错
+    timestamps = [1 + i // 3 for i in range(100_000)]
+
+    def run():
+        counter = HitCounter(keep_history=False)
+        for i, ts in enumerate(timestamps):
+            counter.hit(ts)
+            if i % 100 == 0:
+                counter.getHits(ts)
+    return run
+
+
+def _rate_limiter(mode):
+    from random import Random
+    from .rate_limiter import RateLimiter
+
+    rng = Random(0)
+    keys = [rng.randrange(1000) for _ in range(100_000)]
+    timestamps = [1_000_000 + i // 1000 for i in range(100_000)]
+
+    def run():
+        limiter = RateLimiter(window=300, mode=mode)
+        for key, ts in zip(keys, timestamps):
+            limiter.try_acquire(key, ts, 100)
+    return run
+
+
+@scenario("rate_limiter", "sliding_window_100k")
+def _rate_limiter_window():
+    """10万次限流判断，1000个键，每秒约1000次请求"""
+    return _rate_limiter("sliding_window")
+
+
+@scenario("rate_limiter", "token_bucket_100k")
+def _rate_limiter_token():
+    """同上，令牌桶模式"""
+    return _rate_limiter("token_bucket")
+
+
+@scenario("hit_history", "ingest_1_day")
+def _hit_history_ingest():
+    """逐秒写入一天的访问记录（触发分钟/小时两级压缩）"""
+    from .hit_history import HitHistory
+
+    start = 1_700_000_000
+
+    def run():
+        history = HitHistory()
+        for ts in range(start, start + 86_400):
+            history.hit(ts, 1 + ts % 5)
+    return run
+
+
+@scenario("hit_history", "ingest_sparse_5k")
+def _hit_history_sparse():
+    """5000次访问，间隔在1秒到2小时之间跳跃（每次 hit 的代价应只与访问次数有关，与空闲时长无关）"""
+    from .hit_history import HitHistory
+
+    rng = random.Random(0)
+    timestamps = []
+    ts = 1_700_000_000
+    for _ in range(5_000):
+        ts += rng.choice((1, 30, 600, 3_599, 7_200))
+        timestamps.append(ts)
+
+    def run():
+        history = HitHistory()
+        for ts in timestamps:
+            history.hit(ts)
+    return run
+
+
+@scenario("hit_history", "query_7_days_10k")
+def _hit_history_query():
+    """在7天的历史上做1万次任意区间查询"""
+    from .hit_history import HitHistory
+
+    start = 1_700_000_000
+    end = start + 7 * 86_400
+    history = HitHistory()
+    for ts in range(start, end, 7):
+        history.hit(ts, 7)
+    rng = random.Random(0)
+    windows = []
+    for _ in range(10_000):
+        t1 = rng.randrange(start, end)
+        windows.append((t1, rng.randrange(t1, end + 1)))
+
+    def run():
+        for t1, t2 in windows:
+            history.hits_between(t1, t2)
+    return run
+
+
+# ---------------------------------------------------------------- lc751 IP to CIDR
+
+@scenario("lc751_ip_to_cidr", "random_ranges_2k")
+def _ip_to_cidr():
+    """2000个随机起点、随机长度（1 ~ 2^20）的区间"""
+    from .lc751_ip_to_cidr import ipToCIDR
+
+    rng = random.Random(0)
+    cases = []
+    for _ in range(2_000):
+        ip = rng.randrange(1 << 32)
+        ip_str = ".".join(str((ip >> shift) & 255) for shift in (24, 16, 8, 0))
+        cases.append((ip_str, rng.randrange(1, 1 << 20)))
+
+    def run():
+        for ip, n in cases:
+            ipToCIDR(ip, n)
+    return run
+
+
+# ---------------------------------------------------------------- 斐波那契树
+
+@scenario("fibonacci_tree_path", "order40_pairs_5k")
+def _fibonacci_tree_path():
+    """40阶斐波那契树（约2.6亿个节点）上5000对随机节点之间的路径"""
+    from .fibonacci_tree_path import FibonacciTreePathFinder
+
+    finder = FibonacciTreePathFinder()
+    order = 40
+    rng = random.Random(0)
+    pairs = [(rng.randrange(finder.nodes[order]), rng.randrange(finder.nodes[order]))
+             for _ in range(5_000)]
+
+    def run():
+        for source, dest in pairs:
+            finder.find_path(order, source, dest)
+    return run
+
+
+@scenario("fibonacci_tree_path", "order2000_runs_200")
+def _fibonacci_tree_runs():
+    """2000阶斐波那契树上200个随机节点按游程下降（含右脊上的长段）"""
+    from .fibonacci_tree_path import FibonacciTreePathFinder
+
+    order = 2000
+    finder = FibonacciTreePathFinder(max_order=order)
+    finder.find_path_runs(order, 0)
+    rng = random.Random(0)
+    total = finder.nodes[order]
+    targets = [rng.randrange(total) for _ in range(190)] + [total - 1 - i for i in range(10)]
+
+    def run():
+        for target in targets:
+            finder.find_path_runs(order, target)
+    return run
+
+
+# ---------------------------------------------------------------- lc364 / lc54 / lc432
+
+@scenario("lc364_nested_list_weight_sum_ii", "wide_and_deep")
+def _nested_weight_sum():
+    """500个元素、嵌套深度最多30的 NestedInteger 列表"""
+    from .lc364_nested_list_weight_sum_ii import Solution, build_nested_integer
+
+    rng = random.Random(0)
+
+    def nested(depth):
+        if depth == 0 or rng.random() < 0.3:
+            return rng.randrange(100)
+        return [nested(depth - 1) for _ in range(rng.randrange(1, 3))]
+
+    data = [build_nested_integer(nested(30)) for _ in range(500)]
+    solution = Solution()
+
+    def run():
+        solution.depthSumInverse(data)
+    return run
+
+
+@scenario("lc364_nested_list_weight_sum_ii", "incremental_edits_5k")
+def _nested_weight_sum_incremental():
+    """在约3000个节点的树上做5000次 add / setInteger，每次修改后读一次 depthSumInverse"""
+    from .lc364_nested_list_weight_sum_ii import IncrementalNestedInteger, build_nested_integer
+
+    rng = random.Random(0)
+
+    def nested(depth):
+        if depth == 0 or rng.random() < 0.3:
+            return rng.randrange(100)
+        return [nested(depth - 1) for _ in range(rng.randrange(1, 3))]
+
+    data = [nested(20) for _ in range(200)]
+    edits = [(rng.random(), rng.randrange(100)) for _ in range(5_000)]
+
+    def run():
+        root = build_nested_integer(data, IncrementalNestedInteger)
+        nodes, stack = [], [root]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            if not node.isInteger():
+                stack.extend(node.getList())
+        for pick, value in edits:
+            node = nodes[int(pick * len(nodes))]
+            if node is not root and pick < 0.3:
+                node.setInteger(value)
+            else:
+                child = IncrementalNestedInteger(value)
+                node.add(child)
+                nodes.append(child)
+            root.depthSumInverse()
+    return run
+
+
+@scenario("lc54_spiral_matrix", "spiral_500x300")
+def _spiral_matrix():
+    """500x300 矩阵的螺旋遍历"""
+    from .lc54_spiral_matrix import Solution
+
+    matrix = [[r * 300 + c for c in range(300)] for r in range(500)]
+    solution = Solution()
+
+    def run():
+        solution.spiralOrder(matrix)
+    return run
+
+
+@scenario("lc54_spiral_matrix", "cached_batch_20k_4x5")
+def _spiral_matrix_batch():
+    """2万个 4x5 小矩阵，按形状缓存的索引置换"""
+    from .lc54_spiral_matrix import spiral_order_batch
+
+    matrices = [[[(i + r * 5 + c) % 97 for c in range(5)] for r in range(4)]
+                for i in range(20_000)]
+
+    def run():
+        spiral_order_batch(matrices)
+    return run
+
+
+@scenario("lc432_all_o_one", "inc_dec_100k")
+def _all_o_one():
+    """1万个key上10万次 inc/dec 混合，每100次查一次最大/最小key"""
+    from .lc432_all_o_one import AllOne
+
+    rng = random.Random(0)
+    keys = [f"k{rng.randrange(10_000)}" for _ in range(100_000)]
+    decs = [rng.random() < 0.3 for _ in range(100_000)]
+
+    def run():
+        counts = AllOne()
+        for i, (key, dec) in enumerate(zip(keys, decs)):
+            if dec and key in counts:
+                counts.dec(key)
+            else:
+                counts.inc(key)
+            if i % 100 == 0:
+                counts.getMaxKey()
+                counts.getMinKey()
+    return run
+
+
+# ---------------------------------------------------------------- Fenwick 树
+
+@scenario("fenwick_tree", "add_prefix_sum_100k")
+def _fenwick_tree():
+    """100万个计数器上10万次 add + 10万次 prefix_sum"""
+    from .fenwick_tree import FenwickTree
+
+    n = 1_000_000
+    tree = FenwickTree(n)
+    rng = random.Random(0)
+    indices = [rng.randrange(n) for _ in range(100_000)]
+
+    def run():
+        for i in indices:
+            tree.add(i, 1)
+        for i in indices:
+            tree.prefix_sum(i)
+    return run
+
+
+# ---------------------------------------------------------------- 图搜索
+
+def _grid(rows, cols):
+    from .graph.workloads import grid_graph
+    return grid_graph(rows, cols)
+
+
+@scenario("graph.undirected_all_paths_source_target", "recursive_grid_4x4")
+def _all_paths_undirected():
+    """4x4网格，角到角的所有简单路径（递归 + list 判重）"""
+    from .graph.undirected_all_paths_source_target import all_paths_undirected
+
+    grid = _grid(4, 4)
+    return lambda: all_paths_undirected(grid, 0, 15)
+
+
+@scenario("graph.undirected_all_paths_source_target", "optimized_grid_5x4")
+def _all_paths_undirected_optimized():
+    """5x4网格，角到角的所有简单路径（递归 + set 判重）"""
+    from .graph.undirected_all_paths_source_target import all_paths_undirected_optimized
+
+    grid = _grid(5, 4)
+    return lambda: all_paths_undirected_optimized(grid, 0, 19)
+
+
+@scenario("graph.undirected_all_paths_source_target", "iter_grid_5x4")
+def _iter_paths_undirected():
+    """5x4网格，显式栈生成器逐条消费"""
+    from .graph.undirected_all_paths_source_target import iter_paths_undirected
+
+    grid = _grid(5, 4)
+
+    def run():
+        for _ in iter_paths_undirected(grid, 0, 19):
+            pass
+    return run
+
+
+@scenario("graph.csr_graph", "iter_paths_csr_grid_5x4")
+def _iter_paths_csr():
+    """5x4网格的CSR表示，bytearray 判重"""
+    from .graph.csr_graph import CSRGraph, iter_paths_csr
+
+    csr = CSRGraph.from_adjacency(_grid(5, 4), directed=False)
+
+    def run():
+        for _ in iter_paths_csr(csr, 0, 19):
+            pass
+    return run
+
+
+@scenario("graph.directed_all_paths_source_target", "layered_dag_prune")
+def _all_paths_directed():
+    """8层x4宽的分层DAG，带剪枝的有向图全路径"""
+    from .graph.directed_all_paths_source_target import all_paths_directed
+    from .graph.workloads import layered_dag
+
+    dag = layered_dag(8, 4, p=0.6, seed=0)
+    target = max(dag)
+    return lambda: all_paths_directed(dag, 0, target, prune=True)
+
+
+@scenario("graph.path_counting", "count_paths_layered_dag")
+def _count_paths():
+    """40层x20宽的分层DAG，拓扑DP计数（路径数是大整数）"""
+    from .graph.path_counting import count_paths
+    from .graph.workloads import layered_dag
+
+    dag = layered_dag(40, 20, p=0.3, seed=0)
+    target = max(dag)
+    return lambda: count_paths(dag, 0, target)
+
+
+@scenario("graph.reachability", "prune_gnp_2k")
+def _prune_adjacency():
+    """2000个节点的稀疏随机无向图，双连通分量剪枝"""
+    from .graph.reachability import prune_adjacency
+    from .graph.workloads import gnp_random_graph
+
+    graph = gnp_random_graph(2_000, 0.002, seed=0)
+    target = max(graph)
+    return lambda: prune_adjacency(graph, 0, target, directed=False)
+
+
+# ---------------------------------------------------------------- 排序
+
+def _random_list(n, seed=0):
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(n)]
+
+
+@scenario("sort.insertion_sort", "insertion_sort_random_1k")
+def _insertion_sort():
+    """1000个随机浮点数"""
+    from .sort.insertion_sort import insertion_sort
+
+    data = _random_list(1_000)
+    return lambda: insertion_sort(data)
+
+
+@scenario("sort.insertion_sort", "insertion_sort_optimized_random_4k")
+def _insertion_sort_optimized():
+    """4000个随机浮点数，二分查找 + 切片块移动"""
+    from .sort.insertion_sort import insertion_sort_optimized
+
+    data = _random_list(4_000)
+    return lambda: insertion_sort_optimized(data)
+
+
+@scenario("sort.insertion_sort", "hybrid_sort_random_100k")
+def _hybrid_sort():
+    """10万个随机浮点数"""
+    from .sort.insertion_sort import hybrid_sort
+
+    data = _random_list(100_000)
+    return lambda: hybrid_sort(data)
+
+
+@scenario("sort.insertion_sort", "hybrid_sort_nearly_sorted_100k")
+def _hybrid_sort_nearly_sorted():
+    """10万个元素，有序序列中随机交换1%的位置"""
+    from .sort.insertion_sort import hybrid_sort
+
+    rng = random.Random(0)
+    data = list(range(100_000))
+    for _ in range(1_000):
+        i, j = rng.randrange(100_000), rng.randrange(100_000)
+        data[i], data[j] = data[j], data[i]
+    return lambda: hybrid_sort(data)
+
+
+@scenario("sort.sorted_buffer", "add_remove_100k")
+def _sorted_buffer():
+    """逐个插入10万个随机数，再删除其中一半"""
+    from .sort.sorted_buffer import SortedBuffer
+
+    data = _random_list(100_000)
+    removals = data[::2]
+
+    def run():
+        buf = SortedBuffer()
+        for x in data:
+            buf.add(x)
+        for x in removals:
+            buf.remove(x)
+    return run
+
+
+@scenario("sort.external_sort", "single_process_200k")
+def _external_sort():
+    """20万条int64记录，1MB内存预算（多个run + 归并），单进程"""
+    from .sort.external_sort import external_sort
+
+    tmp = tempfile.mkdtemp(prefix="bench_external_sort_")
+    atexit.register(shutil.rmtree, tmp, True)
+    src = os.path.join(tmp, "input.bin")
+    dst = os.path.join(tmp, "output.bin")
+    rng = random.Random(0)
+    with open(src, "wb") as f:
+        array("q", (rng.randrange(-2 ** 40, 2 ** 40) for _ in range(200_000))).tofile(f)
+
+    return lambda: external_sort(src, dst, memory_budget=1 << 20, processes=1)
+
+
+# ---------------------------------------------------------------- 有界阻塞队列
+
+@scenario("by_company.linkedin.lc1188_bounded_blocking_queue", "single_thread_100k")
+def _bounded_blocking_queue():
+    """单线程交替 enqueue / dequeue 10万个元素（只测锁和环形缓冲区本身的开销）"""
+    from .by_company.linkedin.lc1188_bounded_blocking_queue import BoundedBlockingQueue
+
+    def run():
+        queue = BoundedBlockingQueue(1024)
+        for i in range(100_000):
+            queue.enqueue(i)
+            queue.dequeue()
+    return run
+
+
+@scenario("by_company.linkedin.lc1188_bounded_blocking_queue", "batches_100k")
+def _bounded_blocking_queue_batches():
+    """单线程按256个一批 enqueue_many / dequeue_many 10万个元素"""
+    from .by_company.linkedin.lc1188_bounded_blocking_queue import BoundedBlockingQueue
+
+    batch = list(range(256))
+
+    def run():
+        queue = BoundedBlockingQueue(1024)
+        for _ in range(100_000 // 256):
+            queue.enqueue_many(batch)
+            queue.dequeue_many(256)
+    return run
@@ -0,0 +1 @@
+"""按公司整理的面试题"""
@@ -0,0 +1 @@
+"""LinkedIn：1188 有界阻塞队列的线程、asyncio、共享内存版本"""
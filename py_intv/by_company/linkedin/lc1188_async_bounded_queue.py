@@ -0,0 +1,493 @@
+import asyncio
+import threading
+from collections import deque
+from queue import Empty, Full
+from time import monotonic
+
+
+class AsyncBoundedQueue:
+    """
+    asyncio 版本的有界队列，接口与 lc1188_bounded_blocking_queue.py 的 BoundedBlockingQueue 一致：
+    capacity / enqueue / dequeue / size / enqueue_many / dequeue_many，超时抛出 queue.Full / queue.Empty
+
+    所有操作都在同一个事件循环里执行，所以不需要锁；等待者是future：
+        _putters / _getters - 等待空位 / 等待元素的future队列（FIFO）
+    唤醒规则与线程版相同：只在 空→非空 / 满→不满 时唤醒，离开时接力唤醒一个同类等待者。
+    超时用 loop.call_later 直接结束future，不像 asyncio.wait_for 那样每次等待都创建一个Task。
+
+    不能跨线程使用；线程里的生产者通过 ThreadBridge 投递。
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._buf = [None] * capacity
+        self._head = 0
+        self._count = 0
+        self._putters = deque()
+        self._getters = deque()
+
+    # ---------- 内部方法 ----------
+
+    @staticmethod
+    def _wake(waiters, n=1):
+        """唤醒最多n个还在等待的future，跳过已经超时或取消的"""
+        while n and waiters:
+            fut = waiters.popleft()
+            if not fut.done():
+                fut.set_result(True)
+                n -= 1
+
+    async def _wait(self, waiters, ready, timeout):
+        """等到 ready() 为真；超时返回False"""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else monotonic() + timeout
+        while not ready():
+            fut = loop.create_future()
+            waiters.append(fut)
+            handle = None
+            if deadline is not None:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    waiters.remove(fut)
+                    return False
+                handle = loop.call_later(remaining, _expire, fut)
+            try:
+                await fut
+            except asyncio.CancelledError:
+                # 被唤醒之后又被取消：把这次唤醒让给下一个等待者，避免唤醒丢失
+                if _woken(fut):
+                    self._wake(waiters)
+                raise
+            finally:
+                if handle is not None:
+                    handle.cancel()
+                if not _woken(fut):
+                    # 超时或取消的future还留在等待队列里
+                    try:
+                        waiters.remove(fut)
+                    except ValueError:
+                        pass
+        return True
+
+    def _put(self, elements, start, n):
+        buf, capacity = self._buf, self.capacity
+        tail = (self._head + self._count) % capacity
+        first = min(n, capacity - tail)
+        buf[tail:tail + first] = elements[start:start + first]
+        if first < n:
+            buf[:n - first] = elements[start + first:start + n]
+        was_empty = self._count == 0
+        self._count += n
+        if was_empty and self._getters:
+            self._wake(self._getters, n)
+        if self._putters and self._count < capacity:
+            self._wake(self._putters)
+
+    def _take(self, n):
+        buf, capacity, head = self._buf, self.capacity, self._head
+        first = min(n, capacity - head)
+        out = buf[head:head + first]
+        buf[head:head + first] = [None] * first
+        if first < n:
+            out += buf[:n - first]
+            buf[:n - first] = [None] * (n - first)
+        was_full = self._count == capacity
+        self._head = (head + n) % capacity
+        self._count -= n
+        if was_full and self._putters:
+            self._wake(self._putters, n)
+        if self._getters and self._count:
+            self._wake(self._getters)
+        return out
+
+    # ---------- 公共接口 ----------
+
+    def enqueue_nowait(self, element) -> None:
+        """不等待的入队，队列满时抛出 queue.Full"""
+        count = self._count
+        if count == self.capacity:
+            raise Full
+        self._buf[(self._head + count) % self.capacity] = element
+        self._count = count + 1
+        if count == 0 and self._getters:
+            self._wake(self._getters)
+        if self._putters and count + 1 < self.capacity:
+            self._wake(self._putters)
+
+    def dequeue_nowait(self):
+        """不等待的出队，队列空时抛出 queue.Empty"""
+        if not self._count:
+            raise Empty
+        buf, head = self._buf, self._head
+        element = buf[head]
+        buf[head] = None
+        self._head = (head + 1) % self.capacity
+        self._count -= 1
+        if self._count == self.capacity - 1 and self._putters:
+            self._wake(self._putters)
+        if self._getters and self._count:
+            self._wake(self._getters)
+        return element
+
+    async def enqueue(self, element, timeout=None) -> None:
+        """
+        入队，队列满时等待
+
+        Raises:
+            queue.Full - 等待超过timeout秒仍然没有空位
+        """
+        if self._count == self.capacity:
+            if not await self._wait(self._putters, lambda: self._count < self.capacity, timeout):
+                raise Full
+        self.enqueue_nowait(element)
+
+    async def dequeue(self, timeout=None):
+        """
+        出队，队列空时等待
+
+        Raises:
+            queue.Empty - 等待超过timeout秒仍然没有元素
+        """
+        if not self._count:
+            if not await self._wait(self._getters, lambda: self._count > 0, timeout):
+                raise Empty
+        return self.dequeue_nowait()
+
+    async def enqueue_many(self, elements, timeout=None) -> int:
+        """
+        批量入队，放不下的部分等待空位后继续
+
+        Returns:
+            int - 实际入队的元素个数；超时则在已入队的位置停下
+        """
+        elements = list(elements)
+        deadline = None if timeout is None else monotonic() + timeout
+        done = 0
+        while done < len(elements):
+            if self._count == self.capacity:
+                remaining = None if deadline is None else deadline - monotonic()
+                if not await self._wait(self._putters, lambda: self._count < self.capacity,
+                                        remaining):
+                    break
+            n = min(len(elements) - done, self.capacity - self._count)
+            self._put(elements, done, n)
+            done += n
+        return done
+
+    async def dequeue_many(self, max_n, timeout=None) -> list:
+        """
+        批量出队：等到至少有一个元素，然后一次取走最多max_n个
+
+        Returns:
+            list - 取出的元素；超时返回空列表
+        """
+        if not self._count:
+            if not await self._wait(self._getters, lambda: self._count > 0, timeout):
+                return []
+        return self._take(min(max_n, self._count))
+
+    def size(self) -> int:
+        return self._count
+
+
+def _expire(fut):
+    if not fut.done():
+        fut.set_result(False)
+
+
+def _woken(fut):
+    """future是否是被 _wake 唤醒的（而不是超时或取消）"""
+    return fut.done() and not fut.cancelled() and fut.result()
+
+
+class ThreadBridge:
+    """
+    线程 -> asyncio 的桥：生产者线程调用 enqueue / enqueue_many，元素进入事件循环里的 AsyncBoundedQueue
+
+    线程把元素追加到一个有界的待投递缓冲区（threading锁保护）。只有缓冲区从空变为非空时
+    才用 call_soon_threadsafe 唤醒一次事件循环，循环里的投递任务一次搬走整个缓冲区，
+    所以高负载下一次线程切换可以搬运很多元素，不会每个元素都跳一次线程，也不需要轮询。
+    缓冲区满（事件循环侧的队列也满了）时生产者线程阻塞，形成背压。
+    """
+
+    def __init__(self, queue, loop, capacity=None):
+        self._queue = queue
+        self._loop = loop
+        self.capacity = capacity or queue.capacity
+        self._pending = []
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._waiting = 0
+        self._scheduled = False
+
+    def enqueue(self, element, timeout=None) -> None:
+        """
+        在生产者线程中调用；待投递缓冲区满时阻塞
+
+        Raises:
+            queue.Full - 等待超过timeout秒仍然没有空位
+        """
+        if not self.enqueue_many((element,), timeout):
+            raise Full
+
+    def enqueue_many(self, elements, timeout=None) -> int:
+        """
+        在生产者线程中调用，批量投递
+
+        Returns:
+            int - 实际投递的元素个数；超时则在已投递的位置停下
+        """
+        elements = list(elements)
+        deadline = None if timeout is None else monotonic() + timeout
+        done = 0
+        while done < len(elements):
+            with self._lock:
+                while len(self._pending) >= self.capacity:
+                    remaining = None if deadline is None else deadline - monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return done
+                    self._waiting += 1
+                    try:
+                        self._not_full.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                n = min(len(elements) - done, self.capacity - len(self._pending))
+                self._pending.extend(elements[done:done + n])
+                done += n
+                if not self._scheduled:
+                    self._scheduled = True
+                    self._loop.call_soon_threadsafe(self._start_drain)
+        return done
+
+    def _start_drain(self):
+        self._loop.create_task(self._drain())
+
+    async def _drain(self):
+        """在事件循环中运行：反复搬走整个待投递缓冲区，直到它为空"""
+        queue = self._queue
+        while True:
+            with self._lock:
+                batch = self._pending
+                if not batch:
+                    self._scheduled = False
+                    return
+                self._pending = []
+                if self._waiting:
+                    self._not_full.notify_all()
+            await queue.enqueue_many(batch)
+
+
+# 测试用例
+async def test_async_bounded_queue():
+    q = AsyncBoundedQueue(2)
+    await q.enqueue(1)
+    assert await q.dequeue() == 1
+    await q.enqueue(2)
+    await q.enqueue(3)
+    assert q.size() == 2
+    try:
+        await q.enqueue(4, timeout=0.01)
+        assert False, "队列满时应该超时"
+    except Full:
+        pass
+    assert await q.dequeue() == 2 and await q.dequeue() == 3
+    try:
+        await q.dequeue(timeout=0.01)
+        assert False, "队列空时应该超时"
+    except Empty:
+        pass
+    assert not q._getters and not q._putters
+
+    q = AsyncBoundedQueue(5)
+    assert await q.enqueue_many(range(4)) == 4
+    assert await q.dequeue_many(3) == [0, 1, 2]
+    assert await q.enqueue_many(range(4, 8)) == 4
+    assert await q.dequeue_many(10) == [3, 4, 5, 6, 7]
+    assert await q.enqueue_many(range(8), timeout=0.01) == 5
+    assert await q.dequeue_many(10) == [0, 1, 2, 3, 4]
+    assert await q.dequeue_many(10, timeout=0.01) == []
+
+    # 被取消的等待者不能吞掉唤醒
+    q = AsyncBoundedQueue(1)
+    waiter = asyncio.ensure_future(q.dequeue())
+    other = asyncio.ensure_future(q.dequeue())
+    await asyncio.sleep(0)
+    await q.enqueue("x")
+    waiter.cancel()
+    assert await asyncio.wait_for(other, 1) == "x"
+    print("基本测试通过!")
+
+
+async def test_concurrent(producers=4, consumers=3, per_producer=3000):
+    q = AsyncBoundedQueue(7)
+    total = producers * per_producer
+    received = []
+
+    async def produce(pid):
+        items = [(pid, i) for i in range(per_producer)]
+        for i in range(0, per_producer, 10):
+            if pid % 2:
+                await q.enqueue_many(items[i:i + 10])
+            else:
+                for item in items[i:i + 10]:
+                    await q.enqueue(item)
+
+    async def consume(cid):
+        while len(received) < total:
+            batch = await q.dequeue_many(3, timeout=0.5) if cid % 2 else [await q.dequeue()]
+            received.extend(batch)
+
+    consumers_tasks = [asyncio.ensure_future(consume(c)) for c in range(consumers)]
+    await asyncio.gather(*(produce(p) for p in range(producers)))
+    while len(received) < total:
+        await asyncio.sleep(0.01)
+    for task in consumers_tasks:
+        task.cancel()
+    await asyncio.gather(*consumers_tasks, return_exceptions=True)
+    assert sorted(received) == sorted((p, i) for p in range(producers) for i in range(per_producer))
+
+    # 线程桥：多个线程投递，协程消费
+    loop = asyncio.get_running_loop()
+    q = AsyncBoundedQueue(16)
+    bridge = ThreadBridge(q, loop, capacity=8)
+    threads = [threading.Thread(target=lambda p=p: bridge.enqueue_many([(p, i) for i in range(per_producer)])
+                                if p % 2 else [bridge.enqueue((p, i)) for i in range(per_producer)])
+               for p in range(producers)]
+    for t in threads:
+        t.start()
+    received = []
+    while len(received) < total:
+        received.extend(await q.dequeue_many(64))
+    for t in threads:
+        t.join()
+    assert sorted(received) == sorted((p, i) for p in range(producers) for i in range(per_producer))
+    for p in range(producers):
+        mine = [i for pid, i in received if pid == p]
+        assert mine == sorted(mine), "同一个线程投递的元素必须保持顺序"
+    print("并发测试通过!")
+
+
+async def benchmark(items=200_000, capacity=1024, batch=64):
+    import queue
+    import statistics
+    import time
+
+    print(f"\n协程 生产者x消费者 吞吐量（元素/秒，{items:,} 个元素，容量 {capacity}）:")
+
+    async def throughput(make, put, get, producers, consumers):
+        q = make()
+        per_producer = items // producers
+        total = per_producer * producers
+        quotas = [total // consumers + (c < total % consumers) for c in range(consumers)]
+        start = time.perf_counter()
+        await asyncio.gather(*(put(q, per_producer) for _ in range(producers)),
+                             *(get(q, quota) for quota in quotas))
+        return total / (time.perf_counter() - start)
+
+    async def put_each(q, n):
+        for i in range(n):
+            await q.put(i)
+
+    async def get_each(q, n):
+        for _ in range(n):
+            await q.get()
+
+    async def enqueue_each(q, n):
+        for i in range(n):
+            await q.enqueue(i)
+
+    async def dequeue_each(q, n):
+        for _ in range(n):
+            await q.dequeue()
+
+    async def enqueue_batches(q, n):
+        for i in range(0, n, batch):
+            await q.enqueue_many(range(i, min(i + batch, n)))
+
+    async def dequeue_batches(q, n):
+        while n:
+            n -= len(await q.dequeue_many(min(batch, n)))
+
+    variants = [
+        ("asyncio.Queue", lambda: asyncio.Queue(capacity), put_each, get_each),
+        ("ring 逐个", lambda: AsyncBoundedQueue(capacity), enqueue_each, dequeue_each),
+        (f"ring 批量({batch})", lambda: AsyncBoundedQueue(capacity), enqueue_batches, dequeue_batches),
+    ]
+    print(f"{'':<10s}" + "".join(f"{name:>18s}" for name, *_ in variants))
+    for producers, consumers in [(1, 1), (4, 4), (16, 16)]:
+        row = [await throughput(make, put, get, producers, consumers)
+               for _, make, put, get in variants]
+        print(f"{f'{producers}x{consumers}':<10s}" + "".join(f"{r:>18,.0f}" for r in row))
+
+    # 延迟：生产者每次只放一个元素并等待消费者取走（ping-pong），测量入队到出队的时间
+    print("\n单元素延迟（入队 -> 消费者拿到，µs）:")
+    for name, make, put, get in [("asyncio.Queue", lambda: asyncio.Queue(1), "put", "get"),
+                                 ("AsyncBoundedQueue", lambda: AsyncBoundedQueue(1), "enqueue", "dequeue")]:
+        q, done = make(), make()
+        samples = []
+
+        async def consumer():
+            for _ in range(20_000):
+                stamp = await getattr(q, get)()
+                samples.append(time.perf_counter() - stamp)
+                await getattr(done, put)(None)
+
+        task = asyncio.ensure_future(consumer())
+        for _ in range(20_000):
+            await getattr(q, put)(time.perf_counter())
+            await getattr(done, get)()
+        await task
+        samples.sort()
+        print(f"  {name:<18s} p50 {statistics.median(samples) * 1e6:6.1f}   "
+              f"p99 {samples[int(len(samples) * 0.99)] * 1e6:6.1f}")
+
+    # 线程 -> 协程
+    n = items // 4
+    loop = asyncio.get_running_loop()
+    print(f"\n一个生产者线程 -> 协程消费者（{n:,} 个元素，元素/秒）:")
+
+    blocking = queue.Queue(capacity)
+    producer = threading.Thread(target=lambda: [blocking.put(i) for i in range(n)])
+    start = time.perf_counter()
+    producer.start()
+    for _ in range(n):
+        await loop.run_in_executor(None, blocking.get)
+    producer.join()
+    print(f"  queue.Queue + run_in_executor:         {n / (time.perf_counter() - start):>12,.0f}")
+
+    aq = asyncio.Queue()
+    producer = threading.Thread(target=lambda: [loop.call_soon_threadsafe(aq.put_nowait, i)
+                                                for i in range(n)])
+    start = time.perf_counter()
+    producer.start()
+    for _ in range(n):
+        await aq.get()
+    producer.join()
+    print(f"  asyncio.Queue + call_soon_threadsafe:  {n / (time.perf_counter() - start):>12,.0f}  （无界，没有背压）")
+
+    q = AsyncBoundedQueue(capacity)
+    bridge = ThreadBridge(q, loop)
+    producer = threading.Thread(target=lambda: [bridge.enqueue(i) for i in range(n)])
+    start = time.perf_counter()
+    producer.start()
+    received = 0
+    while received < n:
+        received += len(await q.dequeue_many(batch))
+    producer.join()
+    print(f"  ThreadBridge + dequeue_many:           {n / (time.perf_counter() - start):>12,.0f}")
+
+
+async def _demo():
+    await test_async_bounded_queue()
+    await test_concurrent()
+    await benchmark()
+
+
+def main():
+    asyncio.run(_demo())
+
+
+if __name__ == "__main__":
+    main()
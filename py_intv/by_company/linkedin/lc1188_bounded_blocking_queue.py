@@ -0,0 +1,338 @@
+import threading
+from queue import Empty, Full
+from time import monotonic
+
+
+class BoundedBlockingQueue:
+    """
+    有界阻塞队列：预分配的环形缓冲区 + 一把锁 + not_full / not_empty 两个条件变量
+
+    与 lc1188_bounded_blocking_queue.md 中每个元素都 notify 一次的版本相比：
+    1. 环形缓冲区：self._buf 是长度为capacity的list，_head指向队头，_count为元素个数，
+       入队/出队只改下标，不会像 deque 那样分配/释放内存块
+    2. 批量操作：enqueue_many / dequeue_many 一次加锁搬运一整批（最多两次切片赋值）
+    3. 只在状态转换时唤醒：
+       - 队列从空变为非空时才唤醒消费者，从满变为不满时才唤醒生产者
+       - 没有线程在等待时完全不调用 notify
+       - 离开时如果还有剩余元素（或空位）、且还有同类线程在等，就接力唤醒一个，
+         保证不会出现"队列里有元素，但消费者都在睡"的情况
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._buf = [None] * capacity
+        self._head = 0
+        self._count = 0
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+        self.not_empty = threading.Condition(self.lock)
+        self._producers_waiting = 0
+        self._consumers_waiting = 0
+
+    # ---------- 需要在持有锁时调用的内部方法 ----------
+
+    def _wait(self, cond, ready, deadline, producer):
+        """
+        等到 ready() 为真；超时返回False
+
+        deadline为None表示一直等待。等待的线程数记在计数器里，用来决定是否需要notify。
+        """
+        while not ready():
+            if deadline is None:
+                remaining = None
+            else:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return False
+            if producer:
+                self._producers_waiting += 1
+            else:
+                self._consumers_waiting += 1
+            try:
+                cond.wait(remaining)
+            finally:
+                if producer:
+                    self._producers_waiting -= 1
+                else:
+                    self._consumers_waiting -= 1
+        return True
+
+    def _put(self, elements, start, n):
+        """把 elements[start:start+n] 写入队尾，最多分成两段切片赋值"""
+        buf, capacity = self._buf, self.capacity
+        tail = (self._head + self._count) % capacity
+        first = min(n, capacity - tail)
+        buf[tail:tail + first] = elements[start:start + first]
+        if first < n:
+            buf[:n - first] = elements[start + first:start + n]
+        was_empty = self._count == 0
+        self._count += n
+        if self._consumers_waiting and was_empty:
+            # 空 -> 非空：每个新元素最多唤醒一个消费者
+            self.not_empty.notify(n)
+
+    def _take(self, n):
+        """从队头取出n个元素，被取走的槽位置为None以释放引用"""
+        buf, capacity, head = self._buf, self.capacity, self._head
+        first = min(n, capacity - head)
+        out = buf[head:head + first]
+        buf[head:head + first] = [None] * first
+        if first < n:
+            out += buf[:n - first]
+            buf[:n - first] = [None] * (n - first)
+        was_full = self._count == capacity
+        self._head = (head + n) % capacity
+        self._count -= n
+        if self._producers_waiting and was_full:
+            # 满 -> 不满：每个空出的位置最多唤醒一个生产者
+            self.not_full.notify(n)
+        return out
+
+    def _pass_on(self, producer):
+        """离开前接力唤醒同类线程：生产者看是否还有空位，消费者看是否还有剩余元素"""
+        if producer:
+            if self._producers_waiting and self._count < self.capacity:
+                self.not_full.notify()
+        elif self._consumers_waiting and self._count:
+            self.not_empty.notify()
+
+    # ---------- 公共接口 ----------
+
+    def enqueue(self, element, timeout=None) -> None:
+        """
+        入队，队列满时阻塞
+
+        Raises:
+            queue.Full - 等待超过timeout秒仍然没有空位
+        """
+        with self.lock:
+            count = self._count
+            if count == self.capacity:
+                deadline = None if timeout is None else monotonic() + timeout
+                if not self._wait(self.not_full, lambda: self._count < self.capacity,
+                                  deadline, True):
+                    raise Full
+                count = self._count
+            # 单个元素的快速路径：不切片，没有线程等待时不调用notify
+            self._buf[(self._head + count) % self.capacity] = element
+            self._count = count + 1
+            if count == 0 and self._consumers_waiting:
+                self.not_empty.notify()
+            self._pass_on(True)
+
+    def dequeue(self, timeout=None):
+        """
+        出队，队列空时阻塞
+
+        Raises:
+            queue.Empty - 等待超过timeout秒仍然没有元素
+        """
+        with self.lock:
+            if not self._count:
+                deadline = None if timeout is None else monotonic() + timeout
+                if not self._wait(self.not_empty, lambda: self._count > 0, deadline, False):
+                    raise Empty
+            buf, head = self._buf, self._head
+            element = buf[head]
+            buf[head] = None
+            self._head = (head + 1) % self.capacity
+            self._count -= 1
+            if self._count == self.capacity - 1 and self._producers_waiting:
+                self.not_full.notify()
+            self._pass_on(False)
+            return element
+
+    def enqueue_many(self, elements, timeout=None) -> int:
+        """
+        批量入队：每次加锁写入当前能放下的全部元素，放不下的部分等待空位后继续
+
+        Returns:
+            int - 实际入队的元素个数；timeout为None时总是全部入队，
+                  超时则在已入队的位置停下（不抛异常）
+        """
+        elements = list(elements)
+        deadline = None if timeout is None else monotonic() + timeout
+        done = 0
+        while done < len(elements):
+            with self.lock:
+                if not self._wait(self.not_full, lambda: self._count < self.capacity,
+                                  deadline, True):
+                    break
+                n = min(len(elements) - done, self.capacity - self._count)
+                self._put(elements, done, n)
+                done += n
+                self._pass_on(True)
+        return done
+
+    def dequeue_many(self, max_n, timeout=None) -> list:
+        """
+        批量出队：等到至少有一个元素，然后一次取走最多max_n个
+
+        Returns:
+            list - 取出的元素（1到max_n个）；超时返回空列表
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        with self.lock:
+            if not self._wait(self.not_empty, lambda: self._count > 0, deadline, False):
+                return []
+            out = self._take(min(max_n, self._count))
+            self._pass_on(False)
+            return out
+
+    def size(self) -> int:
+        with self.lock:
+            return self._count
+
+
+# 测试用例
+def test_bounded_blocking_queue():
+    q = BoundedBlockingQueue(2)
+    q.enqueue(1)
+    assert q.dequeue() == 1
+    q.enqueue(2)
+    q.enqueue(3)
+    assert q.size() == 2
+    try:
+        q.enqueue(4, timeout=0.01)
+        assert False, "队列满时应该超时"
+    except Full:
+        pass
+    assert q.dequeue() == 2 and q.dequeue() == 3
+    try:
+        q.dequeue(timeout=0.01)
+        assert False, "队列空时应该超时"
+    except Empty:
+        pass
+
+    # 环形缓冲区绕回
+    q = BoundedBlockingQueue(5)
+    assert q.enqueue_many(range(4)) == 4
+    assert q.dequeue_many(3) == [0, 1, 2]
+    assert q.enqueue_many(range(4, 8)) == 4
+    assert q.dequeue_many(10) == [3, 4, 5, 6, 7]
+    assert q.enqueue_many(range(8), timeout=0.01) == 5
+    assert q.dequeue_many(10, timeout=0.01) == [0, 1, 2, 3, 4]
+    assert q.dequeue_many(10, timeout=0.01) == []
+    print("基本测试通过!")
+
+
+def test_concurrent(producers=4, consumers=3, per_producer=5000):
+    q = BoundedBlockingQueue(7)
+    results = [[] for _ in range(consumers)]
+    total = producers * per_producer
+    taken = [0]
+    taken_lock = threading.Lock()
+
+    def produce(pid):
+        items = [(pid, i) for i in range(per_producer)]
+        for i in range(0, per_producer, 10):
+            if pid % 2:
+                q.enqueue_many(items[i:i + 10])
+            else:
+                for item in items[i:i + 10]:
+                    q.enqueue(item)
+
+    def consume(cid):
+        while True:
+            with taken_lock:
+                if taken[0] >= total:
+                    return
+                want = min(3, total - taken[0])
+                taken[0] += want
+            while want:
+                batch = q.dequeue_many(want) if cid % 2 else [q.dequeue()]
+                results[cid].extend(batch)
+                want -= len(batch)
+
+    threads = ([threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+               + [threading.Thread(target=consume, args=(c,)) for c in range(consumers)])
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=60)
+    assert not any(t.is_alive() for t in threads), "出现死锁"
+
+    merged = sorted(item for r in results for item in r)
+    assert merged == sorted((p, i) for p in range(producers) for i in range(per_producer))
+    # 同一个生产者的元素必须按顺序被取出（FIFO）
+    for r in results:
+        last = {}
+        for pid, i in r:
+            assert i > last.get(pid, -1)
+            last[pid] = i
+    assert q.size() == 0
+    print("并发测试通过!")
+
+
+def benchmark(items=100_000, capacity=1024, batch=64):
+    """不同生产者/消费者数量下，搬运items个元素的吞吐量"""
+    import queue
+    import time
+
+    def run(make_queue, put, get, producers, consumers):
+        q = make_queue()
+        per_producer = items // producers
+        total = per_producer * producers
+        quotas = [total // consumers + (c < total % consumers) for c in range(consumers)]
+
+        def produce():
+            put(q, per_producer)
+
+        def consume(quota):
+            get(q, quota)
+
+        threads = ([threading.Thread(target=produce) for _ in range(producers)]
+                   + [threading.Thread(target=consume, args=(quota,)) for quota in quotas])
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return total / (time.perf_counter() - start)
+
+    def put_each(q, n):
+        for i in range(n):
+            q.put(i)
+
+    def get_each(q, n):
+        for _ in range(n):
+            q.get()
+
+    def enqueue_each(q, n):
+        for i in range(n):
+            q.enqueue(i)
+
+    def dequeue_each(q, n):
+        for _ in range(n):
+            q.dequeue()
+
+    def enqueue_batches(q, n):
+        for i in range(0, n, batch):
+            q.enqueue_many(range(i, min(i + batch, n)))
+
+    def dequeue_batches(q, n):
+        while n:
+            n -= len(q.dequeue_many(min(batch, n)))
+
+    variants = [
+        ("queue.Queue", lambda: queue.Queue(capacity), put_each, get_each),
+        ("ring 逐个", lambda: BoundedBlockingQueue(capacity), enqueue_each, dequeue_each),
+        (f"ring 批量({batch})", lambda: BoundedBlockingQueue(capacity), enqueue_batches, dequeue_batches),
+    ]
+    print(f"\n吞吐量（元素/秒，{items:,} 个元素，容量 {capacity}）:")
+    print(f"{'生产者x消费者':<14s}" + "".join(f"{name:>18s}" for name, *_ in variants))
+    for producers, consumers in [(1, 1), (4, 1), (1, 4), (4, 4), (16, 16)]:
+        row = [run(make, put, get, producers, consumers) for _, make, put, get in variants]
+        print(f"{f'{producers}x{consumers}':<18s}" + "".join(f"{r:>18,.0f}" for r in row))
+
+
+def main():
+    test_bounded_blocking_queue()
+    test_concurrent()
+    benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+import multiprocessing as mp
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from queue import Empty, Full
+
+
+# 共享内存布局：两个计数器各占一个cache line，避免生产者和消费者互相使缓存行失效
+#   [0, 8)        head - 已经取出的记录总数（只由消费者写）
+#   [64, 72)      tail - 已经写入的记录总数（只由生产者写）
+#   [128, ...)    capacity 个定长槽位
+_HEAD = 0
+_TAIL = 8                 # 以8字节为单位的下标，对应字节偏移64
+_HEADER_SIZE = 128
+
+# 无锁模式下等待时的退避策略：先空转几次，再让出CPU，最后逐步加长睡眠
+_SPIN = 64
+_MAX_SLEEP = 1e-3
+
+# 无锁 spsc 依赖"先写数据、后写计数器"的顺序对另一个核可见，Python 不提供内存屏障，
+# 只有 x86 的 TSO 内存模型保证这一点；ARM（aarch64、Apple Silicon）等弱内存序平台上
+# 消费者可能先看到新的计数器、后看到槽位里的数据
+_TSO_MACHINES = frozenset({"x86_64", "amd64", "i386", "i486", "i586", "i686", "x86"})
+
+
+def spsc_supported(machine=None) -> bool:
+    """当前（或指定的）CPU架构上无锁 spsc 模式是否安全"""
+    if machine is None:
+        import platform
+        machine = platform.machine()
+    return machine.lower() in _TSO_MACHINES
+
+
+class SharedRingQueue:
+    """
+    基于 multiprocessing.shared_memory 的有界环形队列，用于进程之间传递定长记录
+
+    与 lc1188_bounded_blocking_queue.md 的思路相同（有界缓冲 + 满时生产者等、空时消费者等），
+    但数据放在共享内存里：put 把字节直接写进槽位，不经过pickle和管道。
+    head/tail 是单调递增的64位计数器，槽位下标 = 计数器 % capacity，
+    元素个数 = tail - head，所以不需要额外的 count 字段。
+
+    两种模式：
+    - "spsc"：单生产者单消费者，无锁。生产者只写tail，消费者只写head，
+      先写数据再发布计数器（x86等强内存序平台上对齐的8字节写入是原子、有序的）；
+      队列满/空时自旋 + 退避睡眠。只在 x86 上启用（见 spsc_supported），
+      其它架构上请求 "spsc" 会退回 "mpmc"：一个生产者一个消费者时语义相同，
+      信号量和锁提供了需要的内存屏障，只是慢一些。self.mode 是实际使用的模式
+    - "mpmc"：多生产者多消费者，slots / items 两个信号量负责阻塞等待，
+      put_lock / get_lock 分别串行化生产者之间、消费者之间对 tail / head 的修改
+
+    零拷贝读写用 reserve()/commit() 和 peek()/advance()（或等价的 put_slot()/get_slot() 上下文管理器），
+    它们直接给出指向共享内存槽位的 memoryview。
+
+    对象可以作为 Process 的参数传给子进程，子进程按名字重新attach同一块共享内存。
+    创建者负责最后调用 unlink()。
+    """
+
+    def __init__(self, capacity: int, record_size: int, mode="spsc"):
+        if capacity < 1 or record_size < 1:
+            raise ValueError("capacity and record_size must be positive")
+        if mode not in ("spsc", "mpmc"):
+            raise ValueError(f"unknown mode: {mode}")
+        if mode == "spsc" and not spsc_supported():
+            mode = "mpmc"
+        self.capacity = capacity
+        self.record_size = record_size
+        self.mode = mode
+        self._shm = shared_memory.SharedMemory(create=True, size=_HEADER_SIZE + capacity * record_size)
+        self._shm.buf[:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+        if mode == "mpmc":
+            self._slots = mp.Semaphore(capacity)
+            self._items = mp.Semaphore(0)
+            self._put_lock = mp.Lock()
+            self._get_lock = mp.Lock()
+        self._attach()
+
+    def _attach(self):
+        buf, size = self._shm.buf, self.record_size
+        self._counters = buf[:_HEADER_SIZE].cast("Q")
+        # 预先切好每个槽位的 memoryview，读写时不再创建切片对象
+        self._views = [buf[_HEADER_SIZE + i * size:_HEADER_SIZE + (i + 1) * size]
+                       for i in range(self.capacity)]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_counters"], state["_views"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._attach()
+
+    # ---------- 等待 ----------
+
+    @staticmethod
+    def _backoff(ready, timeout):
+        """无锁模式的等待：直到 ready() 为真，超时返回False"""
+        for _ in range(_SPIN):
+            if ready():
+                return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.0
+        while not ready():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(_MAX_SLEEP, delay * 2 or 1e-6)
+        return True
+
+    # ---------- 零拷贝接口 ----------
+
+    def reserve(self, timeout=None):
+        """
+        等待一个空槽位，返回指向它的 memoryview；写完后调用 commit() 发布
+
+        mpmc 模式下 reserve 和 commit 之间持有生产者锁，应尽快 commit。
+
+        Raises:
+            queue.Full - 等待超过timeout秒仍然没有空位
+        """
+        counters, capacity = self._counters, self.capacity
+        if self.mode == "spsc":
+            tail = counters[_TAIL]
+            if tail - counters[_HEAD] >= capacity and not self._backoff(
+                    lambda: tail - counters[_HEAD] < capacity, timeout):
+                raise Full
+        else:
+            if not self._slots.acquire(timeout=timeout):
+                raise Full
+            self._put_lock.acquire()
+            tail = counters[_TAIL]
+        return self._views[tail % capacity]
+
+    def commit(self) -> None:
+        """发布 reserve() 得到的槽位：先写数据、后移动tail，消费者看到tail时数据一定已经写好"""
+        self._counters[_TAIL] += 1
+        if self.mode == "mpmc":
+            self._put_lock.release()
+            self._items.release()
+
+    def peek(self, timeout=None):
+        """
+        等待一条记录，返回指向共享内存槽位的 memoryview；读完后调用 advance() 释放槽位
+
+        Raises:
+            queue.Empty - 等待超过timeout秒仍然没有记录
+        """
+        counters = self._counters
+        if self.mode == "spsc":
+            head = counters[_HEAD]
+            if counters[_TAIL] == head and not self._backoff(
+                    lambda: counters[_TAIL] != head, timeout):
+                raise Empty
+        else:
+            if not self._items.acquire(timeout=timeout):
+                raise Empty
+            self._get_lock.acquire()
+            head = counters[_HEAD]
+        return self._views[head % self.capacity]
+
+    def advance(self) -> None:
+        """释放 peek() 读过的槽位"""
+        self._counters[_HEAD] += 1
+        if self.mode == "mpmc":
+            self._get_lock.release()
+            self._slots.release()
+
+    @contextmanager
+    def put_slot(self, timeout=None):
+        """
+        reserve/commit 的上下文管理器写法，with 块内抛出异常时不发布该槽位
+
+            with q.put_slot() as slot:
+                struct.pack_into("<qd", slot, 0, key, value)
+        """
+        slot = self.reserve(timeout)
+        try:
+            yield slot
+        except BaseException:
+            if self.mode == "mpmc":
+                self._put_lock.release()
+                self._slots.release()
+            raise
+        self.commit()
+
+    @contextmanager
+    def get_slot(self, timeout=None):
+        """peek/advance 的上下文管理器写法，memoryview 只在 with 块内有效"""
+        slot = self.peek(timeout)
+        try:
+            yield slot
+        except BaseException:
+            if self.mode == "mpmc":
+                self._get_lock.release()
+                self._items.release()
+            raise
+        self.advance()
+
+    # ---------- 拷贝接口 ----------
+
+    def put(self, record, timeout=None) -> None:
+        """写入一条记录（长度必须等于record_size的bytes-like对象）"""
+        if len(record) != self.record_size:
+            raise ValueError(f"record must be exactly {self.record_size} bytes")
+        self.reserve(timeout)[:] = record
+        self.commit()
+
+    def get(self, timeout=None) -> bytes:
+        """取出一条记录的拷贝"""
+        record = self.peek(timeout).tobytes()
+        self.advance()
+        return record
+
+    def size(self) -> int:
+        """当前记录数（其他进程同时在读写时只是一个近似值）"""
+        return self._counters[_TAIL] - self._counters[_HEAD]
+
+    def close(self) -> None:
+        """释放本进程对共享内存的映射"""
+        self._counters.release()
+        for view in self._views:
+            view.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """销毁共享内存，由创建者在所有进程都不再使用后调用"""
+        self._shm.unlink()
+
+
+# 测试用例
+def _produce(q, start, n, zero_copy):
+    for i in range(start, start + n):
+        if zero_copy:
+            with q.put_slot() as slot:
+                slot[:8] = i.to_bytes(8, "little")
+        else:
+            q.put(i.to_bytes(8, "little") + bytes(q.record_size - 8))
+    q.close()
+
+
+def _consume(q, n, out):
+    total = 0
+    for _ in range(n):
+        total += int.from_bytes(q.get()[:8], "little")
+    out.put(total)
+    q.close()
+
+
+def test_single_process():
+    for mode in ("spsc", "mpmc"):
+        q = SharedRingQueue(3, 8, mode)
+        for i in range(3):
+            q.put(i.to_bytes(8, "little"))
+        assert q.size() == 3
+        try:
+            q.put(bytes(8), timeout=0.01)
+            assert False, "队列满时应该超时"
+        except Full:
+            pass
+        assert [int.from_bytes(q.get(), "little") for _ in range(3)] == [0, 1, 2]
+        try:
+            q.get(timeout=0.01)
+            assert False, "队列空时应该超时"
+        except Empty:
+            pass
+        # 绕回 + 零拷贝读写
+        for i in range(5):
+            with q.put_slot() as slot:
+                slot[:] = (100 + i).to_bytes(8, "little")
+            with q.get_slot() as slot:
+                assert int.from_bytes(slot, "little") == 100 + i
+        q.close()
+        q.unlink()
+
+    # 弱内存序架构上不启用无锁模式
+    assert spsc_supported("x86_64") and spsc_supported("AMD64")
+    assert not spsc_supported("aarch64") and not spsc_supported("arm64")
+    q = SharedRingQueue(2, 8, "spsc")
+    assert q.mode == ("spsc" if spsc_supported() else "mpmc")
+    q.close()
+    q.unlink()
+    print("单进程测试通过!")
+
+
+def test_multi_process(n=20_000):
+    out = mp.Queue()
+    q = SharedRingQueue(64, 16, "spsc")
+    procs = [mp.Process(target=_produce, args=(q, 0, n, True)),
+             mp.Process(target=_consume, args=(q, n, out))]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    assert out.get() == n * (n - 1) // 2
+    q.close()
+    q.unlink()
+
+    q = SharedRingQueue(64, 16, "mpmc")
+    producers, consumers = 3, 2
+    per_producer = n // producers
+    total = per_producer * producers
+    procs = [mp.Process(target=_produce, args=(q, p * per_producer, per_producer, p % 2))
+             for p in range(producers)]
+    procs += [mp.Process(target=_consume, args=(q, total // consumers + (c < total % consumers), out))
+              for c in range(consumers)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    assert sum(out.get() for _ in range(consumers)) == total * (total - 1) // 2
+    q.close()
+    q.unlink()
+    print("多进程测试通过!")
+
+
+def _mpq_produce(q, n, record):
+    for _ in range(n):
+        q.put(record)
+
+
+def _mpq_consume(q, n):
+    for _ in range(n):
+        q.get()
+
+
+def _ring_produce(q, n, record, zero_copy):
+    if zero_copy:
+        for _ in range(n):
+            q.reserve()[:] = record
+            q.commit()
+    else:
+        for _ in range(n):
+            q.put(record)
+    q.close()
+
+
+def _ring_consume(q, n, zero_copy):
+    if zero_copy:
+        for _ in range(n):
+            q.peek()[0]
+            q.advance()
+    else:
+        for _ in range(n):
+            q.get()
+    q.close()
+
+
+def benchmark(n=100_000, capacity=1024):
+    def run(producer, consumer, producers=1, consumers=1):
+        per_producer = n // producers
+        total = per_producer * producers
+        # producer / consumer 是 (函数, 队列, 其余参数...)，函数签名为 f(队列, 消息数, 其余参数...)
+        procs = [mp.Process(target=producer[0], args=(producer[1], per_producer, *producer[2:]))
+                 for _ in range(producers)]
+        procs += [mp.Process(target=consumer[0],
+                             args=(consumer[1], total // consumers + (c < total % consumers),
+                                   *consumer[2:]))
+                  for c in range(consumers)]
+        start = time.perf_counter()
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        return total / (time.perf_counter() - start)
+
+    print(f"\n进程间吞吐量（消息/秒，{n:,} 条消息，含进程启动时间）:")
+    print(f"{'record':>8s}  {'mp.Queue':>12s} {'spsc put/get':>14s} {'spsc 零拷贝':>13s} "
+          f"{'mp.Queue 2x2':>14s} {'mpmc 2x2':>12s}")
+    for record_size in (16, 256, 4096):
+        record = bytes(record_size)
+        row = []
+
+        mpq = mp.Queue(capacity)
+        row.append(run((_mpq_produce, mpq, record), (_mpq_consume, mpq)))
+        for zero_copy in (False, True):
+            q = SharedRingQueue(capacity, record_size, "spsc")
+            row.append(run((_ring_produce, q, record, zero_copy), (_ring_consume, q, zero_copy)))
+            q.close()
+            q.unlink()
+        mpq = mp.Queue(capacity)
+        row.append(run((_mpq_produce, mpq, record), (_mpq_consume, mpq), 2, 2))
+        q = SharedRingQueue(capacity, record_size, "mpmc")
+        row.append(run((_ring_produce, q, record, False), (_ring_consume, q, False), 2, 2))
+        q.close()
+        q.unlink()
+        print(f"{record_size:>8d}  " + " ".join(f"{r:>13,.0f}" for r in row))
+
+
+def main():
+    test_single_process()
+    test_multi_process()
+    benchmark()
+
+
+if __name__ == "__main__":
+    main()
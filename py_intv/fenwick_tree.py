@@ -0,0 +1,498 @@
+from array import array
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """
+    NumPy是可选依赖：只在批量操作时导入，没有安装时退回纯Python实现
+
+    结果缓存下来：没有安装时每次 import 失败都要重新搜索一遍 sys.path，比小规模的建树本身还慢。
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def _fenwick_transform(values, tree, offset=0, stride=1, n=None):
+    """
+    O(n) 建树：tree[offset + i*stride]（i = 1..n）中先放好原始值，原地变换成树状数组
+
+    每个节点只需把自己加到父节点 i + lowbit(i) 上一次，所以是线性的。
+    values 为 None 时表示数据已经在 tree 中。
+    """
+    if n is None:
+        n = len(values)
+    if values is not None:
+        for i, v in enumerate(values, 1):
+            tree[offset + i * stride] = v
+    for i in range(1, n + 1):
+        j = i + (i & -i)
+        if j <= n:
+            tree[offset + j * stride] += tree[offset + i * stride]
+
+
+class FenwickTree:
+    """
+    树状数组（Fenwick tree / BIT）：单点更新、前缀和查询都是 O(log n)
+
+    对外使用 0 起始下标和左闭右开区间；内部 tree[1..n] 按 lowbit 组织，tree[0] 恒为 0：
+        tree[i] = a[i - lowbit(i) + 1] + ... + a[i]（内部 1 起始）
+
+    存储是 array（默认 'q'，即 int64；浮点数用 'd'），每个计数器只占8字节。
+    update_many / query_many 在安装了 NumPy 时用 np.frombuffer 直接在 array 上向量化计算，
+    不复制数据；批量很大时改用 O(n) 的整体重算。
+    """
+
+    __slots__ = ("n", "tree")
+
+    def __init__(self, n: int, typecode="q"):
+        self.n = n
+        self.tree = array(typecode, [0]) * (n + 1)
+
+    @classmethod
+    def from_values(cls, values, typecode="q"):
+        """O(n) 批量建树（逐个 add 是 O(n log n)）"""
+        values = values if hasattr(values, "__len__") else list(values)
+        self = cls(len(values), typecode)
+        np = _numpy()
+        if np is not None and self.n:
+            tree = np.frombuffer(self.tree, dtype=typecode)
+            prefix = np.zeros(self.n + 1, dtype=tree.dtype)
+            np.cumsum(np.asarray(values, dtype=tree.dtype), out=prefix[1:])
+            idx = np.arange(1, self.n + 1)
+            tree[1:] = prefix[idx] - prefix[idx - (idx & -idx)]
+        else:
+            _fenwick_transform(values, self.tree)
+        return self
+
+    def __len__(self):
+        return self.n
+
+    def add(self, i: int, delta) -> None:
+        """a[i] += delta"""
+        tree, n = self.tree, self.n
+        i += 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, i: int):
+        """a[0] + ... + a[i-1]"""
+        tree = self.tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i &= i - 1          # 等价于 i -= lowbit(i)
+        return total
+
+    def range_sum(self, lo: int, hi: int):
+        """a[lo] + ... + a[hi-1]"""
+        return self.prefix_sum(hi) - self.prefix_sum(lo)
+
+    def append(self, value) -> None:
+        """
+        在末尾追加一个元素，O(log n)
+
+        新节点 i 管辖 a[i-lowbit(i)+1 .. i]（内部 1 起始），除了新值之外都是已有元素，
+        用两个前缀和相减得到。
+        """
+        i = self.n + 1
+        self.tree.append(value + self.prefix_sum(i - 1) - self.prefix_sum(i - (i & -i)))
+        self.n = i
+
+    def extend_zeros(self, k: int) -> None:
+        """
+        在末尾追加k个0，O(k + log² n)，k次 append 则是 O(k log n)
+
+        新节点 i 管辖 a[i-lowbit(i)+1 .. i]，新元素都是0，所以只有管辖范围跨过原末尾 m 的节点非0，
+        它们恰好是 m 沿 i += lowbit(i) 往上走经过的节点，值为 a[i-lowbit(i)+1 .. m] 之和。
+        """
+        if k <= 0:
+            return
+        tree, m = self.tree, self.n
+        tree.extend(array(tree.typecode, [0]) * k)
+        self.n = m + k
+        if not m:
+            return
+        total = self.prefix_sum(m)
+        i = m + (m & -m)
+        while i <= self.n:
+            tree[i] = total - self.prefix_sum(i & (i - 1))
+            i += i & -i
+
+    def __getitem__(self, i: int):
+        return self.range_sum(i, i + 1)
+
+    def set(self, i: int, value) -> None:
+        self.add(i, value - self[i])
+
+    def total(self):
+        return self.prefix_sum(self.n)
+
+    def lower_bound(self, target):
+        """
+        最小的 i，使得 a[0] + ... + a[i] >= target；不存在时返回 n
+
+        要求所有值非负（前缀和单调）。用倍增代替二分，沿树从高位到低位走一遍，O(log n)。
+        """
+        tree, n = self.tree, self.n
+        pos = 0
+        step = 1 << n.bit_length() - 1 if n else 0
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] < target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return pos
+
+    def _dense(self, k):
+        """
+        批量大小为k时是否值得做 O(n) 的整体重算
+
+        逐个操作总代价约 k log n；整体重算要扫描数组几遍，常数大约是逐个操作一步的4倍。
+        """
+        return k * max(1, self.n.bit_length()) > 4 * self.n
+
+    def update_many(self, indices, deltas) -> None:
+        """
+        批量 a[indices[j]] += deltas[j]，下标可以重复
+
+        - NumPy：k个下标一起沿 i += lowbit(i) 向上走，log n 轮向量化的 np.add.at
+        - 批量很大时：先累加成差分数组，再把差分数组 O(n) 变换成树状数组后整体相加
+        """
+        np = _numpy()
+        dense = self._dense(len(indices))
+        if np is not None:
+            tree = np.frombuffer(self.tree, dtype=self.tree.typecode)
+            idx = np.asarray(indices, dtype=np.int64) + 1
+            delta = np.asarray(deltas, dtype=tree.dtype)
+            if dense:
+                diff = np.zeros(self.n + 1, dtype=tree.dtype)
+                np.add.at(diff, idx, delta)
+                prefix = np.cumsum(diff)
+                pos = np.arange(1, self.n + 1)
+                tree[1:] += prefix[pos] - prefix[pos - (pos & -pos)]
+            else:
+                while len(idx):
+                    np.add.at(tree, idx, delta)
+                    idx = idx + (idx & -idx)
+                    keep = idx <= self.n
+                    idx, delta = idx[keep], delta[keep]
+        elif dense:
+            diff = array(self.tree.typecode, [0]) * (self.n + 1)
+            for i, d in zip(indices, deltas):
+                diff[i + 1] += d
+            _fenwick_transform(None, diff, n=self.n)
+            tree = self.tree
+            for i in range(1, self.n + 1):
+                tree[i] += diff[i]
+        else:
+            for i, d in zip(indices, deltas):
+                self.add(i, d)
+
+    def prefix_sums(self):
+        """所有前缀和 P[0..n]（P[i] = a[0] + ... + a[i-1]），O(n)"""
+        tree, n = self.tree, self.n
+        prefix = array(tree.typecode, [0]) * (n + 1)
+        for i in range(1, n + 1):
+            # i - lowbit(i) < i，所以它的前缀和已经算好了
+            prefix[i] = prefix[i & (i - 1)] + tree[i]
+        return prefix
+
+    def query_many(self, indices):
+        """
+        批量前缀和：返回 [prefix_sum(i) for i in indices]
+
+        NumPy 时所有下标一起沿 i -= lowbit(i) 向下走（tree[0] 恒为0，走到0的下标不影响结果）；
+        纯Python下批量很大时先用 prefix_sums() 算出全部前缀和再查表。
+        """
+        np = _numpy()
+        if np is not None:
+            tree = np.frombuffer(self.tree, dtype=self.tree.typecode)
+            idx = np.array(indices, dtype=np.int64)
+            result = np.zeros(len(idx), dtype=tree.dtype)
+            while idx.any():
+                result += tree[idx]
+                idx &= idx - 1
+            return result.tolist()
+        if self._dense(len(indices)):
+            prefix = self.prefix_sums()
+            return [prefix[i] for i in indices]
+        return [self.prefix_sum(i) for i in indices]
+
+    def __repr__(self):
+        return f"FenwickTree(n={self.n}, typecode={self.tree.typecode!r})"
+
+
+class RangeFenwickTree:
+    """
+    区间更新 + 区间查询：两个树状数组维护差分数组 d（a[x] = d[0] + ... + d[x]）
+
+        a[0] + ... + a[i-1] = i * (d[0] + ... + d[i-1]) - (0*d[0] + 1*d[1] + ... + (i-1)*d[i-1])
+
+    b1 存 d[x]，b2 存 x * d[x]，区间加和区间求和都是 O(log n)。
+    """
+
+    __slots__ = ("n", "b1", "b2")
+
+    def __init__(self, n: int, typecode="q"):
+        self.n = n
+        self.b1 = FenwickTree(n, typecode)
+        self.b2 = FenwickTree(n, typecode)
+
+    @classmethod
+    def from_values(cls, values, typecode="q"):
+        values = list(values)
+        self = cls.__new__(cls)
+        self.n = len(values)
+        diff = [v - (values[x - 1] if x else 0) for x, v in enumerate(values)]
+        self.b1 = FenwickTree.from_values(diff, typecode)
+        self.b2 = FenwickTree.from_values([x * d for x, d in enumerate(diff)], typecode)
+        return self
+
+    def __len__(self):
+        return self.n
+
+    def range_add(self, lo: int, hi: int, delta) -> None:
+        """a[lo..hi-1] 都加上 delta"""
+        self.b1.add(lo, delta)
+        self.b2.add(lo, delta * lo)
+        if hi < self.n:
+            self.b1.add(hi, -delta)
+            self.b2.add(hi, -delta * hi)
+
+    def add(self, i: int, delta) -> None:
+        self.range_add(i, i + 1, delta)
+
+    def prefix_sum(self, i: int):
+        return i * self.b1.prefix_sum(i) - self.b2.prefix_sum(i)
+
+    def range_sum(self, lo: int, hi: int):
+        return self.prefix_sum(hi) - self.prefix_sum(lo)
+
+    def __getitem__(self, i: int):
+        return self.b1.prefix_sum(i + 1)
+
+    def range_add_many(self, ranges, deltas) -> None:
+        """批量区间加：ranges 是 (lo, hi) 序列，转成两个树状数组上的 update_many"""
+        idx, d1, d2 = [], [], []
+        for (lo, hi), delta in zip(ranges, deltas):
+            idx.append(lo)
+            d1.append(delta)
+            d2.append(delta * lo)
+            if hi < self.n:
+                idx.append(hi)
+                d1.append(-delta)
+                d2.append(-delta * hi)
+        self.b1.update_many(idx, d1)
+        self.b2.update_many(idx, d2)
+
+    def query_many(self, indices):
+        """批量前缀和"""
+        s1 = self.b1.query_many(indices)
+        s2 = self.b2.query_many(indices)
+        return [i * a - b for i, a, b in zip(indices, s1, s2)]
+
+
+class FenwickTree2D:
+    """
+    二维树状数组：单点更新、矩形求和都是 O(log rows * log cols)
+
+    存储为一维 array，tree[r * (cols+1) + c]，第0行和第0列恒为0。
+    """
+
+    __slots__ = ("rows", "cols", "tree")
+
+    def __init__(self, rows: int, cols: int, typecode="q"):
+        self.rows = rows
+        self.cols = cols
+        self.tree = array(typecode, [0]) * ((rows + 1) * (cols + 1))
+
+    @classmethod
+    def from_values(cls, matrix, typecode="q"):
+        """O(rows * cols) 建树：先对每一行做一维变换，再对每一列做一维变换"""
+        matrix = [list(row) for row in matrix]
+        rows, cols = len(matrix), len(matrix[0]) if matrix else 0
+        self = cls(rows, cols, typecode)
+        width = cols + 1
+        tree = self.tree
+        for r, row in enumerate(matrix, 1):
+            _fenwick_transform(row, tree, offset=r * width)
+        for c in range(1, cols + 1):
+            _fenwick_transform(None, tree, offset=c, stride=width, n=rows)
+        return self
+
+    def add(self, r: int, c: int, delta) -> None:
+        tree, width = self.tree, self.cols + 1
+        i = r + 1
+        while i <= self.rows:
+            j = c + 1
+            base = i * width
+            while j <= self.cols:
+                tree[base + j] += delta
+                j += j & -j
+            i += i & -i
+
+    def prefix_sum(self, r: int, c: int):
+        """矩形 [0, r) x [0, c) 的和"""
+        tree, width = self.tree, self.cols + 1
+        total = 0
+        i = r
+        while i > 0:
+            j = c
+            base = i * width
+            while j > 0:
+                total += tree[base + j]
+                j &= j - 1
+            i &= i - 1
+        return total
+
+    def rect_sum(self, r1: int, c1: int, r2: int, c2: int):
+        """矩形 [r1, r2) x [c1, c2) 的和"""
+        return (self.prefix_sum(r2, c2) - self.prefix_sum(r1, c2)
+                - self.prefix_sum(r2, c1) + self.prefix_sum(r1, c1))
+
+
+# 测试用例
+def test_fenwick_tree():
+    import random
+    rng = random.Random(0)
+    for n in (1, 2, 7, 64, 100):
+        values = [rng.randrange(10) for _ in range(n)]
+        bit = FenwickTree.from_values(values)
+        slow = FenwickTree(n)
+        for i, v in enumerate(values):
+            slow.add(i, v)
+        assert bit.tree == slow.tree
+        grown = FenwickTree(0)
+        for v in values:
+            grown.append(v)
+        assert grown.tree == bit.tree
+        # 批量追加0与逐个 append 的结果相同
+        for k in (0, 1, 5, 3 * n):
+            padded = FenwickTree.from_values(values)
+            padded.extend_zeros(k)
+            for _ in range(k):
+                grown.append(0)
+            assert padded.tree == grown.tree and padded.n == grown.n
+            grown = FenwickTree.from_values(values)
+        for _ in range(200):
+            i = rng.randrange(n)
+            d = rng.randrange(10)
+            bit.add(i, d)
+            values[i] += d
+            lo, hi = sorted((rng.randrange(n + 1), rng.randrange(n + 1)))
+            assert bit.range_sum(lo, hi) == sum(values[lo:hi])
+            target = rng.randrange(sum(values) + 2)
+            expected = next((k for k in range(n) if sum(values[:k + 1]) >= target), n)
+            assert bit.lower_bound(target) == expected
+        # 批量操作：小批量逐个处理，大批量整体重算
+        for k in (3, 20 * n):
+            idx = [rng.randrange(n) for _ in range(k)]
+            deltas = [rng.randrange(-5, 6) for _ in range(k)]
+            bit.update_many(idx, deltas)
+            for i, d in zip(idx, deltas):
+                values[i] += d
+            queries = [rng.randrange(n + 1) for _ in range(k)]
+            assert bit.query_many(queries) == [sum(values[:q]) for q in queries]
+        assert list(bit.prefix_sums())[1:] == [sum(values[:i + 1]) for i in range(n)]
+    print("FenwickTree 测试通过!")
+
+
+def test_range_and_2d():
+    import random
+    rng = random.Random(1)
+    n = 50
+    values = [rng.randrange(10) for _ in range(n)]
+    rbit = RangeFenwickTree.from_values(values)
+    for _ in range(300):
+        lo, hi = sorted((rng.randrange(n + 1), rng.randrange(n + 1)))
+        d = rng.randrange(-5, 6)
+        rbit.range_add(lo, hi, d)
+        for x in range(lo, hi):
+            values[x] += d
+        lo, hi = sorted((rng.randrange(n + 1), rng.randrange(n + 1)))
+        assert rbit.range_sum(lo, hi) == sum(values[lo:hi])
+    ranges = [tuple(sorted((rng.randrange(n + 1), rng.randrange(n + 1)))) for _ in range(40)]
+    deltas = [rng.randrange(5) for _ in ranges]
+    rbit.range_add_many(ranges, deltas)
+    for (lo, hi), d in zip(ranges, deltas):
+        for x in range(lo, hi):
+            values[x] += d
+    assert rbit.query_many(range(n + 1)) == [sum(values[:i]) for i in range(n + 1)]
+    assert [rbit[i] for i in range(n)] == values
+
+    rows, cols = 9, 13
+    matrix = [[rng.randrange(10) for _ in range(cols)] for _ in range(rows)]
+    bit2 = FenwickTree2D.from_values(matrix)
+    for _ in range(300):
+        r, c, d = rng.randrange(rows), rng.randrange(cols), rng.randrange(10)
+        bit2.add(r, c, d)
+        matrix[r][c] += d
+        r1, r2 = sorted((rng.randrange(rows + 1), rng.randrange(rows + 1)))
+        c1, c2 = sorted((rng.randrange(cols + 1), rng.randrange(cols + 1)))
+        assert bit2.rect_sum(r1, c1, r2, c2) == sum(sum(row[c1:c2]) for row in matrix[r1:r2])
+    print("RangeFenwickTree / FenwickTree2D 测试通过!")
+
+
+def benchmark(sizes, ops=1000):
+    """交替执行 ops 次单点更新和 ops 次前缀和查询，与"每次更新后重算前缀和"对比"""
+    import random
+    import time
+    from itertools import accumulate
+
+    print(f"\n每次操作的平均耗时（µs），{ops} 次更新 + {ops} 次查询"
+          f"{'' if _numpy() else '（未安装NumPy，批量操作为纯Python实现）'}:")
+    print(f"{'n':>12s} {'建树(ms)':>10s} {'重算前缀和':>12s} {'Fenwick逐个':>12s} {'Fenwick批量':>12s}")
+    for n in sizes:
+        rng = random.Random(n)
+        values = [rng.randrange(100) for _ in range(n)]
+        idx = [rng.randrange(n) for _ in range(ops)]
+        deltas = [rng.randrange(100) for _ in range(ops)]
+        queries = [rng.randrange(n + 1) for _ in range(ops)]
+
+        # 基线：每次更新后用 accumulate 重算整个前缀和数组，查询O(1)；太慢，只跑少量操作
+        naive_ops = max(3, min(ops, 10 ** 8 // (n * 50)))
+        counters = list(values)
+        start = time.perf_counter()
+        for i, d, q in zip(idx[:naive_ops], deltas, queries):
+            counters[i] += d
+            prefix = [0, *accumulate(counters)]
+            prefix[q]
+        naive = (time.perf_counter() - start) / (2 * naive_ops) * 1e6
+
+        start = time.perf_counter()
+        bit = FenwickTree.from_values(values)
+        build = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for i, d, q in zip(idx, deltas, queries):
+            bit.add(i, d)
+            bit.prefix_sum(q)
+        single = (time.perf_counter() - start) / (2 * ops) * 1e6
+
+        start = time.perf_counter()
+        bit.update_many(idx, deltas)
+        bit.query_many(queries)
+        batched = (time.perf_counter() - start) / (2 * ops) * 1e6
+        print(f"{n:>12,d} {build:>10.0f} {naive:>12.1f} {single:>12.2f} {batched:>12.2f}")
+
+
+def main():
+    import sys
+
+    test_fenwick_tree()
+    test_range_and_2d()
+    # 默认到100万个计数器；--full 扩展到1000万
+    sizes = [10_000, 100_000, 1_000_000]
+    if "--full" in sys.argv:
+        sizes.append(10_000_000)
+    benchmark(sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+
+
+def _common_prefix_len(a, b):
+    """两条路径的公共前缀长度：二分 + 切片比较，循环次数 O(log n)"""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+class FibonacciTreePathFinder:
+    # 阶数达到这个值时 find_path 改用按游程的下降 find_path_runs：
+    # 随机节点的路径游程很短，阶数小时逐层递归更快；阶数大时递归的列表拼接是
+    # O(order^2)，而且在1000阶左右会超过递归深度限制
+    RUNS_MIN_ORDER = 128
+
+    def __init__(self, max_order=50):
+        """预计算斐波那契树的节点数量"""
+        self.nodes = [0] * (max_order + 1)
+        self.nodes[0] = 1  # 0阶树有1个节点
+        self.nodes[1] = 1  # 1阶树有1个节点
+        
+        for i in range(2, max_order + 1):
+            self.nodes[i] = 1 + self.nodes[i-1] + self.nodes[i-2]
+        self._offsets = None   # find_path_runs 用的前缀和表，第一次用到时再建
+    
+    def find_path(self, order, source, dest):
+        """
+        使用动态规划找到两个节点间的路径
+        
+        Args:
+            order: 斐波那契树的阶数
+            source: 源节点编号
+            dest: 目标节点编号
+            
+        Returns:
+            路径字符串，"U"表示向上，"L"表示向左，"R"表示向右
+        """
+        if source == dest:
+            return ""
+        
+        # 找到两个节点到根的路径
+        if order >= self.RUNS_MIN_ORDER:
+            source_path = self.expand_runs(self.find_path_runs(order, source))
+            dest_path = self.expand_runs(self.find_path_runs(order, dest))
+        else:
+            source_path = self.find_path_to_root(order, source)
+            dest_path = self.find_path_to_root(order, dest)
+        
+        # 移除公共前缀（到LCA的路径）
+        lca_depth = _common_prefix_len(source_path, dest_path)
+        
+        # 构造最终路径
+        # 从source到LCA：剩余路径长度的"U"
+        # 从LCA到dest：剩余路径
+        up_moves = "U" * (len(source_path) - lca_depth)
+        down_moves = "".join(dest_path[lca_depth:])
+        
+        return up_moves + down_moves
+    
+    def find_path_to_root(self, order, target):
+        """
+        找到从根节点到目标节点的路径
+        利用斐波那契树的递归性质快速定位
+        """
+        if order <= 1:
+            return []  # 0阶或1阶树只有根节点
+        
+        if target == 0:
+            return []  # 已经是根节点
+        
+        # 左子树的大小（(order-2)阶斐波那契树的节点数）
+        left_subtree_size = self.nodes[order-2] if order >= 2 else 0
+        
+        if target <= left_subtree_size:
+            # 目标在左子树中
+            # 递归到左子树，调整目标编号
+            sub_path = self.find_path_to_root(order-2, target-1)
+            return ["L"] + sub_path
+        else:
+            # 目标在右子树中
+            # 递归到右子树，调整目标编号
+            adjusted_target = target - left_subtree_size - 1
+            sub_path = self.find_path_to_root(order-1, adjusted_target)
+            return ["R"] + sub_path
+    
+    # 周期不超过2的走法 -> (走一个周期阶数下降多少, 周期开始时至少要多少阶)
+    # 走一个周期编号的偏移：R 跳过左子树和根 nodes[i-2]+1，L 只跳过根 1
+    _PATTERNS = {"R": (1, 2), "L": (2, 2), "RL": (3, 3), "LR": (3, 4)}
+
+    def _period_offset(self, pattern, i):
+        """从i阶子树的根开始走一个周期，目标编号减少多少"""
+        if pattern == "R":
+            return self.nodes[i-2] + 1
+        if pattern == "L":
+            return 1
+        if pattern == "RL":
+            return self.nodes[i-2] + 2
+        return self.nodes[i-4] + 2    # LR
+
+    def _run_tables(self):
+        """
+        每种走法按阶数的前缀和：offsets[k] - offsets[k - stride*m] 就是
+        从k阶开始连续走m个周期的总偏移，O(1) 得到，可以二分m
+        """
+        if self._offsets is None:
+            self._offsets = {}
+            for pattern, (stride, min_order) in self._PATTERNS.items():
+                offsets = [0] * len(self.nodes)
+                for i in range(min_order, len(self.nodes)):
+                    offsets[i] = self._period_offset(pattern, i) + offsets[i - stride]
+                self._offsets[pattern] = offsets
+        return self._offsets
+
+    def find_path_runs(self, order, target):
+        """
+        与 find_path_to_root 相同的路径，按游程输出，循环次数与游程数有关而不是路径长度
+
+        每一段先按原规则走两步确定周期（"R"、"L"、"RL" 或 "LR"），再二分这个周期
+        最多能连续走多少次：走了w之后目标仍在w对应的子树里（先序编号是连续区间
+        [偏移, 偏移 + nodes[剩余阶数])），子树随次数嵌套，所以满足条件的次数是一个前缀。
+
+        Args:
+            order: 斐波那契树的阶数
+            target: 目标节点编号
+
+        Returns:
+            [(方向串, 重复次数), ...]，如 [("R", 30), ("LR", 2)] 表示 "R"*30 + "LR"*2
+        """
+        offsets = self._run_tables()
+        nodes = self.nodes
+        runs = []
+        k, t = order, target
+        while k >= 2 and t != 0:
+            first = "L" if t <= nodes[k-2] else "R"
+            k2, t2 = (k - 2, t - 1) if first == "L" else (k - 1, t - nodes[k-2] - 1)
+            if k2 < 2 or t2 == 0:
+                runs.append((first, 1))
+                break
+            second = "L" if t2 <= nodes[k2-2] else "R"
+            pattern = first if first == second else first + second
+            stride, min_order = self._PATTERNS[pattern]
+            table = offsets[pattern]
+            base = table[k]
+            # lo 是已经确认能走的次数（单方向已经走了两步）；先倍增找上界再二分，
+            # 代价与这一段的长度成对数关系，短的段不会被整棵树的阶数拖慢
+            lo = 2 if len(pattern) == 1 else 1
+            limit = (k - min_order) // stride + 1     # 到阶数不够为止
+            hi = lo
+            while hi < limit:
+                hi = min(limit, hi * 2)
+                rest = k - stride * hi
+                offset = base - table[rest]
+                if not offset <= t < offset + nodes[rest]:
+                    hi -= 1
+                    break
+                lo = hi
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                rest = k - stride * mid
+                offset = base - table[rest]
+                if offset <= t < offset + nodes[rest]:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            rest = k - stride * lo
+            t -= base - table[rest]
+            k = rest
+            runs.append((pattern, lo))
+        return runs
+
+    @staticmethod
+    def expand_runs(runs):
+        """把 find_path_runs 的结果展开成 "LRR..." 形式的字符串"""
+        return "".join(pattern * count for pattern, count in runs)
+
+    def get_subtree_info(self, order, node):
+        """获取节点的子树信息（用于调试）"""
+        if order <= 1:
+            return f"Node {node} is a leaf (order {order})"
+        
+        left_size = self.nodes[order-2] if order >= 2 else 0
+        
+        if node == 0:
+            return f"Node {node} is root of order-{order} tree"
+        elif node <= left_size:
+            return f"Node {node} is in left subtree (order-{order-2})"
+        else:
+            return f"Node {node} is in right subtree (order-{order-1})"
+
+# 测试和演示
+def test_fibonacci_tree():
+    finder = FibonacciTreePathFinder()
+    
+    # 测试用例1：order=5, source=5, dest=7
+    print("=== 测试用例1 ===")
+    order = 5
+    source = 5
+    dest = 7
+    
+    print(f"斐波那契树阶数: {order}")
+    print(f"各阶节点数: {[finder.nodes[i] for i in range(order+1)]}")
+    print(f"总节点数: {finder.nodes[order]}")
+    print()
+    
+    # 分析节点位置
+    print("节点位置分析:")
+    print(finder.get_subtree_info(order, source))
+    print(finder.get_subtree_info(order, dest))
+    print()
+    
+    # 找到路径
+    result = finder.find_path(order, source, dest)
+    print(f"从节点 {source} 到节点 {dest} 的路径: '{result}'")
+    
+    # 详细路径分析
+    source_path = finder.find_path_to_root(order, source)
+    dest_path = finder.find_path_to_root(order, dest)
+    print(f"源节点到根的路径: {source_path}")
+    print(f"目标节点到根的路径: {dest_path}")
+    
+    print("\n" + "="*50)
+    
+    # 更多测试用例
+    test_cases = [
+        (5, 3, 6, "UURL"),  # 预期结果
+        (4, 1, 7, "URL"),
+        (3, 2, 4, "ULR"),
+        (5, 0, 14, "RRR"),  # 根到最右叶子
+    ]
+    
+    print("更多测试用例:")
+    for order, src, dst, expected in test_cases:
+        if dst < finder.nodes[order]:  # 确保节点存在
+            actual = finder.find_path(order, src, dst)
+            status = "✓" if actual == expected else "✗"
+            print(f"{status} Order {order}: {src}→{dst} = '{actual}' (期望: '{expected}')")
+
+
+def test_find_path_runs():
+    import random
+    finder = FibonacciTreePathFinder(max_order=300)
+    # 小树上穷举，大树上随机取点，与逐层递归的结果对比
+    for order in range(12):
+        for target in range(finder.nodes[order]):
+            expected = "".join(finder.find_path_to_root(order, target))
+            assert finder.expand_runs(finder.find_path_runs(order, target)) == expected
+    rng = random.Random(48)
+    for order in (40, 150, 300):
+        last = finder.nodes[order] - 1
+        for target in [rng.randrange(last + 1) for _ in range(300)] + [1, last // 2, last - 1, last]:
+            expected = "".join(finder.find_path_to_root(order, target))
+            assert finder.expand_runs(finder.find_path_runs(order, target)) == expected
+    # 最右的叶子是一整段R
+    assert finder.find_path_runs(300, finder.nodes[300] - 1) == [("R", 299)]
+    # 大阶数的 find_path 走游程分支，结果与递归版一致
+    source, dest = rng.randrange(finder.nodes[200]), rng.randrange(finder.nodes[200])
+    source_path = "".join(finder.find_path_to_root(200, source))
+    dest_path = "".join(finder.find_path_to_root(200, dest))
+    lca = _common_prefix_len(source_path, dest_path)
+    assert finder.find_path(200, source, dest) == "U" * (len(source_path) - lca) + dest_path[lca:]
+    print("✓ find_path_runs 与逐层下降结果一致")
+
+
+def demo_deep_tree(order=10_000):
+    """深树上按游程下降：循环次数取决于路径有多少段，而不是路径长度"""
+    import random
+    import time
+    finder = FibonacciTreePathFinder(max_order=order)
+    finder.find_path_runs(order, 0)       # 先建好前缀和表
+    print(f"\n=== {order}阶斐波那契树（节点数约 10^{len(str(finder.nodes[order])) - 1}）===")
+    rng = random.Random(0)
+    targets = {
+        "最右叶子": finder.nodes[order] - 1,
+        "右脊中间": finder.nodes[order] - finder.nodes[order // 2],
+        "随机节点": rng.randrange(finder.nodes[order]),
+    }
+    for name, target in targets.items():
+        start = time.perf_counter()
+        runs = finder.find_path_runs(order, target)
+        elapsed = (time.perf_counter() - start) * 1e3
+        depth = sum(len(pattern) * count for pattern, count in runs)
+        print(f"{name}: 路径长度 {depth}，{len(runs)} 段，{elapsed:.2f} ms，前几段 {runs[:3]}")
+
+# 算法复杂度分析
+def analyze_complexity():
+    print("\n=== 算法复杂度分析 ===")
+    print("时间复杂度: O(order) - 每次递归减少阶数")
+    print("空间复杂度: O(order) - 递归栈深度和预计算数组")
+    print("预计算复杂度: O(max_order) - 只需要一次")
+    print()
+    print("优势:")
+    print("1. 避免了O(n)的完整树遍历")
+    print("2. 利用数学性质直接'跳跃'到目标区域")
+    print("3. 递归深度只与阶数相关，而非节点总数")
+    print("4. 可以处理非常大的斐波那契树而无需构建实际树结构")
+    print("5. find_path_runs 按游程下降：连续的R/L/RL/LR用前缀和一次跳过，")
+    print("   每段的代价是 O(log 段长)，深树上的长段（如右脊）不再逐层循环")
+
+# 进阶：可视化斐波那契树结构
+def visualize_fibonacci_tree(order, max_nodes=20):
+    """可视化小规模斐波那契树的结构"""
+    finder = FibonacciTreePathFinder()
+    
+    if finder.nodes[order] > max_nodes:
+        print(f"树太大({finder.nodes[order]}个节点)，跳过可视化")
+        return
+    
+    print(f"\n=== {order}阶斐波那契树结构可视化 ===")
+    
+    def print_tree_structure(curr_order, offset=0, prefix=""):
+        if curr_order <= 1:
+            print(f"{prefix}叶子[{offset}]")
+            return offset + 1
+        
+        print(f"{prefix}根[{offset}] (order-{curr_order})")
+        
+        # 左子树
+        left_offset = print_tree_structure(curr_order-2, offset+1, prefix+"├─L:")
+        
+        # 右子树  
+        right_offset = print_tree_structure(curr_order-1, left_offset, prefix+"└─R:")
+        
+        return right_offset
+    
+    print_tree_structure(order)
+    print(f"总节点数: {finder.nodes[order]}")
+
+
+def main():
+    test_fibonacci_tree()
+    test_find_path_runs()
+    analyze_complexity()
+    demo_deep_tree()
+    # 运行可视化
+    for order in [2, 3, 4]:
+        visualize_fibonacci_tree(order)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""图上的所有路径搜索：CSR表示、可达性剪枝、路径计数、并行搜索和基准测试"""
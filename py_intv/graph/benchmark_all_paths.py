@@ -0,0 +1,163 @@
+"""
+路径枚举基准测试
+
+在 workloads.py 的各类图上按规模扫描，统计每个算法的：
+    paths          - 找到的路径数（同时用来交叉校验各算法结果一致）
+    nodes_visited  - DFS展开的节点数（与机器无关，适合跨版本比较）
+    seconds        - repeat次运行中最快的一次
+    paths_per_sec  - 每秒产出的路径数
+    peak_bytes     - tracemalloc统计的峰值内存（单独运行一次，避免影响计时）
+
+用法：
+    python -m py_intv.graph.benchmark_all_paths                      # 打印表格
+    python -m py_intv.graph.benchmark_all_paths --output bench.json  # 同时写JSON，可以在版本之间diff
+    python -m py_intv.graph.benchmark_all_paths --quick              # 只跑每个工作负载的最小规模
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from .directed_all_paths_source_target import all_paths_directed
+from .reachability import prune_adjacency
+from .undirected_all_paths_source_target import all_paths_undirected, all_paths_undirected_optimized
+from .workloads import CountingAdjacency, make_workload
+
+
+ALGORITHMS = {
+    "all_paths_directed": all_paths_directed,
+    "all_paths_undirected": all_paths_undirected,
+    "all_paths_undirected_optimized": all_paths_undirected_optimized,
+}
+
+# 每个工作负载的规模扫描，size的含义见 workloads.WORKLOADS
+SWEEPS = {
+    "grid": [3, 4, 5],
+    "gnp": [14, 16, 18],
+    "dag_layers": [6, 8, 10],
+    "clique": [7, 8, 9],
+    "chain": [100, 400, 800],
+}
+
+
+def _prepare(graph, source, target, directed, prune):
+    if prune:
+        graph = prune_adjacency(graph, source, target, directed)
+    return graph
+
+
+def run_case(algorithm, graph, source, target, directed, prune=False, repeat=3):
+    """
+    运行一个 (算法, 图) 组合，返回指标字典
+
+    剪枝的预处理时间计入seconds，因为它是每次查询都要付出的代价。
+    """
+    func = ALGORITHMS[algorithm]
+
+    # 1. 统计展开节点数（计数包装会带来额外开销，所以不参与计时）
+    counting = CountingAdjacency(_prepare(graph, source, target, directed, prune))
+    paths = len(func(counting, source, target))
+
+    # 2. 计时
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(_prepare(graph, source, target, directed, prune), source, target)
+        best = min(best, time.perf_counter() - start)
+
+    # 3. 峰值内存
+    tracemalloc.start()
+    func(_prepare(graph, source, target, directed, prune), source, target)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "paths": paths,
+        "nodes_visited": counting.visits,
+        "seconds": best,
+        "paths_per_sec": paths / best if best > 0 else 0.0,
+        "peak_bytes": peak,
+    }
+
+
+def run_suite(sweeps=SWEEPS, algorithms=ALGORITHMS, repeat=3, seed=0, prune_modes=(False, True)):
+    for workload, sizes in sweeps.items():
+        for size in sizes:
+            graph, source, target, directed = make_workload(workload, size, seed)
+            for algorithm in algorithms:
+                for prune in prune_modes:
+                    metrics = run_case(algorithm, graph, source, target, directed, prune, repeat)
+                    row = {
+                        "workload": workload,
+                        "size": size,
+                        "nodes": len(graph),
+                        "edges": sum(len(v) for v in graph.values()),
+                        "algorithm": algorithm,
+                        "prune": prune,
+                    }
+                    row.update(metrics)
+                    yield row
+
+
+def print_row(row):
+    name = row["algorithm"] + ("+prune" if row["prune"] else "")
+    print(f"{row['workload']:<11s} {row['size']:>4d}  {name:<38s} "
+          f"{row['paths']:>8d} {row['nodes_visited']:>9d} "
+          f"{row['seconds'] * 1000:>10.2f} {row['paths_per_sec']:>12.0f} "
+          f"{row['peak_bytes'] / 1024:>10.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="all-paths 基准测试")
+    parser.add_argument("--output", help="把结果写成JSON文件")
+    parser.add_argument("--repeat", type=int, default=3, help="计时重复次数，取最快一次")
+    parser.add_argument("--seed", type=int, default=0, help="随机图的种子")
+    parser.add_argument("--quick", action="store_true", help="每个工作负载只跑最小规模")
+    parser.add_argument("--workload", action="append", choices=sorted(SWEEPS),
+                        help="只跑指定的工作负载，可以重复")
+    args = parser.parse_args(argv)
+
+    sweeps = {name: sizes for name, sizes in SWEEPS.items()
+              if not args.workload or name in args.workload}
+    if args.quick:
+        sweeps = {name: sizes[:1] for name, sizes in sweeps.items()}
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+    print(f"{'workload':<11s} {'size':>4s}  {'algorithm':<38s} "
+          f"{'paths':>8s} {'visited':>9s} {'ms':>10s} {'paths/s':>12s} {'peak KB':>10s}")
+    print("-" * 110)
+
+    rows = []
+    for row in run_suite(sweeps, repeat=args.repeat, seed=args.seed):
+        print_row(row)
+        rows.append(row)
+
+    # 同一个工作负载上，所有算法找到的路径数必须一致
+    counts = {}
+    for row in rows:
+        counts.setdefault((row["workload"], row["size"]), set()).add(row["paths"])
+    mismatched = [key for key, values in counts.items() if len(values) > 1]
+    if mismatched:
+        print(f"\n❌ 路径数不一致: {mismatched}")
+
+    if args.output:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "machine": platform.machine(),
+                "seed": args.seed,
+                "repeat": args.repeat,
+            },
+            "results": rows,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"\n结果已写入 {args.output}")
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+from array import array
+
+from .. import instrumentation
+
+_REGISTRY = instrumentation.REGISTRY
+
+
+def _interner():
+    """
+    节点标签 -> 稠密整数编号，按第一次出现的顺序编号
+
+    Returns:
+        (labels, intern) - labels 是编号 -> 标签的list（随 intern 调用增长），
+        intern(label) 返回标签的编号，新标签追加到 labels 末尾
+    """
+    labels = []
+    index = {}
+
+    def intern(label):
+        i = index.get(label)
+        if i is None:
+            i = index[label] = len(labels)
+            labels.append(label)
+        return i
+
+    return labels, intern
+
+
+class CSRGraph:
+    """
+    压缩稀疏行（CSR）格式的图
+
+    把任意节点标签映射成 0..n-1 的稠密整数，邻接关系存成两个连续的 int 数组：
+        offsets[u] .. offsets[u+1]  是节点u的邻居在targets中的区间
+        targets[k]                  是邻居的整数编号
+
+    相比 Dict[node, List[node]]：
+    1. 内层循环只做整数下标访问，不再对节点标签做哈希
+    2. 内存是两个紧凑的 array('i')，而不是每个节点一个list对象
+    3. 可以配合 bytearray 做 O(1) 的 visited 判断，替代 `neighbor in path` 的线性扫描
+    """
+
+    __slots__ = ("labels", "index", "offsets", "targets", "directed")
+
+    def __init__(self, labels, offsets, targets, directed=True):
+        """
+        Args:
+            labels: List[node] - 整数编号 -> 原始节点标签
+            offsets: array('i') 或 NumPy int32 数组，长度为 n+1
+            targets: array('i') 或 NumPy int32 数组，长度为边数
+            directed: bool - 是否为有向图（仅作记录，邻接关系已经展开）
+        """
+        if len(offsets) != len(labels) + 1:
+            raise ValueError("offsets length must be len(labels) + 1")
+        self.labels = list(labels)
+        self.index = {label: i for i, label in enumerate(self.labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.directed = directed
+
+    @classmethod
+    def from_adjacency(cls, graph, directed=True):
+        """
+        从现有的邻接表格式 Dict[node, List[node]] 构建
+
+        邻居顺序保持不变，所以在CSR上搜索得到的路径顺序与原dict版本一致。
+        只作为邻居出现、没有自己key的节点也会被编号（出度为0）。
+        """
+        labels, intern = _interner()
+        for node in graph:
+            intern(node)
+        rows = [[intern(v) for v in graph[node]] for node in list(graph)]
+        # 只作为邻居出现的节点没有出边
+        rows.extend([] for _ in range(len(labels) - len(rows)))
+
+        offsets = array("i", [0])
+        targets = array("i")
+        for row in rows:
+            targets.extend(row)
+            offsets.append(len(targets))
+        return cls(labels, offsets, targets, directed)
+
+    @classmethod
+    def from_edges(cls, edges, directed=True, nodes=None):
+        """
+        从边列表 Iterable[(u, v)] 构建
+
+        Args:
+            edges: 边列表，无向图中每条边只需出现一次
+            directed: bool - False时每条边会在两个方向上各存一次
+            nodes: 可选的节点列表，用于固定编号顺序或包含孤立节点
+        """
+        labels, intern = _interner()
+        if nodes is not None:
+            for node in nodes:
+                intern(node)
+
+        src = array("i")
+        dst = array("i")
+        for u, v in edges:
+            iu, iv = intern(u), intern(v)
+            src.append(iu)
+            dst.append(iv)
+            if not directed:
+                src.append(iv)
+                dst.append(iu)
+
+        # 计数排序：先统计出度，再按起点稳定地放置，保持每个节点的边输入顺序
+        n = len(labels)
+        offsets = array("i", [0]) * (n + 1)
+        for u in src:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        cursor = array("i", offsets[:n])
+        targets = array("i", [0]) * len(dst)
+        for u, v in zip(src, dst):
+            targets[cursor[u]] = v
+            cursor[u] += 1
+        return cls(labels, offsets, targets, directed)
+
+    @property
+    def num_nodes(self):
+        return len(self.labels)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.index
+
+    def neighbors(self, u):
+        """返回整数节点u的邻居编号（切片，不做标签转换）"""
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def to_adjacency(self):
+        """转换回 Dict[node, List[node]] 格式"""
+        labels, offsets, targets = self.labels, self.offsets, self.targets
+        return {
+            labels[u]: [labels[targets[k]] for k in range(offsets[u], offsets[u + 1])]
+            for u in range(len(labels))
+        }
+
+    def to_numpy(self):
+        """
+        以 NumPy int32 数组的形式返回 (offsets, targets)
+
+        array('i') 支持缓冲区协议，np.frombuffer 不会复制数据。
+        NumPy 只在调用这个方法时才导入。
+        """
+        import numpy as np
+
+        if isinstance(self.offsets, np.ndarray):
+            return self.offsets, self.targets
+        return (np.frombuffer(self.offsets, dtype=np.intc),
+                np.frombuffer(self.targets, dtype=np.intc))
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        return f"CSRGraph({kind}, nodes={self.num_nodes}, edges={self.num_edges})"
+
+
+class DFSMetrics:
+    """
+    all-paths 搜索的工作量计数器，按 algorithm 标签区分各个实现
+
+    visits 是进入过的节点数（含起点；到达target只记一条路径，不算进入），
+    backtracks 是回溯次数（完整跑完时等于visits），paths 是找到的路径数。
+    搜索函数开始时检查一次 instrumentation 是否开启：开启时用 CountingPath 代替普通list
+    作为路径，结束时调用 record_path；关闭时循环里没有任何额外操作。
+    """
+
+    __slots__ = ("visits", "backtracks", "paths")
+
+    def __init__(self, algorithm):
+        labels = {"algorithm": algorithm}
+        self.visits = instrumentation.counter(
+            "all_paths_nodes_visited_total", "DFS 进入过的节点数（含起点，不含target）", labels)
+        self.backtracks = instrumentation.counter(
+            "all_paths_backtracks_total", "DFS 回溯次数", labels)
+        self.paths = instrumentation.counter(
+            "all_paths_found_total", "找到的 source→target 路径数", labels)
+
+    def record(self, visits, backtracks, paths):
+        self.visits.inc(visits)
+        self.backtracks.inc(backtracks)
+        self.paths.inc(paths)
+
+    def record_path(self, path, paths, recursive=False):
+        """
+        根据搜索结束时的 CountingPath 记录一次搜索
+
+        Args:
+            path: CountingPath - 搜索中使用的路径
+            paths: int - 找到的路径数
+            recursive: 递归版本会把target也append进路径（每条路径多一次），
+                并且总是完整跑完；显式栈版本不进入target，可能被提前停止
+        """
+        if recursive:
+            visits = path.pushes - paths + 1
+            self.record(visits, visits, paths)
+        else:
+            visits = path.pushes + 1
+            # 提前停止时，仍在路径上的节点进入过但还没回溯
+            self.record(visits, visits - len(path), paths)
+
+
+class CountingPath(list):
+    """
+    统计 append 次数的路径列表，只在开启 instrumentation 时替换DFS里的 path
+
+    每次 append 对应进入一个节点；关闭时用普通 list，热循环里没有任何额外开销。
+    """
+
+    __slots__ = ("pushes",)
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.pushes = 0
+
+    def append(self, item):
+        self.pushes += 1
+        list.append(self, item)
+
+
+_CSR_METRICS = DFSMetrics("iter_paths_csr")
+
+_INVERT = bytes([1, 0]) + bytes(254)
+
+
+def iter_paths_csr(csr, source, target, max_paths=None, max_depth=None, cancel=None,
+                   allowed=None):
+    """
+    在CSR图上逐条生成从source到target的所有简单路径（显式栈，无递归）
+
+    visited 用 bytearray 掩码表示，判断和回溯都是 O(1)。
+    对于无向图，"不回到父节点" 已经被 visited 掩码覆盖，所以有向/无向共用这一个实现。
+
+    Args:
+        csr: CSRGraph
+        source: 起始节点标签
+        target: 目标节点标签
+        max_paths: 最多生成多少条路径，None表示不限制
+        max_depth: 路径最多包含多少条边，None表示不限制
+        cancel: 可选的 threading.Event，被set后停止枚举
+        allowed: 可选的 bytearray 掩码，只在 allowed[v] == 1 的节点中搜索（用于剪枝）
+
+    Yields:
+        List[node] - 一条路径（以原始标签表示）
+    """
+    if max_paths is not None and max_paths <= 0:
+        return
+    index = csr.index
+    if source not in index:
+        if source == target:
+            yield [source]
+        return
+    if target not in index:
+        return
+    if source == target:
+        yield [source]
+        return
+
+    labels, offsets, targets = csr.labels, csr.offsets, csr.targets
+    s, t = index[source], index[target]
+    if allowed is None:
+        visited = bytearray(csr.num_nodes)
+    else:
+        # 不允许访问的节点直接标记为已访问，内层循环不需要额外判断
+        visited = allowed.translate(_INVERT)
+    visited[s] = 1
+    enabled = _REGISTRY.enabled
+    path = CountingPath([s]) if enabled else [s]
+    # pos[d] 是 path[d] 下一个待检查的邻接边在 targets 中的下标
+    pos = [offsets[s]]
+    count = 0
+
+    try:
+        while pos:
+            if cancel is not None and cancel.is_set():
+                return
+
+            current = path[-1]
+            k = pos[-1]
+            if k == offsets[current + 1]:
+                # 邻居已经全部检查完，回溯
+                pos.pop()
+                visited[path.pop()] = 0
+                continue
+            pos[-1] = k + 1
+
+            neighbor = targets[k]
+            if visited[neighbor]:
+                continue
+
+            if neighbor == t:
+                if max_depth is None or len(path) <= max_depth:
+                    count += 1   # 先计数：消费者在yield处close()时这条路径也已经交付
+                    yield [labels[v] for v in path] + [target]
+                    if count == max_paths:
+                        return
+            elif max_depth is None or len(path) < max_depth:
+                visited[neighbor] = 1
+                path.append(neighbor)
+                pos.append(offsets[neighbor])
+    finally:
+        if enabled:
+            _CSR_METRICS.record_path(path, count)
+
+
+def all_paths_csr(csr, source, target):
+    """
+    在CSR图上找到从source到target的所有简单路径
+
+    Returns:
+        List[List[node]] - 所有路径（以原始标签表示）
+    """
+    return list(iter_paths_csr(csr, source, target))
+
+
+def main():
+    grid_graph = {
+        0: [1, 3],
+        1: [0, 2, 4],
+        2: [1, 5],
+        3: [0, 4, 6],
+        4: [1, 3, 5, 7],
+        5: [2, 4, 8],
+        6: [3, 7],
+        7: [4, 6, 8],
+        8: [5, 7]
+    }
+
+    csr = CSRGraph.from_adjacency(grid_graph, directed=False)
+    print(csr)
+    print(f"offsets: {list(csr.offsets)}")
+    print(f"targets: {list(csr.targets)}")
+    print(f"还原邻接表一致: {csr.to_adjacency() == grid_graph}")
+
+    paths = all_paths_csr(csr, 0, 8)
+    print(f"3x3网格图 0→8 共 {len(paths)} 条路径")
+
+    edges = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D'), ('D', 'E')]
+    csr_edges = CSRGraph.from_edges(edges, directed=True)
+    print(f"边列表构建的有向图 A→E: {all_paths_csr(csr_edges, 'A', 'E')}")
+
+
+if __name__ == "__main__":
+    main()
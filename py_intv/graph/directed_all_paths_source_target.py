@@ -0,0 +1,226 @@
+from .. import instrumentation
+from .csr_graph import CSRGraph, CountingPath, DFSMetrics, iter_paths_csr
+from .path_trie import PathTrie
+from .reachability import pruning_mask, prune_adjacency
+
+_REGISTRY = instrumentation.REGISTRY
+_RECURSIVE_METRICS = DFSMetrics("all_paths_directed")
+_ITER_METRICS = DFSMetrics("iter_paths_directed")
+
+
+def all_paths_directed(graph, source, target, prune=False, as_trie=False):
+    """
+    在有向图中找到从source到target的所有路径
+    
+    Args:
+        graph: Dict[int, List[int]] 或 CSRGraph - 邻接表表示的有向图
+        source: int - 起始节点
+        target: int - 目标节点
+        prune: 是否先用反向BFS剪掉到不了target的节点
+        as_trie: 为True时返回共享前缀的 PathTrie，而不是 List[List[int]]
+    
+    Returns:
+        List[List[int]] - 所有从source到target的路径
+    """
+    if as_trie:
+        return PathTrie.from_paths(iter_paths_directed(graph, source, target, prune=prune))
+    if isinstance(graph, CSRGraph):
+        return list(iter_paths_directed(graph, source, target, prune=prune))
+    if prune:
+        graph = prune_adjacency(graph, source, target, directed=True)
+
+    results = []
+    
+    def dfs(current, path):
+        # 到达目标节点，记录当前路径
+        if current == target:
+            results.append(path.copy())  # 重要：使用copy()避免引用问题
+            return
+        
+        # 遍历当前节点的所有邻居
+        for neighbor in graph.get(current, []):
+            # 避免环路：如果邻居已在当前路径中，跳过
+            if neighbor in path:
+                continue
+            
+            # 回溯算法：添加邻居到路径，递归探索，然后移除
+            path.append(neighbor)
+            dfs(neighbor, path)
+            path.pop()  # 回溯：移除刚添加的节点
+    
+    # 从source开始DFS，初始路径包含source
+    enabled = _REGISTRY.enabled
+    path = CountingPath([source]) if enabled else [source]
+    dfs(source, path)
+    if enabled:
+        _RECURSIVE_METRICS.record_path(path, len(results), recursive=True)
+    return results
+
+
+_EXHAUSTED = object()
+
+
+def iter_paths_directed(graph, source, target, max_paths=None, max_depth=None, cancel=None,
+                        prune=False):
+    """
+    all_paths_directed 的惰性迭代版本：用显式栈代替递归，逐条yield路径
+
+    不会触发 RecursionError，也不会把所有路径都存进内存；
+    除了正在生成的那条路径外，额外空间只有 O(路径深度) 的栈。
+    调用方可以随时 break / close() 生成器来提前停止。
+
+    Args:
+        graph: Dict[int, List[int]] 或 CSRGraph - 邻接表表示的有向图
+        source: int - 起始节点
+        target: int - 目标节点
+        max_paths: 最多生成多少条路径，None表示不限制
+        max_depth: 路径最多包含多少条边，None表示不限制
+        cancel: 可选的 threading.Event，被set后停止枚举（适合跨线程取消）
+        prune: 是否先用反向BFS剪掉到不了target的节点
+
+    Yields:
+        List[int] - 一条从source到target的路径，顺序与 all_paths_directed 一致
+    """
+    if isinstance(graph, CSRGraph):
+        allowed = None
+        if prune and source in graph and target in graph:
+            allowed = pruning_mask(graph, graph.index[source], graph.index[target],
+                                   directed=True)
+        yield from iter_paths_csr(graph, source, target, max_paths, max_depth, cancel, allowed)
+        return
+    if prune:
+        graph = prune_adjacency(graph, source, target, directed=True)
+
+    if max_paths is not None and max_paths <= 0:
+        return
+    if source == target:
+        yield [source]
+        return
+
+    enabled = _REGISTRY.enabled
+    path = CountingPath([source]) if enabled else [source]
+    visited = {source}
+    # 栈中保存每一层邻居列表的迭代器，对应递归版本中每一层的for循环
+    stack = [iter(graph.get(source, []))]
+    count = 0
+
+    try:
+        while stack:
+            if cancel is not None and cancel.is_set():
+                return
+
+            neighbor = next(stack[-1], _EXHAUSTED)
+            if neighbor is _EXHAUSTED:
+                # 当前节点的邻居已经全部检查完，回溯
+                stack.pop()
+                visited.discard(path.pop())
+                continue
+
+            if neighbor in visited:
+                continue
+
+            if neighbor == target:
+                if max_depth is None or len(path) <= max_depth:
+                    count += 1   # 先计数：消费者在yield处close()时这条路径也已经交付
+                    yield path + [neighbor]
+                    if count == max_paths:
+                        return
+            elif max_depth is None or len(path) < max_depth:
+                path.append(neighbor)
+                visited.add(neighbor)
+                stack.append(iter(graph.get(neighbor, [])))
+    finally:
+        if enabled:
+            _ITER_METRICS.record_path(path, count)
+
+
+# 测试代码和示例
+def main():
+    # 测试例1：简单有向图
+    directed_graph1 = {
+        0: [1, 2],
+        1: [3],
+        2: [1, 3],
+        3: []
+    }
+
+    print("测试1 - 有向图 0→3 的所有路径:")
+    paths1 = all_paths_directed(directed_graph1, 0, 3)
+    for i, path in enumerate(paths1, 1):
+        print(f"  路径{i}: {' → '.join(map(str, path))}")
+    print(f"总共找到 {len(paths1)} 条路径\n")
+
+    # 测试例2：有环的有向图
+    directed_graph2 = {
+        0: [1],
+        1: [2, 3],
+        2: [1, 4],  # 2→1 形成环
+        3: [4],
+        4: []
+    }
+
+    print("测试2 - 有环有向图 0→4 的所有路径:")
+    paths2 = all_paths_directed(directed_graph2, 0, 4)
+    for i, path in enumerate(paths2, 1):
+        print(f"  路径{i}: {' → '.join(map(str, path))}")
+    print(f"总共找到 {len(paths2)} 条路径\n")
+
+    # 测试例3：无路径情况
+    directed_graph3 = {
+        0: [1],
+        1: [2],
+        2: [],
+        3: [4],  # 3和4是孤立的
+        4: []
+    }
+
+    print("测试3 - 无路径情况 0→4:")
+    paths3 = all_paths_directed(directed_graph3, 0, 4)
+    if paths3:
+        for i, path in enumerate(paths3, 1):
+            print(f"  路径{i}: {' → '.join(map(str, path))}")
+    else:
+        print("  没有找到从0到4的路径")
+    print(f"总共找到 {len(paths3)} 条路径\n")
+
+    # 测试例4：复杂图
+    directed_graph4 = {
+        'A': ['B', 'C'],
+        'B': ['D', 'E'],
+        'C': ['E', 'F'],
+        'D': ['G'],
+        'E': ['G'],
+        'F': ['G'],
+        'G': []
+    }
+
+    print("测试4 - 字符节点有向图 A→G 的所有路径:")
+    paths4 = all_paths_directed(directed_graph4, 'A', 'G')
+    for i, path in enumerate(paths4, 1):
+        print(f"  路径{i}: {' → '.join(path)}")
+    print(f"总共找到 {len(paths4)} 条路径\n")
+
+    # 测试例5：CSR格式的图应该得到完全相同的结果
+    csr4 = CSRGraph.from_adjacency(directed_graph4)
+    print("测试5 - CSR格式 A→G 的所有路径:")
+    print(f"与dict版本一致: {all_paths_directed(csr4, 'A', 'G') == paths4}")
+
+    # 测试例6：长链，递归版本会触发 RecursionError，迭代版本不受影响
+    n = 5000
+    long_chain = {i: [i + 1] for i in range(n)}
+    print(f"\n测试6 - {n + 1}个节点的长链 0→{n}:")
+    long_path = next(iter_paths_directed(long_chain, 0, n))
+    print(f"  迭代版本找到路径，长度 {len(long_path)}")
+    try:
+        all_paths_directed(long_chain, 0, n)
+    except RecursionError:
+        print("  递归版本: RecursionError")
+
+    # 测试例7：限制路径数量和深度
+    print("\n测试7 - A→G 只取前2条 / 只要不超过3条边的路径:")
+    print(f"  max_paths=2: {list(iter_paths_directed(directed_graph4, 'A', 'G', max_paths=2))}")
+    print(f"  max_depth=3: {len(list(iter_paths_directed(directed_graph4, 'A', 'G', max_depth=3)))} 条")
+
+
+if __name__ == "__main__":
+    main()
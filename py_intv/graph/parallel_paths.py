@@ -0,0 +1,378 @@
+from .csr_graph import CSRGraph, iter_paths_csr
+
+
+_EXHAUSTED = object()
+
+# 工作进程的全局状态，由 _init_worker 在进程启动时设置一次，避免每个任务都pickle整张图
+_worker_graph = None
+_worker_target = None
+_worker_queue = None
+_worker_owners = None
+_worker_chunk_size = 1024
+
+
+def _expand_frontier(graph, source, target, split_depth):
+    """
+    顺序地把搜索树展开到split_depth层，得到按DFS顺序排列的任务列表
+
+    每一项是 (is_path, nodes)：
+        is_path=True  - 在split_depth层以内已经到达target的完整路径
+        is_path=False - 长度为 split_depth+1 的路径前缀，交给工作进程继续搜索
+    按顺序拼接每一项展开后的结果，就是顺序版本的输出顺序。
+    """
+    if source == target:
+        return [(True, [source])]
+    if isinstance(graph, CSRGraph):
+        if source not in graph or target not in graph:
+            return []
+        labels, offsets, targets = graph.labels, graph.offsets, graph.targets
+
+        def neighbors(node):
+            u = graph.index[node]
+            return (labels[targets[k]] for k in range(offsets[u], offsets[u + 1]))
+    else:
+        def neighbors(node):
+            return iter(graph.get(node, []))
+
+    items = []
+    path = [source]
+    visited = {source}
+    stack = [neighbors(source)]
+    while stack:
+        neighbor = next(stack[-1], _EXHAUSTED)
+        if neighbor is _EXHAUSTED:
+            stack.pop()
+            visited.discard(path.pop())
+            continue
+        if neighbor in visited:
+            continue
+        if neighbor == target:
+            items.append((True, path + [neighbor]))
+        elif len(path) < split_depth:
+            path.append(neighbor)
+            visited.add(neighbor)
+            stack.append(neighbors(neighbor))
+        else:
+            items.append((False, path + [neighbor]))
+    return items
+
+
+def _extend_prefix(graph, prefix, target):
+    """从一个路径前缀继续DFS，逐条yield以该前缀开头的完整路径"""
+    if isinstance(graph, CSRGraph):
+        # 前缀上除最后一个节点外都不能再访问，用allowed掩码表达
+        allowed = bytearray(b"\x01") * graph.num_nodes
+        for node in prefix[:-1]:
+            allowed[graph.index[node]] = 0
+        head = prefix[:-1]
+        for tail in iter_paths_csr(graph, prefix[-1], target, allowed=allowed):
+            yield head + tail
+        return
+
+    path = list(prefix)
+    visited = set(prefix)
+    stack = [iter(graph.get(prefix[-1], []))]
+    while stack:
+        neighbor = next(stack[-1], _EXHAUSTED)
+        if neighbor is _EXHAUSTED:
+            stack.pop()
+            visited.discard(path.pop())
+            continue
+        if neighbor in visited:
+            continue
+        if neighbor == target:
+            yield path + [neighbor]
+        else:
+            path.append(neighbor)
+            visited.add(neighbor)
+            stack.append(iter(graph.get(neighbor, [])))
+
+
+def _init_worker(graph, target, queue, owners, chunk_size):
+    global _worker_graph, _worker_target, _worker_queue, _worker_owners, _worker_chunk_size
+    _worker_graph = graph
+    _worker_target = target
+    _worker_queue = queue
+    _worker_owners = owners
+    _worker_chunk_size = chunk_size
+
+
+def _run_task(task):
+    """
+    工作进程：继续搜索一个前缀，把结果按块放进有界队列
+
+    队列满时put会阻塞，这样消费者处理不过来时工作进程会自动减速（背压）。
+    开始前先把自己的pid直接写进共享内存里的 owners[task_id]（不经过队列的feeder线程，
+    写完就对主进程可见），主进程据此发现执行任务的进程被杀；
+    最后放一个 (task_id, None) 表示结束；出错时放入异常对象。
+    """
+    import os
+
+    task_id, prefix = task
+    _worker_owners[task_id] = os.getpid()
+    queue = _worker_queue
+    try:
+        chunk = []
+        for path in _extend_prefix(_worker_graph, prefix, _worker_target):
+            chunk.append(path)
+            if len(chunk) >= _worker_chunk_size:
+                queue.put((task_id, chunk))
+                chunk = []
+        if chunk:
+            queue.put((task_id, chunk))
+        queue.put((task_id, None))
+    except Exception as exc:
+        queue.put((task_id, exc))
+
+
+def _check_workers(waiting, owners, results, alive, processes, unclaimed):
+    """
+    队列一段时间没有消息时检查工作进程：任务抛出了异常，或者执行任务的进程已经不在了
+    （OOM、被信号杀掉 —— 进程池会补一个新进程，但这个任务的结果永远不会来）
+
+    进程可能在从进程池取走任务之后、写 owners 之前就被杀掉，这个任务就没有记录。
+    进程池按提交顺序分发任务，有空闲进程时已提交的任务立刻就会被认领，
+    所以连续两次检查都有空闲进程、同一个任务却始终没人认领，就说明它丢了。
+
+    Args:
+        waiting: 已提交、还没有结束的任务id
+        owners: 共享数组，owners[task_id] 是执行该任务的进程pid，0表示还没有进程认领
+        results: 所有已提交任务的 AsyncResult
+        alive: 当前存活的工作进程pid集合
+        processes: 进程池的进程数
+        unclaimed: 上一次检查时有空闲进程、却没有被认领的任务id集合
+
+    Returns:
+        这一次检查时有空闲进程、却没有被认领的任务id集合，传给下一次检查
+
+    Raises:
+        RuntimeError - 执行任务的进程已经退出，或者任务在被认领前丢失
+    """
+    for result in results:
+        if result.ready() and not result.successful():
+            result.get()                 # 重新抛出工作进程里的异常
+    busy = 0
+    for task_id in waiting:
+        pid = owners[task_id]
+        if pid and pid not in alive:
+            raise RuntimeError(f"worker process {pid} died while running task {task_id}")
+        busy += pid != 0
+    if busy >= processes:
+        return set()
+    now = {task_id for task_id in waiting if not owners[task_id]}
+    lost = now & unclaimed
+    if lost:
+        raise RuntimeError(f"task {min(lost)} was lost: its worker process died before starting it")
+    return now
+
+
+def iter_paths_parallel(graph, source, target, split_depth=2, processes=None,
+                        ordered=True, queue_size=64, chunk_size=1024,
+                        ordered_window=None, poll_interval=1.0):
+    """
+    用进程池并行枚举从source到target的所有简单路径
+
+    1. 主进程把搜索树顺序展开到split_depth层，得到一批路径前缀
+    2. 每个前缀作为一个任务交给进程池，工作进程用自己的visited继续DFS
+    3. 结果按块通过容量为queue_size的有界队列流回主进程
+
+    ordered=True 时按任务顺序输出，结果与 iter_paths_undirected / iter_paths_directed
+    的顺序完全一致。先完成的后续任务的结果要在主进程里暂存，为了让暂存有上界，
+    同时提交的任务最多 ordered_window 个：第 i 个任务输出完之后才提交第 i + window 个，
+    所以暂存的最多是 window - 1 个任务的结果（一个很慢的早期任务不会让主进程
+    攒下后面所有任务的路径）。
+    ordered=False 时一次提交全部任务，哪个任务先产出就先输出，延迟和内存都更低。
+
+    队列每 poll_interval 秒没有消息就检查一次工作进程，执行任务的进程死掉时抛出
+    RuntimeError，而不是永远等下去（包括进程刚取走任务、还没开始执行就被杀的情况，
+    最晚两个 poll_interval 之后发现）。
+
+    有向图和无向图都适用：无向图的"不回到父节点"已经被visited覆盖。
+
+    Args:
+        graph: Dict[int, List[int]] 或 CSRGraph - 邻接表表示的图
+        source: int - 起始节点
+        target: int - 目标节点
+        split_depth: 前缀展开的深度，越大任务越多、负载越均衡
+        processes: 进程数，None表示CPU核数
+        ordered: 是否按顺序版本的顺序输出
+        queue_size: 结果队列最多容纳多少个块
+        chunk_size: 每个块包含多少条路径
+        ordered_window: 有序模式下同时提交的任务数，None表示进程数的2倍
+        poll_interval: 等待队列时检查工作进程的间隔（秒）
+
+    Yields:
+        List[int] - 一条从source到target的路径
+
+    Raises:
+        RuntimeError - 执行任务的工作进程意外退出
+    """
+    items = _expand_frontier(graph, source, target, split_depth)
+    tasks = [(i, nodes) for i, (is_path, nodes) in enumerate(items) if not is_path]
+    if not tasks:
+        for _, nodes in items:
+            yield nodes
+        return
+
+    import multiprocessing as mp   # 启动进程池时才需要，不拖慢模块导入
+    import os
+    from queue import Empty
+
+    processes = processes or os.cpu_count() or 1
+    window = max(1, ordered_window or 2 * processes) if ordered else len(tasks)
+    queue = mp.Queue(queue_size)
+    owners = mp.RawArray("q", len(items))   # 按任务id（items下标）记录执行它的进程pid
+    pool = mp.Pool(processes, initializer=_init_worker,
+                   initargs=(graph, target, queue, owners, chunk_size))
+    try:
+        results = []
+        submitted = 0         # 已提交的任务数（tasks 的下标）
+        drained = 0           # 有序模式下已经输出完的任务数
+
+        def submit():
+            nonlocal submitted
+            while submitted < len(tasks) and submitted < drained + window:
+                results.append(pool.apply_async(_run_task, (tasks[submitted],)))
+                submitted += 1
+
+        submit()
+        pending = {task_id for task_id, _ in tasks}
+        unclaimed = set()
+        buffered = {}
+        position = 0
+
+        if not ordered:
+            for is_path, nodes in items:
+                if is_path:
+                    yield nodes
+
+        while True:
+            if ordered:
+                # 按顺序输出已经就绪的项，遇到还在运行的任务就停下来等队列
+                while position < len(items):
+                    is_path, nodes = items[position]
+                    if is_path:
+                        yield nodes
+                    else:
+                        if position in buffered:
+                            yield from buffered.pop(position)
+                        if position in pending:
+                            break
+                        drained += 1
+                        submit()
+                    position += 1
+                if position == len(items):
+                    break
+            elif not pending:
+                break
+
+            try:
+                task_id, chunk = queue.get(timeout=poll_interval)
+            except Empty:
+                waiting = [task_id for task_id, _ in tasks[:submitted] if task_id in pending]
+                alive = {process.pid for process in mp.active_children()}
+                unclaimed = _check_workers(waiting, owners, results, alive, processes, unclaimed)
+                continue
+            if isinstance(chunk, Exception):
+                raise chunk
+            if chunk is None:
+                pending.discard(task_id)
+            elif not ordered or task_id == position:
+                # 当前正在等待的任务的结果可以直接流式输出
+                yield from chunk
+            else:
+                buffered.setdefault(task_id, []).extend(chunk)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def all_paths_parallel(graph, source, target, **kwargs):
+    """
+    iter_paths_parallel 的列表版本，默认按顺序版本的顺序返回所有路径
+    """
+    return list(iter_paths_parallel(graph, source, target, **kwargs))
+
+
+def test_parallel_paths():
+    import os
+    import signal
+    import multiprocessing as mp
+    from .undirected_all_paths_source_target import iter_paths_undirected
+    from .workloads import grid_graph
+
+    grid = grid_graph(4, 4)
+    expected = list(iter_paths_undirected(grid, 0, 15))
+    # 窗口为1时每次只有一个任务在跑，顺序与顺序版本一致
+    for window in (1, 3, None):
+        assert all_paths_parallel(grid, 0, 15, split_depth=3, processes=2,
+                                  chunk_size=7, ordered_window=window) == expected
+    unordered = all_paths_parallel(grid, 0, 15, split_depth=3, processes=2, ordered=False)
+    assert sorted(unordered) == sorted(expected)
+    print("✅ 有序/无序输出与顺序版本一致")
+
+    # 工作进程在任务中途被杀：消费者要报错，而不是永远阻塞在队列上
+    paths = iter_paths_parallel(grid_graph(6, 6), 0, 35, split_depth=1, processes=1,
+                                chunk_size=1, queue_size=1, poll_interval=0.2)
+    next(paths)
+    for child in mp.active_children():
+        os.kill(child.pid, signal.SIGKILL)
+    try:
+        for _ in paths:
+            pass
+    except RuntimeError as exc:
+        print(f"✅ 工作进程被杀后报错: {exc}")
+    else:
+        raise AssertionError("工作进程被杀后应该抛出 RuntimeError")
+
+    # 进程取走任务后、写 owners 之前被杀：任务没有记录，连续两次检查都没人认领就报错
+    owners = [0, 4242, 0]
+    assert _check_workers([0, 1, 2], owners, [], {4242}, 2, set()) == {0, 2}
+    assert _check_workers([1, 2], owners, [], {4242}, 2, {0}) == {2}      # 任务0已经结束
+    try:
+        _check_workers([1, 2], owners, [], {4242}, 2, {2})
+    except RuntimeError as exc:
+        print(f"✅ 任务在被认领前丢失时报错: {exc}")
+    else:
+        raise AssertionError("任务丢失后应该抛出 RuntimeError")
+    # 所有进程都在忙时，排队的任务没人认领是正常的
+    assert _check_workers([1, 2], owners, [], {4242}, 1, {2}) == set()
+
+
+def main():
+    import os
+    import time
+
+    test_parallel_paths()
+    from .undirected_all_paths_source_target import iter_paths_undirected
+    from .workloads import grid_graph
+
+    grid3 = grid_graph(3, 3)
+    print("3x3网格图 0→8:")
+    sequential = list(iter_paths_undirected(grid3, 0, 8))
+    parallel = all_paths_parallel(grid3, 0, 8, split_depth=2, processes=2)
+    print(f"  顺序版本 {len(sequential)} 条, 并行版本 {len(parallel)} 条, "
+          f"顺序一致: {sequential == parallel}")
+
+    # 扩展到6x6网格做扩展性测试（0→35 共 1262816 条简单路径）
+    grid6 = grid_graph(6, 6)
+    print(f"\n6x6网格图 0→35 扩展性测试（CPU核数: {os.cpu_count()}）:")
+    start = time.perf_counter()
+    expected = sum(1 for _ in iter_paths_undirected(grid6, 0, 35))
+    base = time.perf_counter() - start
+    print(f"  顺序版本:      {expected} 条, 用时 {base:.2f}秒")
+
+    for processes in (1, 2, 4):
+        for ordered in (True, False):
+            start = time.perf_counter()
+            total = sum(1 for _ in iter_paths_parallel(grid6, 0, 35, split_depth=4,
+                                                        processes=processes,
+                                                        ordered=ordered))
+            elapsed = time.perf_counter() - start
+            mode = "有序" if ordered else "无序"
+            print(f"  {processes}进程 {mode}:     {total} 条, 用时 {elapsed:.2f}秒, "
+                  f"加速比 {base / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+import random
+
+from .csr_graph import CSRGraph
+from .directed_all_paths_source_target import iter_paths_directed
+from .reachability import nodes_reaching
+
+
+def _dag_counts(csr, s, t):
+    """
+    在 "从s可达且能到达t" 的相关子图上做拓扑排序 + 记忆化DP
+
+    counts[u] = 从u到t的路径条数，counts[t] = 1
+    counts[u] = sum(counts[v] for v in u的邻居)
+
+    只有相关子图无环时，DP数出来的"走法"才都是简单路径。
+    相关子图以外的环不影响结果（那些节点不可能出现在任何 s→t 路径上）。
+
+    Returns:
+        List[int] - 每个节点的路径数；相关子图有环时返回 None
+    """
+    n = csr.num_nodes
+    offsets, targets = csr.offsets, csr.targets
+    counts = [0] * n
+    reach_t = nodes_reaching(csr, t)
+    if not reach_t[s]:
+        return counts
+
+    # 1. 从s出发、只在能到达t的节点中遍历，得到相关子图，同时统计入度
+    relevant = bytearray(n)
+    relevant[s] = 1
+    indegree = [0] * n
+    stack = [s]
+    nodes = []
+    while stack:
+        u = stack.pop()
+        nodes.append(u)
+        if u == t:
+            continue  # 到达t就停止，和枚举版本的语义一致
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if not reach_t[v]:
+                continue
+            indegree[v] += 1
+            if not relevant[v]:
+                relevant[v] = 1
+                stack.append(v)
+
+    # 2. Kahn算法拓扑排序，排不完说明有环
+    order = []
+    ready = [u for u in nodes if indegree[u] == 0]
+    while ready:
+        u = ready.pop()
+        order.append(u)
+        if u == t:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if relevant[v]:
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    ready.append(v)
+    if len(order) < len(nodes):
+        return None
+
+    # 3. 逆拓扑序DP，Python大整数可以表示天文数字级别的路径数
+    counts[t] = 1
+    for u in reversed(order):
+        if u == t:
+            continue
+        total = 0
+        for k in range(offsets[u], offsets[u + 1]):
+            total += counts[targets[k]]
+        counts[u] = total
+    return counts
+
+
+def _as_csr(graph):
+    if isinstance(graph, CSRGraph):
+        return graph
+    return CSRGraph.from_adjacency(graph, directed=True)
+
+
+def count_paths(graph, source, target, limit=1_000_000):
+    """
+    统计从source到target的简单路径条数，不枚举路径
+
+    相关子图是DAG时：拓扑排序 + DP，O(V + E)，结果是精确的大整数。
+    相关子图有环时（包括无向图）：简单路径计数没有多项式算法，
+    退化为逐条枚举，最多枚举limit条。
+
+    Args:
+        graph: Dict[int, List[int]] 或 CSRGraph - 邻接表表示的图
+        source: int - 起始节点
+        target: int - 目标节点
+        limit: 有环时最多枚举多少条路径
+
+    Returns:
+        int - 路径条数，与 len(all_paths_directed(graph, source, target)) 相同
+
+    Raises:
+        ValueError: 有环且路径数超过limit
+    """
+    csr = _as_csr(graph)
+    if source not in csr or target not in csr:
+        return 1 if source == target else 0
+
+    counts = _dag_counts(csr, csr.index[source], csr.index[target])
+    if counts is not None:
+        return counts[csr.index[source]]
+
+    total = 0
+    for _ in iter_paths_directed(csr, source, target, max_paths=limit + 1):
+        total += 1
+    if total > limit:
+        raise ValueError(f"graph has cycles and more than {limit} paths; "
+                         f"raise limit to enumerate further")
+    return total
+
+
+def sample_paths(graph, source, target, k, seed=None, limit=1_000_000):
+    """
+    从所有source→target路径中均匀随机抽取k条（有放回）
+
+    DAG上：按DP计数做加权随机游走，从u走向邻居v的概率为 counts[v] / counts[u]，
+    每条路径被抽中的概率恰好是 1 / counts[source]。
+    每次抽样只需 O(路径长度 × 平均出度)，与路径总数无关。
+    有环时退化为最多枚举limit条路径后再抽样。
+
+    Args:
+        graph: Dict[int, List[int]] 或 CSRGraph - 邻接表表示的图
+        source: int - 起始节点
+        target: int - 目标节点
+        k: int - 抽样数量
+        seed: 随机种子，或者一个 random.Random 实例
+        limit: 有环时最多枚举多少条路径
+
+    Returns:
+        List[List[int]] - k条路径；没有路径时返回空列表
+    """
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    csr = _as_csr(graph)
+    if source not in csr or target not in csr:
+        return [[source] for _ in range(k)] if source == target else []
+
+    s, t = csr.index[source], csr.index[target]
+    counts = _dag_counts(csr, s, t)
+    if counts is None:
+        paths = list(iter_paths_directed(csr, source, target, max_paths=limit + 1))
+        if len(paths) > limit:
+            raise ValueError(f"graph has cycles and more than {limit} paths; "
+                             f"raise limit to enumerate further")
+        return rng.choices(paths, k=k) if paths else []
+
+    if counts[s] == 0:
+        return []
+
+    labels, offsets, targets = csr.labels, csr.offsets, csr.targets
+    samples = []
+    for _ in range(k):
+        u = s
+        path = [labels[u]]
+        while u != t:
+            # 在 [0, counts[u]) 中取一个随机数，落在哪个邻居的区间就走向哪个邻居
+            r = rng.randrange(counts[u])
+            for j in range(offsets[u], offsets[u + 1]):
+                v = targets[j]
+                if r < counts[v]:
+                    break
+                r -= counts[v]
+            u = v
+            path.append(labels[u])
+        samples.append(path)
+    return samples
+
+
+def main():
+    from collections import Counter
+    from .directed_all_paths_source_target import all_paths_directed
+
+    directed_graph4 = {
+        'A': ['B', 'C'],
+        'B': ['D', 'E'],
+        'C': ['E', 'F'],
+        'D': ['G'],
+        'E': ['G'],
+        'F': ['G'],
+        'G': []
+    }
+    print("测试1 - 字符节点DAG A→G:")
+    print(f"  count_paths: {count_paths(directed_graph4, 'A', 'G')}")
+    print(f"  len(all_paths_directed): {len(all_paths_directed(directed_graph4, 'A', 'G'))}")
+
+    # 有环的有向图：退化为有界枚举
+    directed_graph2 = {
+        0: [1],
+        1: [2, 3],
+        2: [1, 4],
+        3: [4],
+        4: []
+    }
+    print("\n测试2 - 有环有向图 0→4:")
+    print(f"  count_paths: {count_paths(directed_graph2, 0, 4)}")
+    print(f"  len(all_paths_directed): {len(all_paths_directed(directed_graph2, 0, 4))}")
+
+    # 分层DAG：100层、每层10个节点、相邻层全连接，共 10^100 条路径
+    layers, width = 100, 10
+    layered = {'s': list(range(width))}
+    for layer in range(layers - 1):
+        for i in range(width):
+            layered[layer * width + i] = [(layer + 1) * width + j for j in range(width)]
+    for i in range(width):
+        layered[(layers - 1) * width + i] = ['t']
+    layered['t'] = []
+
+    total = count_paths(layered, 's', 't')
+    print(f"\n测试3 - {layers}层×{width}宽的分层DAG s→t:")
+    print(f"  路径数 = 10^{len(str(total)) - 1}，精确值共 {len(str(total))} 位")
+    sample = sample_paths(layered, 's', 't', 1, seed=42)[0]
+    print(f"  随机抽取一条，长度 {len(sample)}，前5个节点: {sample[:5]}")
+
+    # 抽样均匀性检查：每条路径被抽中的频率应该接近 1/4
+    print("\n测试4 - 均匀性检查 A→G 抽样60000次:")
+    freq = Counter(tuple(p) for p in sample_paths(directed_graph4, 'A', 'G', 60000, seed=7))
+    for path, c in sorted(freq.items()):
+        print(f"  {' → '.join(path)}: {c / 60000:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+from array import array
+
+
+class PathTrie:
+    """
+    用前缀树（父指针数组）紧凑存储一批路径
+
+    List[List[node]] 中每条路径都是完整的一份拷贝；而DFS按字典序产出的路径，
+    相邻路径往往共享很长的前缀。前缀树里共享的前缀只存一次：
+
+        parent[i]  - 第i个树节点的父节点编号，根为 -1
+        label[i]   - 第i个树节点对应的图节点（labels中的编号）
+        ends[j]    - 第j条路径最后一个节点对应的树节点编号
+
+    每个树节点只占两个int（8字节），取第j条路径只需沿父指针走 O(路径长度) 步。
+    """
+
+    __slots__ = ("labels", "_index", "parent", "label", "ends", "_last_nodes", "_last_path")
+
+    def __init__(self):
+        self.labels = []            # 编号 -> 图节点标签
+        self._index = {}            # 图节点标签 -> 编号
+        self.parent = array("i")
+        self.label = array("i")
+        self.ends = array("i")
+        # 上一条路径的标签和对应的树节点，用于和新路径求公共前缀
+        self._last_path = []
+        self._last_nodes = []
+
+    @classmethod
+    def from_paths(cls, paths):
+        """
+        从路径迭代器构建
+
+        输入按DFS顺序（各个 iter_paths_* 的输出顺序）时，新路径与所有旧路径的最长公共前缀
+        一定就是与上一条路径的公共前缀，所以只需和上一条比较，得到的树是最紧凑的。
+        其他顺序也能正确构建，只是共享会少一些。
+        """
+        trie = cls()
+        for path in paths:
+            trie.add(path)
+        return trie
+
+    def add(self, path):
+        """追加一条路径"""
+        last_path, last_nodes = self._last_path, self._last_nodes
+        common = 0
+        limit = min(len(path), len(last_path))
+        while common < limit and path[common] == last_path[common]:
+            common += 1
+        del last_nodes[common:]
+        if common == len(path) and common > 0:
+            # 新路径是上一条路径的前缀（或者完全相同），直接复用已有的树节点
+            self.ends.append(last_nodes[-1])
+            self._last_path = list(path)
+            return
+
+        node = last_nodes[-1] if last_nodes else -1
+        parent, label, index, labels = self.parent, self.label, self._index, self.labels
+        for v in path[common:]:
+            i = index.get(v)
+            if i is None:
+                i = index[v] = len(labels)
+                labels.append(v)
+            parent.append(node)
+            label.append(i)
+            node = len(parent) - 1
+            last_nodes.append(node)
+
+        self.ends.append(node)
+        self._last_path = list(path)
+
+    def __len__(self):
+        return len(self.ends)
+
+    def __getitem__(self, j):
+        """第j条路径，支持负数下标"""
+        if j < 0:
+            j += len(self.ends)
+        if not 0 <= j < len(self.ends):
+            raise IndexError("path index out of range")
+        parent, label, labels = self.parent, self.label, self.labels
+        path = []
+        node = self.ends[j]
+        while node != -1:
+            path.append(labels[label[node]])
+            node = parent[node]
+        path.reverse()
+        return path
+
+    def __iter__(self):
+        for j in range(len(self.ends)):
+            yield self[j]
+
+    @property
+    def num_trie_nodes(self):
+        return len(self.parent)
+
+    def nbytes(self):
+        """父指针数组占用的字节数（不含labels列表本身）"""
+        return (self.parent.itemsize * len(self.parent)
+                + self.label.itemsize * len(self.label)
+                + self.ends.itemsize * len(self.ends))
+
+    def to_arrays(self):
+        """
+        展开成扁平数组，便于写文件或交给NumPy
+
+        Returns:
+            (offsets, nodes, labels)：
+                offsets - array('i')，长度为路径数+1，第j条路径是 nodes[offsets[j]:offsets[j+1]]
+                nodes   - array('q')，所有路径的节点编号首尾相接
+                labels  - 编号 -> 图节点标签
+        """
+        parent, label = self.parent, self.label
+        depth = array("i", [0]) * len(parent)
+        for i in range(len(parent)):
+            # 父节点编号总是小于子节点编号，所以可以顺序计算深度
+            p = parent[i]
+            depth[i] = 1 if p == -1 else depth[p] + 1
+
+        offsets = array("i", [0])
+        total = 0
+        for end in self.ends:
+            total += depth[end]
+            offsets.append(total)
+
+        nodes = array("q", [0]) * total
+        for j, end in enumerate(self.ends):
+            k = offsets[j + 1]
+            node = end
+            while node != -1:
+                k -= 1
+                nodes[k] = label[node]
+                node = parent[node]
+        return offsets, nodes, list(self.labels)
+
+    def __repr__(self):
+        return f"PathTrie(paths={len(self)}, trie_nodes={self.num_trie_nodes})"
+
+
+def main():
+    import tracemalloc
+    from .undirected_all_paths_source_target import all_paths_undirected_optimized
+    from .workloads import grid_graph
+
+    grid3 = grid_graph(3, 3)
+    paths = all_paths_undirected_optimized(grid3, 0, 8)
+    trie = all_paths_undirected_optimized(grid3, 0, 8, as_trie=True)
+    print(f"3x3网格图 0→8: {trie}")
+    print(f"  迭代结果一致: {list(trie) == paths}")
+    print(f"  trie[3] = {trie[3]}, trie[-1] = {trie[-1]}")
+    offsets, nodes, labels = trie.to_arrays()
+    print(f"  扁平数组: offsets长度 {len(offsets)}, nodes长度 {len(nodes)}")
+
+    print("\n内存对比（tracemalloc统计的结果集峰值）:")
+    for rows, cols in [(4, 4), (5, 5)]:
+        graph = grid_graph(rows, cols)
+        target = rows * cols - 1
+
+        tracemalloc.start()
+        paths = all_paths_undirected_optimized(graph, 0, target)
+        list_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        trie = all_paths_undirected_optimized(graph, 0, target, as_trie=True)
+        trie_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        assert list(trie) == paths
+        print(f"  {rows}x{cols}网格: {len(paths):>6d} 条路径, "
+              f"List[List] {list_bytes / 1024:>8.1f} KB, "
+              f"PathTrie {trie_bytes / 1024:>7.1f} KB ({list_bytes / trie_bytes:.1f}x), "
+              f"树节点 {trie.num_trie_nodes} / 路径节点总数 {sum(map(len, paths))}")
+
+
+if __name__ == "__main__":
+    main()
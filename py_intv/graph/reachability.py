@@ -0,0 +1,221 @@
+from collections import deque
+
+from .csr_graph import CSRGraph
+
+
+def nodes_reaching(csr, t):
+    """
+    有向图：反向BFS，找出所有能到达t的节点
+
+    一个节点如果到不了target，从它出发的整棵DFS子树都不可能产生路径，
+    搜索时可以直接跳过。
+
+    Args:
+        csr: CSRGraph
+        t: int - 目标节点的整数编号
+
+    Returns:
+        bytearray - mask[v] == 1 表示v能到达t
+    """
+    n = csr.num_nodes
+    offsets, targets = csr.offsets, csr.targets
+
+    # 构建反向图的CSR（计数排序）
+    rev_offsets = [0] * (n + 1)
+    for v in targets:
+        rev_offsets[v + 1] += 1
+    for i in range(n):
+        rev_offsets[i + 1] += rev_offsets[i]
+    cursor = rev_offsets[:n]
+    rev_targets = [0] * len(targets)
+    for u in range(n):
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            rev_targets[cursor[v]] = u
+            cursor[v] += 1
+
+    mask = bytearray(n)
+    mask[t] = 1
+    queue = deque([t])
+    while queue:
+        v = queue.popleft()
+        for k in range(rev_offsets[v], rev_offsets[v + 1]):
+            u = rev_targets[k]
+            if not mask[u]:
+                mask[u] = 1
+                queue.append(u)
+    return mask
+
+
+def simple_path_nodes(csr, s, t):
+    """
+    无向图：找出所有可能出现在某条 s-t 简单路径上的节点
+
+    无向连通图里"能到达t"没有区分度，需要用双连通分量（block）分析：
+    把图分解成块，块和顶点组成一棵块-割点树（block-cut tree）。
+    节点v在某条 s-t 简单路径上，当且仅当v所在的某个块位于树上 s 到 t 的路径上。
+    其余的块都是"死胡同"：进去以后只能从同一个割点出来，而割点已经在路径上了。
+
+    时间复杂度：O(V + E)
+
+    Args:
+        csr: CSRGraph（邻接关系需要是对称的）
+        s: int - 起始节点的整数编号
+        t: int - 目标节点的整数编号
+
+    Returns:
+        bytearray - mask[v] == 1 表示v可能在某条简单路径上
+    """
+    n = csr.num_nodes
+    mask = bytearray(n)
+    if s == t:
+        mask[s] = 1
+        return mask
+
+    blocks = _biconnected_blocks(csr, s)
+
+    # 顶点-块关联图（连通图上它就是块-割点树），在上面BFS找 s 到 t 的唯一路径
+    # 块用编号 n + i 表示，和顶点编号区分开
+    vertex_blocks = {}
+    for i, block in enumerate(blocks):
+        for v in block:
+            vertex_blocks.setdefault(v, []).append(n + i)
+    if t not in vertex_blocks:
+        return mask  # t 和 s 不连通
+
+    parent = {s: None}
+    queue = deque([s])
+    while queue and t not in parent:
+        x = queue.popleft()
+        nxt = blocks[x - n] if x >= n else vertex_blocks[x]
+        for y in nxt:
+            if y not in parent:
+                parent[y] = x
+                queue.append(y)
+
+    x = t
+    while x is not None:
+        if x >= n:
+            for v in blocks[x - n]:
+                mask[v] = 1
+        x = parent[x]
+    return mask
+
+
+def _biconnected_blocks(csr, root):
+    """
+    Tarjan算法（迭代版）求root所在连通分量的所有双连通块
+
+    Returns:
+        List[List[int]] - 每个块包含的顶点编号，割点会出现在多个块里
+    """
+    n = csr.num_nodes
+    offsets, targets = csr.offsets, csr.targets
+    disc = [-1] * n
+    low = [0] * n
+    blocks = []
+    vertex_stack = [root]
+    disc[root] = low[root] = 0
+    timer = 1
+
+    # 栈帧：[节点, 父节点, 下一条待检查的边, 是否已经跳过了一次父边]
+    stack = [[root, -1, offsets[root], False]]
+    while stack:
+        frame = stack[-1]
+        u, parent, k, skipped = frame
+        if k < offsets[u + 1]:
+            frame[2] = k + 1
+            v = targets[k]
+            if v == parent and not skipped:
+                # 只跳过一次，这样重边仍然算作回边
+                frame[3] = True
+                continue
+            if disc[v] == -1:
+                disc[v] = low[v] = timer
+                timer += 1
+                vertex_stack.append(v)
+                stack.append([v, u, offsets[v], False])
+            elif disc[v] < low[u]:
+                low[u] = disc[v]
+            continue
+
+        stack.pop()
+        if parent == -1:
+            continue
+        if low[u] < low[parent]:
+            low[parent] = low[u]
+        if low[u] >= disc[parent]:
+            # parent 是割点（或根），弹出以u为根的子树，和parent一起组成一个块
+            block = [parent]
+            while True:
+                w = vertex_stack.pop()
+                block.append(w)
+                if w == u:
+                    break
+            blocks.append(block)
+    return blocks
+
+
+def pruning_mask(csr, s, t, directed=None):
+    """
+    根据图的类型选择剪枝方式，返回允许访问的节点掩码
+
+    Args:
+        directed: None 表示使用 csr.directed
+    """
+    if directed is None:
+        directed = csr.directed
+    if directed:
+        return nodes_reaching(csr, t)
+    return simple_path_nodes(csr, s, t)
+
+
+def prune_adjacency(graph, source, target, directed=True):
+    """
+    对 Dict[node, List[node]] 格式的图剪枝，删掉不可能出现在 source→target 路径上的节点
+
+    邻居的相对顺序保持不变，所以在剪枝后的图上搜索，路径顺序与原图一致。
+
+    Returns:
+        Dict[node, List[node]] - 只包含有用节点的邻接表
+    """
+    csr = CSRGraph.from_adjacency(graph, directed=directed)
+    if source not in csr or target not in csr:
+        return {}
+    mask = pruning_mask(csr, csr.index[source], csr.index[target])
+    keep = {label for label, ok in zip(csr.labels, mask) if ok}
+    return {
+        u: [v for v in graph.get(u, []) if v in keep]
+        for u in csr.labels if u in keep
+    }
+
+
+def main():
+    from .directed_all_paths_source_target import iter_paths_directed
+    from .undirected_all_paths_source_target import iter_paths_undirected
+    from .workloads import CountingAdjacency, gnp_random_graph, grid_graph, random_dag
+
+    def compare(name, graph, source, target, directed):
+        search = iter_paths_directed if directed else iter_paths_undirected
+        full = CountingAdjacency(graph)
+        paths_full = list(search(full, source, target))
+        pruned = CountingAdjacency(prune_adjacency(graph, source, target, directed))
+        paths_pruned = list(search(pruned, source, target))
+        assert paths_full == paths_pruned
+        ratio = full.visits / max(pruned.visits, 1)
+        print(f"{name:<32s} 路径 {len(paths_full):>7d}  "
+              f"访问节点 {full.visits:>9d} → {pruned.visits:>9d}  ({ratio:.1f}x)")
+
+    print("剪枝前后DFS展开节点数对比")
+    print("=" * 80)
+    compare("有向随机DAG n=40 p=0.2 0→20", random_dag(40, 0.2, seed=1), 0, 20, True)
+    compare("有向随机DAG n=40 p=0.2 0→25", random_dag(40, 0.2, seed=2), 0, 25, True)
+    compare("有向网格 7x7 0→24 (目标在中间)", grid_graph(7, 7, directed=True), 0, 24, True)
+    compare("无向随机图 n=40 p=0.07 seed=2", gnp_random_graph(40, 0.07, seed=2), 0, 20, False)
+    compare("无向随机图 n=40 p=0.07 seed=3", gnp_random_graph(40, 0.07, seed=3), 0, 20, False)
+    # 网格本身是双连通的，没有死胡同可剪，展开节点数不变
+    compare("无向网格 4x4 0→15", grid_graph(4, 4), 0, 15, False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+from .. import instrumentation
+from .csr_graph import CSRGraph, CountingPath, DFSMetrics, iter_paths_csr
+from .path_trie import PathTrie
+from .reachability import pruning_mask, prune_adjacency
+
+_REGISTRY = instrumentation.REGISTRY
+_RECURSIVE_METRICS = DFSMetrics("all_paths_undirected")
+_OPTIMIZED_METRICS = DFSMetrics("all_paths_undirected_optimized")
+_ITER_METRICS = DFSMetrics("iter_paths_undirected")
+
+
+def all_paths_undirected(graph, source, target, prune=False, as_trie=False):
+    """
+    在无向图中找到从source到target的所有路径
+    
+    Args:
+        graph: Dict[int, List[int]] 或 CSRGraph - 邻接表表示的无向图
+        source: int - 起始节点
+        target: int - 目标节点
+        prune: 是否先用双连通分量分析剪掉不可能在简单路径上的节点
+        as_trie: 为True时返回共享前缀的 PathTrie，而不是 List[List[int]]
+    
+    Returns:
+        List[List[int]] - 所有从source到target的路径
+    """
+    if as_trie:
+        return PathTrie.from_paths(iter_paths_undirected(graph, source, target, prune=prune))
+    if isinstance(graph, CSRGraph):
+        return list(iter_paths_undirected(graph, source, target, prune=prune))
+    if prune:
+        graph = prune_adjacency(graph, source, target, directed=False)
+
+    results = []
+    
+    def dfs(current, path, parent):
+        # 到达目标节点，记录当前路径
+        if current == target:
+            results.append(path.copy())  # 重要：使用copy()避免引用问题
+            return
+        
+        # 遍历当前节点的所有邻居
+        for neighbor in graph.get(current, []):
+            # 避免立即回到父节点（无向图特有）
+            if neighbor == parent:
+                continue
+            
+            # 避免环路：如果邻居已在当前路径中，跳过
+            if neighbor in path:
+                continue
+            
+            # 回溯算法：添加邻居到路径，递归探索，然后移除
+            path.append(neighbor)
+            dfs(neighbor, path, current)  # 当前节点成为下一层的父节点
+            path.pop()  # 回溯：移除刚添加的节点
+    
+    # 从source开始DFS，初始路径包含source，初始parent为-1（表示无父节点）
+    enabled = _REGISTRY.enabled
+    path = CountingPath([source]) if enabled else [source]
+    dfs(source, path, -1)
+    if enabled:
+        _RECURSIVE_METRICS.record_path(path, len(results), recursive=True)
+    return results
+
+
+# 性能优化版本（使用set代替list的in操作）
+def all_paths_undirected_optimized(graph, source, target, prune=False, as_trie=False):
+    """
+    无向图路径查找的性能优化版本
+    使用set来提高visited检查的效率
+    传入CSRGraph时改用bytearray掩码，避免对节点标签做哈希
+    prune=True 时先用双连通分量分析剪掉不可能在简单路径上的节点
+    as_trie=True 时返回共享前缀的 PathTrie，内存占用小一个数量级
+    """
+    if as_trie:
+        return PathTrie.from_paths(iter_paths_undirected(graph, source, target, prune=prune))
+    if isinstance(graph, CSRGraph):
+        return list(iter_paths_undirected(graph, source, target, prune=prune))
+    if prune:
+        graph = prune_adjacency(graph, source, target, directed=False)
+
+    results = []
+    
+    def dfs(current, path, visited, parent):
+        if current == target:
+            results.append(path.copy())
+            return
+        
+        for neighbor in graph.get(current, []):
+            if neighbor == parent or neighbor in visited:
+                continue
+            
+            path.append(neighbor)
+            visited.add(neighbor)
+            dfs(neighbor, path, visited, current)
+            path.pop()
+            visited.remove(neighbor)
+    
+    enabled = _REGISTRY.enabled
+    path = CountingPath([source]) if enabled else [source]
+    dfs(source, path, {source}, -1)
+    if enabled:
+        _OPTIMIZED_METRICS.record_path(path, len(results), recursive=True)
+    return results
+
+
+_EXHAUSTED = object()
+
+
+def iter_paths_undirected(graph, source, target, max_paths=None, max_depth=None, cancel=None,
+                          prune=False):
+    """
+    all_paths_undirected_optimized 的惰性迭代版本：显式栈 + visited集合，逐条yield路径
+
+    无向图的 "不回到父节点" 已经被 visited 覆盖（父节点一定在当前路径上），
+    所以不需要单独传递parent。不会触发 RecursionError，额外空间只有 O(路径深度)。
+
+    Args:
+        graph: Dict[int, List[int]] 或 CSRGraph - 邻接表表示的无向图
+        source: int - 起始节点
+        target: int - 目标节点
+        max_paths: 最多生成多少条路径，None表示不限制
+        max_depth: 路径最多包含多少条边，None表示不限制
+        cancel: 可选的 threading.Event，被set后停止枚举
+        prune: 是否先用双连通分量分析剪掉不可能在简单路径上的节点
+
+    Yields:
+        List[int] - 一条从source到target的路径，顺序与 all_paths_undirected 一致
+    """
+    if isinstance(graph, CSRGraph):
+        allowed = None
+        if prune and source in graph and target in graph:
+            allowed = pruning_mask(graph, graph.index[source], graph.index[target],
+                                   directed=False)
+        yield from iter_paths_csr(graph, source, target, max_paths, max_depth, cancel, allowed)
+        return
+    if prune:
+        graph = prune_adjacency(graph, source, target, directed=False)
+
+    if max_paths is not None and max_paths <= 0:
+        return
+    if source == target:
+        yield [source]
+        return
+
+    enabled = _REGISTRY.enabled
+    path = CountingPath([source]) if enabled else [source]
+    visited = {source}
+    stack = [iter(graph.get(source, []))]
+    count = 0
+
+    try:
+        while stack:
+            if cancel is not None and cancel.is_set():
+                return
+
+            neighbor = next(stack[-1], _EXHAUSTED)
+            if neighbor is _EXHAUSTED:
+                stack.pop()
+                visited.discard(path.pop())
+                continue
+
+            if neighbor in visited:
+                continue
+
+            if neighbor == target:
+                if max_depth is None or len(path) <= max_depth:
+                    count += 1   # 先计数：消费者在yield处close()时这条路径也已经交付
+                    yield path + [neighbor]
+                    if count == max_paths:
+                        return
+            elif max_depth is None or len(path) < max_depth:
+                path.append(neighbor)
+                visited.add(neighbor)
+                stack.append(iter(graph.get(neighbor, [])))
+    finally:
+        if enabled:
+            _ITER_METRICS.record_path(path, count)
+
+
+# 测试代码和示例
+def main():
+    # 测试例1：经典4节点无向图
+    undirected_graph1 = {
+        0: [1, 2],
+        1: [0, 2, 3],  # 无向图：每条边都是双向的
+        2: [0, 1, 3],
+        3: [1, 2]
+    }
+
+    print("测试1 - 经典无向图 0→3 的所有路径:")
+    paths1 = all_paths_undirected(undirected_graph1, 0, 3)
+    for i, path in enumerate(paths1, 1):
+        print(f"  路径{i}: {' - '.join(map(str, path))}")
+    print(f"总共找到 {len(paths1)} 条路径")
+    print("预期: 4条路径 [0,1,3], [0,1,2,3], [0,2,1,3], [0,2,3]\n")
+
+    # 测试例2：更复杂的网格状无向图
+    grid_graph = {
+        0: [1, 3],
+        1: [0, 2, 4],
+        2: [1, 5],
+        3: [0, 4, 6],
+        4: [1, 3, 5, 7],
+        5: [2, 4, 8],
+        6: [3, 7],
+        7: [4, 6, 8],
+        8: [5, 7]
+    }
+
+    print("测试2 - 3x3网格图 0→8 的所有路径:")
+    paths2 = all_paths_undirected(grid_graph, 0, 8)
+    for i, path in enumerate(paths2, 1):
+        print(f"  路径{i}: {' - '.join(map(str, path))}")
+    print(f"总共找到 {len(paths2)} 条路径\n")
+
+    # 测试例3：线性链状图
+    chain_graph = {
+        0: [1],
+        1: [0, 2],
+        2: [1, 3],
+        3: [2, 4],
+        4: [3]
+    }
+
+    print("测试3 - 链状图 0→4 的所有路径:")
+    paths3 = all_paths_undirected(chain_graph, 0, 4)
+    for i, path in enumerate(paths3, 1):
+        print(f"  路径{i}: {' - '.join(map(str, path))}")
+    print(f"总共找到 {len(paths3)} 条路径（应该只有1条）\n")
+
+    # 测试例4：字符节点图
+    char_graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D'],
+        'C': ['A', 'D', 'E'],
+        'D': ['B', 'C', 'E'],
+        'E': ['C', 'D']
+    }
+
+    print("测试4 - 字符节点图 A→E 的所有路径:")
+    paths4 = all_paths_undirected(char_graph, 'A', 'E')
+    for i, path in enumerate(paths4, 1):
+        print(f"  路径{i}: {' - '.join(path)}")
+    print(f"总共找到 {len(paths4)} 条路径\n")
+
+    # 结果一致性检查（性能对比见 benchmark_all_paths.py，4节点的图单次计时没有意义）
+    print("结果一致性检查 - 使用相同的图:")
+    paths_standard = all_paths_undirected(undirected_graph1, 0, 3)
+    paths_optimized = all_paths_undirected_optimized(undirected_graph1, 0, 3)
+    print(f"结果一致: {paths_standard == paths_optimized}")
+
+    csr_grid = CSRGraph.from_adjacency(grid_graph, directed=False)
+    paths_csr = all_paths_undirected_optimized(csr_grid, 0, 8)
+    print(f"CSR版本: {len(paths_csr)} 条路径, 与dict版本一致: "
+          f"{paths_csr == all_paths_undirected_optimized(grid_graph, 0, 8)}")
+
+    # 惰性迭代版本：逐条生成，可以随时停止
+    print("\n迭代版本 - 3x3网格图 0→8:")
+    print(f"与递归版本一致: {list(iter_paths_undirected(grid_graph, 0, 8)) == paths2}")
+    print(f"前3条: {list(iter_paths_undirected(grid_graph, 0, 8, max_paths=3))}")
+    print(f"不超过4条边: {list(iter_paths_undirected(grid_graph, 0, 8, max_depth=4))}")
+
+    # 展示错误用法的对比
+    print("\n" + "="*50)
+    print("错误示例：用有向图算法处理无向图")
+
+    def all_paths_directed(graph, source, target):
+        """有向图算法（错误地用于无向图）"""
+        results = []
+        def dfs(cur, path):
+            if cur == target:
+                results.append(path.copy())
+                return
+            for nei in graph.get(cur, []):
+                if nei in path:
+                    continue
+                path.append(nei)
+                dfs(nei, path)
+                path.pop()
+        dfs(source, [source])
+        return results
+
+    wrong_paths = all_paths_directed(undirected_graph1, 0, 3)
+    correct_paths = all_paths_undirected(undirected_graph1, 0, 3)
+
+    print(f"❌ 错误方法找到: {len(wrong_paths)} 条路径")
+    print(f"✅ 正确方法找到: {len(correct_paths)} 条路径")
+    print("差异说明：有向图算法无法正确处理无向图的双向边特性")
+
+
+if __name__ == "__main__":
+    main()
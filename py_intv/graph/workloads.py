@@ -0,0 +1,123 @@
+import random
+
+
+def grid_graph(rows, cols, directed=False):
+    """
+    rows x cols 网格图，节点编号 r * cols + c
+
+    无向时邻居按编号升序（上、左、右、下）；有向时只有向右、向下的边，是一个DAG。
+    """
+    graph = {}
+    for r in range(rows):
+        for c in range(cols):
+            u = r * cols + c
+            nbrs = []
+            if not directed and r > 0:
+                nbrs.append(u - cols)
+            if not directed and c > 0:
+                nbrs.append(u - 1)
+            if c + 1 < cols:
+                nbrs.append(u + 1)
+            if r + 1 < rows:
+                nbrs.append(u + cols)
+            graph[u] = nbrs
+    return graph
+
+
+def gnp_random_graph(n, p, seed=None, directed=False):
+    """
+    Erdős–Rényi G(n, p) 随机图：每条可能的边独立地以概率p出现
+
+    有向时 u→v 和 v→u 分别独立抽样（可能有环）。
+    """
+    rng = random.Random(seed)
+    graph = {i: [] for i in range(n)}
+    for u in range(n):
+        for v in range(n) if directed else range(u + 1, n):
+            if u != v and rng.random() < p:
+                graph[u].append(v)
+                if not directed:
+                    graph[v].append(u)
+    return graph
+
+
+def random_dag(n, p, seed=None):
+    """随机DAG：只对 u < v 的节点对以概率p连 u→v，类似依赖图"""
+    rng = random.Random(seed)
+    graph = {i: [] for i in range(n)}
+    for u in range(n):
+        for v in range(u + 1, n):
+            if rng.random() < p:
+                graph[u].append(v)
+    return graph
+
+
+def layered_dag(layers, width, p=1.0, seed=None):
+    """
+    分层DAG：源点0 → layers层、每层width个节点 → 汇点
+
+    相邻层之间每条边以概率p出现（p=1时全连接，共 width^layers 条路径）。
+    为了保证源点能到达汇点，每个节点至少保留一条到下一层的边。
+    """
+    rng = random.Random(seed)
+    sink = layers * width + 1
+    graph = {0: list(range(1, width + 1))}
+    for layer in range(layers):
+        base = 1 + layer * width
+        nxt = [base + width + j for j in range(width)] if layer + 1 < layers else [sink]
+        for i in range(width):
+            nbrs = [v for v in nxt if p >= 1.0 or rng.random() < p]
+            graph[base + i] = nbrs or [rng.choice(nxt)]
+    graph[sink] = []
+    return graph
+
+
+def complete_graph(n):
+    """n个节点的完全图（团）"""
+    return {u: [v for v in range(n) if v != u] for u in range(n)}
+
+
+def chain_graph(n, directed=False):
+    """长度为n的链 0 - 1 - ... - (n-1)"""
+    graph = {}
+    for u in range(n):
+        nbrs = []
+        if not directed and u > 0:
+            nbrs.append(u - 1)
+        if u + 1 < n:
+            nbrs.append(u + 1)
+        graph[u] = nbrs
+    return graph
+
+
+# 名字 -> (生成函数(size, seed) -> 图, 是否有向)
+# 所有工作负载的节点都是 0..n-1 的整数，查询固定为 0 → 最大编号
+WORKLOADS = {
+    "grid": (lambda size, seed: grid_graph(size, size), False),
+    "gnp": (lambda size, seed: gnp_random_graph(size, 0.3, seed), False),
+    "dag_layers": (lambda size, seed: layered_dag(size, 4, 0.75, seed), True),
+    "clique": (lambda size, seed: complete_graph(size), False),
+    "chain": (lambda size, seed: chain_graph(size), False),
+}
+
+
+def make_workload(name, size, seed=0):
+    """
+    生成一个工作负载
+
+    Returns:
+        (graph, source, target, directed)
+    """
+    factory, directed = WORKLOADS[name]
+    graph = factory(size, seed)
+    return graph, 0, max(graph), directed
+
+
+class CountingAdjacency(dict):
+    """统计 get() 调用次数的邻接表，每次调用对应DFS展开一个节点"""
+
+    visits = 0
+
+    def get(self, key, default=None):
+        self.visits += 1
+        return super().get(key, default)
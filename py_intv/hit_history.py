@@ -0,0 +1,223 @@
+from array import array
+
+from .fenwick_tree import FenwickTree
+
+
+class _Level:
+    """一个精度层：从start开始、每res秒一个桶的连续计数，外加树状数组索引"""
+
+    __slots__ = ("res", "retention", "start", "counts", "bit")
+
+    def __init__(self, res, retention, start):
+        self.res = res
+        self.retention = retention
+        self.start = start
+        self.counts = array("q")
+        self.bit = FenwickTree(0)
+
+    @property
+    def end(self):
+        return self.start + len(self.counts) * self.res
+
+    def add(self, timestamp, count):
+        """timestamp 必须 >= start；超过末尾时先批量追加空桶（长时间没有访问时不逐个追加）"""
+        i = (timestamp - self.start) // self.res
+        missing = i + 1 - len(self.counts)
+        if missing > 0:
+            self.counts.extend(array("q", [0]) * missing)
+            self.bit.extend_zeros(missing)
+        self.counts[i] += count
+        self.bit.add(i, count)
+
+    def sum_between(self, t1, t2):
+        """起始时间落在 [t1, t2) 内的桶的计数之和"""
+        n = len(self.counts)
+        lo = min(n, max(0, -((self.start - t1) // self.res)))     # ceil((t1 - start) / res)
+        hi = min(n, max(0, -((self.start - t2) // self.res)))
+        return self.bit.range_sum(lo, hi) if lo < hi else 0
+
+    def drop_front(self, k):
+        """删掉最早的k个桶，重建索引 O(n)；由于每次至少删掉一半，均摊 O(1)"""
+        self.counts = self.counts[k:]
+        # 访问稀疏时留下的往往全是空桶，不用逐个建树
+        if any(self.counts):
+            self.bit = FenwickTree.from_values(self.counts)
+        else:
+            self.bit = FenwickTree(len(self.counts))
+        self.start += k * self.res
+
+
+class HitHistory:
+    """
+    只追加、按时间索引的访问记录，数据变旧后压缩成更粗的桶
+
+    默认三个精度层，越旧的数据越粗：
+        秒级 - 最近1小时
+        分钟级 - 最近1天
+        小时级 - 更早的全部数据（不再压缩）
+
+    每一层是连续的计数数组 + 树状数组，层与层首尾相接：
+        [小时级 start ........ ) [分钟级 start .... ) [秒级 start ... 当前)
+    某一层覆盖的时间超过 2 * retention 时，把最早的一半按下一层的精度合并过去，
+    所以每层的桶数有上界，压缩的代价均摊到每个桶是 O(1)。
+
+    hits_between(t1, t2) 在每一层上各做一次树状数组区间求和，O(层数 * log n)。
+    已经压缩过的时间段只能按桶的精度回答：桶的起始时间落在 [t1, t2) 内就计入。
+    允许迟到的时间戳（多线程下很常见），hit 从不因为时间戳太旧而报错：
+    起点比第一个时间戳往前多留一个最粗精度的桶，一小时内迟到的访问仍按秒级精确记录；
+    更早的时间戳并入最早的那个桶（按最粗精度计）。
+    """
+
+    DEFAULT_LEVELS = ((1, 3600), (60, 86400), (3600, None))
+
+    def __init__(self, levels=DEFAULT_LEVELS):
+        for (res, _), (coarser, _) in zip(levels, levels[1:]):
+            if coarser % res:
+                raise ValueError("each resolution must divide the next one")
+        self._config = levels
+        self.levels = None          # levels[0] 最细；首次 hit 时按时间戳初始化
+
+    def hit(self, timestamp: int, count: int = 1) -> None:
+        levels = self.levels
+        if levels is None:
+            # 所有层的起点对齐到最粗的精度，再往前留一个桶：
+            # 刚过整点就先到了一个时间戳，之后迟到的上一小时的访问也有桶可放
+            top = self._config[-1][0]
+            start = timestamp - timestamp % top - top
+            levels = self.levels = [_Level(res, retention, start) for res, retention in self._config]
+
+        finest = levels[0]
+        if timestamp >= finest.start:
+            if timestamp - finest.start >= 2 * finest.retention:
+                self._compact(0, timestamp - finest.retention)
+            finest.add(timestamp, count)
+            return
+        for level in levels[1:]:
+            if timestamp >= level.start:
+                level.add(timestamp, count)
+                return
+        # 比所有数据都早：并入最早的桶，不丢计数也不报错
+        oldest = levels[-1]
+        oldest.add(oldest.start, count)
+
+    def _compact(self, k, boundary):
+        """
+        把第k层中早于boundary的桶合并到第k+1层，boundary向下对齐到第k+1层的精度
+
+        boundary 可以超过第k层的末尾（长时间没有访问），超出的部分视为空桶。
+        """
+        level, coarser = self.levels[k], self.levels[k + 1]
+        boundary -= boundary % coarser.res
+        if boundary <= level.start:
+            return
+        moved = min(len(level.counts), (boundary - level.start) // level.res)
+        # coarser 的末尾正好是 level.start（两者都对齐到 coarser.res），
+        # 每 ratio 个细桶切片求和后合并成一个粗桶，空的粗桶不逐个写入
+        counts, ratio = level.counts, coarser.res // level.res
+        for i in range(0, moved, ratio):
+            count = sum(counts[i:min(i + ratio, moved)])
+            if count:
+                coarser.add(level.start + i * level.res, count)
+        if coarser.end < boundary:
+            coarser.add(boundary - coarser.res, 0)
+        level.drop_front(moved)
+        level.start = boundary
+
+        if coarser.retention is not None and coarser.end - coarser.start >= 2 * coarser.retention:
+            self._compact(k + 1, coarser.end - coarser.retention)
+
+    def hits_between(self, t1: int, t2: int) -> int:
+        """时间戳在 [t1, t2) 内的访问次数（已压缩的时间段按桶精度计算）"""
+        if self.levels is None or t1 >= t2:
+            return 0
+        return sum(level.sum_between(t1, t2) for level in self.levels)
+
+    def total(self) -> int:
+        return 0 if self.levels is None else sum(level.bit.total() for level in self.levels)
+
+    def num_buckets(self) -> int:
+        return 0 if self.levels is None else sum(len(level.counts) for level in self.levels)
+
+
+# 测试用例
+def test_hit_history():
+    import random
+    rng = random.Random(0)
+    history = HitHistory(levels=((1, 60), (10, 600), (100, None)))
+    hits = []
+    t = 1_000_000
+    for _ in range(30_000):
+        t += rng.choice((0, 0, 1, 1, 2, 5, 40))
+        ts = max(t - rng.randrange(3), hits[0] if hits else t)    # 偶尔有迟到的时间戳
+        history.hit(ts)
+        hits.append(ts)
+    assert history.total() == len(hits)
+
+    finest = history.levels[0]
+    # 秒级层覆盖的区间是精确的
+    for _ in range(200):
+        t1 = rng.randrange(finest.start, t + 1)
+        t2 = rng.randrange(t1, t + 2)
+        assert history.hits_between(t1, t2) == sum(t1 <= h < t2 for h in hits)
+    # 对齐到最粗精度的区间在所有层上都是精确的
+    top = history.levels[-1].res
+    for _ in range(200):
+        t1 = rng.randrange(hits[0], t) // top * top
+        t2 = rng.randrange(t1, t + top) // top * top
+        assert history.hits_between(t1, t2) == sum(t1 <= h < t2 for h in hits)
+    assert history.num_buckets() < (t - hits[0]) // 10
+
+    # 回归：刚过整点的第一个时间戳之后，迟到的上一小时的访问不能报错，也要按秒精确记录
+    late = HitHistory()
+    late.hit(7200)
+    late.hit(7199)
+    late.hit(3600)
+    assert late.hits_between(7199, 7200) == 1 and late.hits_between(0, 8000) == 3
+    # 更早的时间戳并入最早的桶，总数不丢
+    late.hit(5)
+    assert late.total() == 4 and late.hits_between(0, 8000) == 4
+
+    # 稀疏、跳跃的时间戳：间隔远超各层保留时长，空桶批量补齐，结果仍然精确
+    sparse = HitHistory(levels=((1, 60), (10, 600), (100, None)))
+    stamps = []
+    t = 1_000_000
+    for _ in range(2_000):
+        t += rng.choice((1, 7, 130, 1_299, 5_000))
+        sparse.hit(t)
+        stamps.append(t)
+    assert sparse.total() == len(stamps)
+    for _ in range(200):
+        t1 = rng.randrange(stamps[0], t) // top * top
+        t2 = rng.randrange(t1, t + top) // top * top
+        assert sparse.hits_between(t1, t2) == sum(t1 <= h < t2 for h in stamps)
+    print("HitHistory 测试通过!")
+
+
+def main():
+    import time
+
+    test_hit_history()
+
+    # 模拟7天、平均每秒约3次访问，然后查询任意历史区间
+    history = HitHistory()
+    start_ts = 1_700_000_000
+    days = 7
+    build = time.perf_counter()
+    for ts in range(start_ts, start_ts + days * 86400):
+        history.hit(ts, 1 + ts % 5)
+    build = time.perf_counter() - build
+    now = start_ts + days * 86400
+
+    queries = [(start_ts + i * 3600, start_ts + i * 3600 + 7200) for i in range(days * 24 - 2)]
+    begin = time.perf_counter()
+    for t1, t2 in queries:
+        history.hits_between(t1, t2)
+    per_query = (time.perf_counter() - begin) / len(queries) * 1e6
+    print(f"\n{days}天数据: 写入 {days * 86400:,} 秒用时 {build:.2f} s，共 {history.num_buckets()} 个桶"
+          f"（未压缩需要 {days * 86400:,} 个），任意区间查询 {per_query:.1f} µs/次")
+    print(f"  最近5分钟: {history.hits_between(now - 300, now)}，"
+          f"第一天: {history.hits_between(start_ts, start_ts + 86400)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+可选的热路径计数与计时
+
+各算法在循环里只累加局部变量，函数结束时检查一次 REGISTRY.enabled，
+开启时才把结果写进预先创建好的 Counter / Timer 对象：
+
+    - 关闭时（默认）每次调用只多一次属性读取，没有按名字查字典、没有计时调用
+    - 指标对象在模块导入时就创建好，热路径上直接引用，不需要再查注册表
+    - 导出为 JSON（snapshot / to_json）或 Prometheus 文本格式（to_prometheus）
+
+用法：
+
+    from py_intv import instrumentation
+    instrumentation.enable()          # 或设置环境变量 PY_INTV_METRICS=1
+    ...                               # 运行业务代码
+    print(instrumentation.to_prometheus())
+
+被插桩的函数：HitCounter.getHits、RateLimiter.try_acquire、all_paths_* / iter_paths_*、
+ipToCIDR、depthSumInverse、insertion_sort / insertion_sort_optimized。
+"""
+import os
+from _thread import allocate_lock
+from time import perf_counter
+
+
+class Counter:
+    """单调递增的计数器"""
+
+    __slots__ = ("name", "help", "labels", "value", "_lock")
+
+    def __init__(self, name, help="", labels=None):
+        self.name = name
+        self.help = help
+        self.labels = dict(labels or {})
+        self.value = 0
+        self._lock = allocate_lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def reset(self):
+        with self._lock:
+            self.value = 0
+
+    def sample(self):
+        return {"value": self.value}
+
+
+class Timer:
+    """记录调用次数、总耗时和最大耗时（秒）"""
+
+    __slots__ = ("name", "help", "labels", "count", "total", "max", "_lock")
+
+    def __init__(self, name, help="", labels=None):
+        self.name = name
+        self.help = help
+        self.labels = dict(labels or {})
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = allocate_lock()
+
+    def observe(self, seconds):
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def time(self):
+        """with timer.time(): ... 记录一段代码的耗时"""
+        return _Timing(self)
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+    def sample(self):
+        return {"count": self.count, "sum": self.total, "max": self.max}
+
+
+class _Timing:
+    __slots__ = ("timer", "start")
+
+    def __init__(self, timer):
+        self.timer = timer
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.observe(perf_counter() - self.start)
+
+
+class Registry:
+    """
+    指标注册表
+
+    同名同标签的指标只会创建一次，重复注册返回已有对象；
+    同名指标必须是同一种类型（Counter 或 Timer）。
+    """
+
+    __slots__ = ("enabled", "_metrics", "_types", "_lock")
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._metrics = {}   # (name, 排好序的labels) -> 指标对象，按注册顺序导出
+        self._types = {}     # name -> 指标类型
+        self._lock = allocate_lock()
+
+    def _register(self, cls, name, help, labels):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            if self._types.setdefault(name, cls) is not cls:
+                raise ValueError(f"metric {name!r} is already registered as "
+                                 f"{self._types[name].__name__}")
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = cls(name, help, labels)
+            return metric
+
+    def counter(self, name, help="", labels=None):
+        """
+        获取或创建一个计数器
+
+        Args:
+            name: str - 指标名，按 Prometheus 习惯以 _total 结尾
+            help: str - 说明文字
+            labels: dict - 可选的标签，如 {"algorithm": "iter_paths_csr"}
+
+        Returns:
+            Counter
+        """
+        return self._register(Counter, name, help, labels)
+
+    def timer(self, name, help="", labels=None):
+        """获取或创建一个计时器，按 Prometheus 习惯以 _seconds 结尾"""
+        return self._register(Timer, name, help, labels)
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """把所有指标清零（指标对象保留，已经持有引用的代码不受影响）"""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def snapshot(self):
+        """
+        当前所有指标的快照
+
+        Returns:
+            dict - {"enabled": bool, "metrics": [{"name", "type", "help", "labels", ...取值}]}
+        """
+        metrics = []
+        for metric in list(self._metrics.values()):
+            entry = {"name": metric.name, "type": type(metric).__name__.lower(),
+                     "help": metric.help, "labels": dict(metric.labels)}
+            entry.update(metric.sample())
+            metrics.append(entry)
+        return {"enabled": self.enabled, "metrics": metrics}
+
+    def to_json(self, indent=None):
+        import json
+        return json.dumps(self.snapshot(), indent=indent, sort_keys=True, ensure_ascii=False)
+
+    def to_prometheus(self):
+        """
+        Prometheus 文本格式（exposition format 0.0.4）
+
+        Counter 导出为 counter；Timer 导出为 summary（_count / _sum），
+        最大耗时另外导出为 <name>_max 的 gauge。
+        """
+        families = {}
+        for metric in list(self._metrics.values()):
+            families.setdefault(metric.name, []).append(metric)
+
+        lines = []
+        for name, members in families.items():
+            is_timer = isinstance(members[0], Timer)
+            lines.append(f"# HELP {name} {_escape_help(members[0].help)}")
+            lines.append(f"# TYPE {name} {'summary' if is_timer else 'counter'}")
+            for metric in members:
+                labels = _format_labels(metric.labels)
+                if is_timer:
+                    lines.append(f"{name}_count{labels} {metric.count}")
+                    lines.append(f"{name}_sum{labels} {metric.total!r}")
+                else:
+                    lines.append(f"{name}{labels} {metric.value}")
+            if is_timer:
+                lines.append(f"# TYPE {name}_max gauge")
+                for metric in members:
+                    lines.append(f"{name}_max{_format_labels(metric.labels)} {metric.max!r}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _escape_help(text):
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    parts = []
+    for key, value in sorted(labels.items()):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+# 全局注册表：各模块在导入时向它注册指标
+REGISTRY = Registry(enabled=os.environ.get("PY_INTV_METRICS", "") not in ("", "0"))
+
+counter = REGISTRY.counter
+timer = REGISTRY.timer
+enable = REGISTRY.enable
+disable = REGISTRY.disable
+reset = REGISTRY.reset
+snapshot = REGISTRY.snapshot
+to_json = REGISTRY.to_json
+to_prometheus = REGISTRY.to_prometheus
+
+
+def test_instrumentation():
+    registry = Registry()
+    hits = registry.counter("demo_hits_total", "访问次数")
+    assert registry.counter("demo_hits_total") is hits
+    per_route = registry.counter("demo_route_total", "按路由", {"route": 'a"b'})
+    hits.inc()
+    hits.inc(4)
+    per_route.inc(2)
+    latency = registry.timer("demo_seconds", "耗时")
+    latency.observe(0.5)
+    latency.observe(0.25)
+    with latency.time():
+        pass
+    try:
+        registry.timer("demo_hits_total")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("重复注册为不同类型应该报错")
+
+    snap = registry.snapshot()
+    values = {(m["name"], tuple(m["labels"].items())): m for m in snap["metrics"]}
+    assert values[("demo_hits_total", ())]["value"] == 5
+    assert values[("demo_seconds", ())]["count"] == 3
+    assert values[("demo_seconds", ())]["max"] == 0.5
+
+    text = registry.to_prometheus()
+    assert "# TYPE demo_hits_total counter\ndemo_hits_total 5\n" in text
+    assert 'demo_route_total{route="a\\"b"} 2' in text
+    assert "# TYPE demo_seconds summary\ndemo_seconds_count 3\n" in text
+
+    registry.reset()
+    assert hits.value == 0 and latency.count == 0 and latency.max == 0.0
+    print("✅ 注册表、快照和导出格式测试通过")
+
+    # 被插桩的函数：关闭时不记录，开启时计数与算法的实际工作量一致。
+    # 通过包导入注册表：python -m 运行时本文件是 __main__，与各模块用的不是同一个对象
+    from . import instrumentation
+    from .graph.directed_all_paths_source_target import all_paths_directed, iter_paths_directed
+    from .graph.csr_graph import CSRGraph
+    from .sort.insertion_sort import insertion_sort, insertion_sort_optimized
+
+    dag = {0: [1, 2], 1: [3], 2: [1, 3], 3: []}
+    was_enabled = instrumentation.REGISTRY.enabled
+    instrumentation.REGISTRY.disable()
+    instrumentation.REGISTRY.reset()
+    all_paths_directed(dag, 0, 3)
+    assert all(m.get("value", 0) == 0 and m.get("count", 0) == 0
+               for m in instrumentation.REGISTRY.snapshot()["metrics"])
+
+    instrumentation.REGISTRY.enable()
+    try:
+        all_paths_directed(dag, 0, 3)
+        list(iter_paths_directed(dag, 0, 3))
+        list(iter_paths_directed(CSRGraph.from_adjacency(dag), 0, 3))
+        insertion_sort([3, 1, 2])
+        insertion_sort_optimized([3, 1, 2])
+    finally:
+        instrumentation.REGISTRY.enabled = was_enabled
+    found = {}
+    for m in instrumentation.REGISTRY.snapshot()["metrics"]:
+        if m["name"] in ("all_paths_nodes_visited_total", "all_paths_found_total",
+                         "insertion_sort_shifts_total"):
+            found[m["name"], m["labels"]["algorithm"]] = m["value"]
+    for algorithm in ("all_paths_directed", "iter_paths_directed", "iter_paths_csr"):
+        # 0 → 1 → (3)，0 → 2 → 1 → (3)，0 → 2 → (3)：进入 0、1、2、1 四次，3条路径
+        assert found["all_paths_nodes_visited_total", algorithm] == 4, algorithm
+        assert found["all_paths_found_total", algorithm] == 3, algorithm
+    # [3, 1, 2] 有两个逆序对
+    assert found["insertion_sort_shifts_total", "insertion_sort"] == 2
+    assert found["insertion_sort_shifts_total", "insertion_sort_optimized"] == 2
+    instrumentation.REGISTRY.reset()
+    print("✅ 插桩计数测试通过")
+
+
+def main():
+    test_instrumentation()
+
+    from . import instrumentation
+    from .graph.csr_graph import CSRGraph, iter_paths_csr
+    from .graph.workloads import grid_graph
+    from .lc751_ip_to_cidr import ipToCIDR
+
+    grid = CSRGraph.from_adjacency(grid_graph(4, 4), directed=False)
+    instrumentation.enable()
+    for _ in range(3):
+        for _ in iter_paths_csr(grid, 0, 15):
+            pass
+    ipToCIDR("255.0.0.7", 10)
+    print("\nPrometheus 文本格式：")
+    print(instrumentation.to_prometheus())
+    print("JSON 快照（节选）：")
+    print(instrumentation.to_json()[:200] + " ...")
+
+
+if __name__ == "__main__":
+    main()
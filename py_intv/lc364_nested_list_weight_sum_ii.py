@@ -0,0 +1,298 @@
+from time import perf_counter
+
+from . import instrumentation
+
+_REGISTRY = instrumentation.REGISTRY
+_BFS_ROUNDS = instrumentation.counter(
+    "nested_weight_sum_bfs_rounds_total", "depthSumInverse 的BFS轮数（即最大深度）")
+_ELEMENTS = instrumentation.counter(
+    "nested_weight_sum_elements_total", "depthSumInverse 处理的 NestedInteger 个数")
+_SECONDS = instrumentation.timer("nested_weight_sum_seconds", "depthSumInverse 耗时")
+
+
+class NestedInteger:
+    def __init__(self, value=None):
+        """
+        If value is not specified, initializes an empty list.
+        Otherwise initializes a single integer equal to value.
+        """
+        if value is None:
+            self._data = []
+        elif isinstance(value, int):
+            self._data = value
+        else:
+            raise TypeError("value should be an integer or None.")
+
+    def isInteger(self):
+        """Return True if this NestedInteger holds a single integer."""
+        return isinstance(self._data, int)
+
+    def add(self, elem):
+        """Set this NestedInteger to hold a nested list and adds a NestedInteger elem to it."""
+        if self.isInteger():
+            self._data = [NestedInteger(self._data)]
+        self._data.append(elem)
+
+    def setInteger(self, value):
+        """Set this NestedInteger to hold a single integer."""
+        self._data = value
+
+    def getInteger(self):
+        """Return the single integer if it holds one, else return None."""
+        return self._data if self.isInteger() else None
+
+    def getList(self):
+        """Return the nested list if it holds one, else return None."""
+        return self._data if not self.isInteger() else None
+
+
+class IncrementalNestedInteger(NestedInteger):
+    """
+    边修改边维护深度加权和的 NestedInteger，适合持续 add / setInteger 的场景
+
+    把一个列表节点当作最外层列表（它的元素深度为1），每个节点维护：
+        _sum       子树里所有整数之和 S
+        _weighted  子树里 Σ 整数 × 相对深度 W（即正向的 depthSum）
+        _heights   子元素高度的直方图：_heights[h] 是 1 + 高度 == h 的子元素个数，
+                   节点高度（最深元素的相对深度）就是最后一个非零下标
+    列表节点满足 S = Σ S(子)，W = Σ (S(子) + W(子))，所以反向加权和
+        depthSumInverse = Σ v × (maxDepth - depth + 1) = (maxDepth + 1) × S - W
+    可以 O(1) 读出。修改时把自己的 S / W / 高度的变化沿父指针往上推，
+    每层 O(1)（高度变小时直方图去掉末尾的0，均摊 O(1)），整次更新 O(深度)。
+
+    与 Solution.depthSumInverse 的BFS一致：只含空列表的层也算进 maxDepth。
+    每个节点只能挂在一个父节点下；直接修改 getList() 返回的列表会绕过维护。
+    """
+
+    def __init__(self, value=None):
+        super().__init__(value)
+        self._parent = None
+        self._sum = value or 0
+        self._weighted = 0
+        self._heights = []
+
+    def _height(self):
+        return len(self._heights) - 1 if self._heights else 0
+
+    def _attach(self, elem):
+        """把 elem 追加为子元素，只更新自己的汇总，不往上推"""
+        if not isinstance(elem, IncrementalNestedInteger):
+            raise TypeError("elem should be an IncrementalNestedInteger")
+        if elem._parent is not None:
+            raise ValueError("elem already belongs to another list")
+        elem._parent = self
+        self._data.append(elem)
+        self._sum += elem._sum
+        self._weighted += elem._sum + elem._weighted
+        h = elem._height() + 1
+        heights = self._heights
+        while len(heights) <= h:
+            heights.append(0)
+        heights[h] += 1
+
+    def _propagate(self, old_sum, old_weighted, old_height):
+        """自己的汇总已经更新，把变化量逐层推给祖先，没有变化时提前结束"""
+        d_sum = self._sum - old_sum
+        d_weighted = self._weighted - old_weighted
+        new_height = self._height()
+        parent = self._parent
+        while parent is not None and (d_sum or d_weighted or new_height != old_height):
+            parent_height = parent._height()
+            d_weighted += d_sum          # 子元素对父节点 W 的贡献是 S + W
+            parent._sum += d_sum
+            parent._weighted += d_weighted
+            if new_height != old_height:
+                heights = parent._heights
+                heights[old_height + 1] -= 1
+                while len(heights) <= new_height + 1:
+                    heights.append(0)
+                heights[new_height + 1] += 1
+                while heights and heights[-1] == 0:
+                    heights.pop()
+            old_height, new_height = parent_height, parent._height()
+            parent = parent._parent
+
+    def add(self, elem):
+        old = (self._sum, self._weighted, self._height())
+        if self.isInteger():
+            value = self._data
+            self._data, self._sum, self._weighted = [], 0, 0
+            self._attach(IncrementalNestedInteger(value))
+        self._attach(elem)
+        self._propagate(*old)
+
+    def setInteger(self, value):
+        old = (self._sum, self._weighted, self._height())
+        if not self.isInteger():
+            for child in self._data:     # 被替换掉的子树各自成为独立的根
+                child._parent = None
+        self._data = value
+        self._sum, self._weighted, self._heights = value, 0, []
+        self._propagate(*old)
+
+    def depthSum(self):
+        """把本节点当作最外层列表的正向深度加权和（LeetCode 339），O(1)"""
+        return self._weighted
+
+    def depthSumInverse(self):
+        """把本节点当作最外层列表的反向深度加权和，O(1)，与 Solution().depthSumInverse(self.getList()) 相同"""
+        return (self._height() + 1) * self._sum - self._weighted
+
+
+def build_nested_integer(data, cls=NestedInteger):
+    """Helper function to build NestedInteger (or IncrementalNestedInteger) from Python list/int"""
+    if isinstance(data, int):
+        return cls(data)
+    ni = cls()
+    for item in data:
+        ni.add(build_nested_integer(item, cls))
+    return ni
+
+class Solution:
+    """
+    BFS 累加原理：
+
+    level_sum 是累积的，不会重置
+    每轮把当前 level_sum 加到 res
+    越早进入 level_sum 的数字，被累加次数越多
+    累加次数分析：
+
+    数字 1：第1轮加入，被累加3次（第1、2、3轮都加到res）→ 1×3 = 3
+    数字 4：第2轮加入，被累加2次（第2、3轮加到res）→ 4×2 = 8
+    数字 6：第3轮加入，被累加1次（第3轮加到res）→ 6×1 = 6
+    总和：3 + 8 + 6 = 17 ✓
+    这就是 BFS 单遍算法的精妙之处：通过累积 level_sum 和逐轮相加，自然实现了反向深度加权！
+    """
+    
+    def depthSumInverse(self, nestedList: list[NestedInteger]) -> int:
+        enabled = _REGISTRY.enabled
+        if enabled:
+            t0 = perf_counter()
+        res, level_sum = 0, 0
+        rounds = elements = 0
+        while nestedList:
+            next_level = []
+            rounds += 1
+            elements += len(nestedList)
+            
+            for n in nestedList:
+                if n.isInteger():
+                    level_sum += n.getInteger()
+                else:
+                    next_level.extend(n.getList())
+            nestedList = next_level
+            res += level_sum
+        if enabled:
+            _BFS_ROUNDS.inc(rounds)
+            _ELEMENTS.inc(elements)
+            _SECONDS.observe(perf_counter() - t0)
+        return res
+
+
+def test_incremental_depth_sums():
+    """随机 add / setInteger，每次修改后与整棵树重新BFS的结果对比"""
+    import random
+    rng = random.Random(364)
+    solution = Solution()
+
+    def depth_sum(nested, depth=1):
+        return sum(n.getInteger() * depth if n.isInteger() else depth_sum(n.getList(), depth + 1)
+                   for n in nested)
+
+    def random_data(depth):
+        if depth == 0 or rng.random() < 0.4:
+            return rng.randint(-20, 20)
+        return [random_data(depth - 1) for _ in range(rng.randrange(4))]
+
+    for _ in range(50):
+        root = build_nested_integer([random_data(4) for _ in range(3)], IncrementalNestedInteger)
+        for _ in range(100):
+            nodes, stack = [], [root]
+            while stack:
+                node = stack.pop()
+                nodes.append(node)
+                if not node.isInteger():
+                    stack.extend(node.getList())
+            node = rng.choice(nodes)
+            if node is not root and rng.random() < 0.4:
+                node.setInteger(rng.randint(-20, 20))
+            else:
+                node.add(build_nested_integer(random_data(3), IncrementalNestedInteger))
+            if root.isInteger():
+                continue
+            assert root.depthSumInverse() == solution.depthSumInverse(root.getList())
+            assert root.depthSum() == depth_sum(root.getList())
+    # 只含空列表的层也算深度：[1, [[]]] 的 maxDepth 是2
+    root = build_nested_integer([1, [[]]], IncrementalNestedInteger)
+    assert root.depthSumInverse() == solution.depthSumInverse(root.getList()) == 2
+    print("✅ 增量维护的深度加权和与BFS一致")
+
+
+# test
+def main():
+    solution = Solution()
+
+    # 测试例子 1: [[1,1], 2, [1,1]]
+    print("测试例子 1: [[1,1], 2, [1,1]]")
+    test1_data = [[1,1], 2, [1,1]]
+    test1_nested = [build_nested_integer(item) for item in test1_data]
+    result1 = solution.depthSumInverse(test1_nested)
+    print(f"输入: {test1_data}")
+    print(f"输出: {result1}")
+    print()
+
+    # 测试例子 2: [1, [4, [6]]]
+    print("测试例子 2: [1, [4, [6]]]")
+    test2_data = [1, [4, [6]]]
+    test2_nested = [build_nested_integer(item) for item in test2_data]
+    result2 = solution.depthSumInverse(test2_nested)
+    print(f"输入: {test2_data}")
+    print(f"输出: {result2}")
+    print()
+
+    # 详细步骤演示（例子2）
+    print("=== 详细步骤演示 (例子2) ===")
+    test2_nested_demo = [build_nested_integer(item) for item in test2_data]
+
+    res, level_sum = 0, 0
+    round_num = 1
+    nestedList = test2_nested_demo
+
+    while nestedList:
+        print(f"第 {round_num} 轮:")
+        print(f"  当前层元素数量: {len(nestedList)}")
+        next_level = []
+        integers_in_level = []
+
+        for n in nestedList:
+            if n.isInteger():
+                value = n.getInteger()
+                level_sum += value
+                integers_in_level.append(value)
+            else:
+                next_level.extend(n.getList())
+
+        if integers_in_level:
+            print(f"  发现整数: {integers_in_level}")
+        print(f"  level_sum: {level_sum}")
+
+        nestedList = next_level
+        res += level_sum
+        print(f"  res += level_sum → res = {res}")
+        print()
+
+        round_num += 1
+
+    print(f"最终结果: {res}")
+    print()
+
+    test_incremental_depth_sums()
+    root = build_nested_integer(test2_data, IncrementalNestedInteger)
+    inner = root.getList()[1].getList()[1]        # [6]
+    inner.add(IncrementalNestedInteger(2))        # [1, [4, [6, 2]]]
+    print(f"增量模式: {test2_data} 里的 [6] 追加 2 → depthSumInverse = {root.depthSumInverse()}, "
+          f"depthSum = {root.depthSum()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+from collections import Counter
+
+
+class AllOne:
+    """
+    全O(1)的计数结构：inc / dec / getMaxKey / getMinKey 都是 O(1)
+
+    用按计数升序排列的双向链表保存"计数桶"，每个桶存放计数相同的所有key：
+
+        head <-> [count=1: {a, b}] <-> [count=3: {c}] <-> [count=7: {d}] <-> tail
+
+    - self.buckets: key -> 所在的桶
+    - inc/dec 只会把key移动到相邻计数的桶（不存在就在旁边新建一个），桶空了就摘掉
+    - 最大/最小key分别在 tail.prev / head.next 中
+    """
+
+    class Bucket:
+        __slots__ = ("count", "keys", "prev", "next")
+
+        def __init__(self, count):
+            self.count = count
+            self.keys = {}      # 当作有序集合用，取任意一个key是O(1)
+            self.prev = None
+            self.next = None
+
+    def __init__(self):
+        self.head = self.Bucket(0)
+        self.tail = self.Bucket(float("inf"))
+        self.head.next = self.tail
+        self.tail.prev = self.head
+        self.buckets = {}
+
+    def _insert_after(self, bucket, count):
+        node = self.Bucket(count)
+        node.prev, node.next = bucket, bucket.next
+        bucket.next.prev = node
+        bucket.next = node
+        return node
+
+    def _remove_bucket(self, bucket):
+        bucket.prev.next, bucket.next.prev = bucket.next, bucket.prev
+
+    def _move(self, key, bucket, count):
+        """
+        把key从bucket移到计数为count的桶；count <= 0 表示删除key
+
+        从bucket出发沿链表向目标方向走，经过的桶数不超过计数的变化量，
+        所以 inc/dec（变化量为1）是O(1)，批量操作的代价与变化量成正比。
+        """
+        count = max(count, 0)
+        if count > bucket.count:
+            prev = bucket
+            while prev.next.count <= count:
+                prev = prev.next
+        else:
+            prev = bucket.prev
+            while prev.count > count:
+                prev = prev.prev
+
+        if count <= 0:
+            del self.buckets[key]
+        else:
+            target = prev if prev.count == count else self._insert_after(prev, count)
+            target.keys[key] = None
+            self.buckets[key] = target
+
+        if bucket is not self.head:
+            del bucket.keys[key]
+            if not bucket.keys:
+                self._remove_bucket(bucket)
+
+    def inc(self, key) -> None:
+        """key的计数加1，新key的计数为1"""
+        bucket = self.buckets.get(key, self.head)
+        self._move(key, bucket, bucket.count + 1)
+
+    def dec(self, key) -> None:
+        """key的计数减1，减到0时删除key；key不存在时抛出 KeyError"""
+        bucket = self.buckets[key]
+        self._move(key, bucket, bucket.count - 1)
+
+    def inc_many(self, keys) -> None:
+        """
+        批量加1，keys中重复出现的key加多次
+
+        先用Counter合并重复的key，每个key只移动一次。
+        """
+        for key, times in Counter(keys).items():
+            bucket = self.buckets.get(key, self.head)
+            self._move(key, bucket, bucket.count + times)
+
+    def dec_many(self, keys) -> None:
+        """
+        批量减1，计数减到0以下的key直接删除
+
+        与逐个调用 dec 不同，先检查所有key都存在，出错时不会只执行一半。
+        """
+        counts = Counter(keys)
+        missing = [key for key in counts if key not in self.buckets]
+        if missing:
+            raise KeyError(missing[0])
+        for key, times in counts.items():
+            bucket = self.buckets[key]
+            self._move(key, bucket, bucket.count - times)
+
+    def getMaxKey(self) -> str:
+        if self.tail.prev is self.head:
+            return ""
+        return next(iter(self.tail.prev.keys))
+
+    def getMinKey(self) -> str:
+        if self.head.next is self.tail:
+            return ""
+        return next(iter(self.head.next.keys))
+
+    def count(self, key) -> int:
+        bucket = self.buckets.get(key)
+        return bucket.count if bucket else 0
+
+    def top_k(self, k=None):
+        """按计数从大到小产出 (key, count)，最多k个；k为None时产出全部"""
+        bucket = self.tail.prev
+        while bucket is not self.head and k != 0:
+            for key in bucket.keys:
+                if k == 0:
+                    return
+                yield key, bucket.count
+                if k is not None:
+                    k -= 1
+            bucket = bucket.prev
+
+    def bottom_k(self, k=None):
+        """按计数从小到大产出 (key, count)，最多k个；k为None时产出全部"""
+        bucket = self.head.next
+        while bucket is not self.tail and k != 0:
+            for key in bucket.keys:
+                if k == 0:
+                    return
+                yield key, bucket.count
+                if k is not None:
+                    k -= 1
+            bucket = bucket.next
+
+    def __len__(self):
+        return len(self.buckets)
+
+    def __contains__(self, key):
+        return key in self.buckets
+
+
+class NaiveAllOne:
+    """基准对照：dict计数，getMaxKey/getMinKey 用 max()/min() 扫描全部key，O(n)"""
+
+    def __init__(self):
+        self.counts = {}
+
+    def inc(self, key):
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def dec(self, key):
+        if self.counts[key] == 1:
+            del self.counts[key]
+        else:
+            self.counts[key] -= 1
+
+    def count(self, key):
+        return self.counts.get(key, 0)
+
+    def getMaxKey(self):
+        return max(self.counts, key=self.counts.get) if self.counts else ""
+
+    def getMinKey(self):
+        return min(self.counts, key=self.counts.get) if self.counts else ""
+
+
+# 测试用例
+def test_all_one():
+    obj = AllOne()
+    obj.inc("hello")
+    obj.inc("hello")
+    assert obj.getMaxKey() == "hello"
+    assert obj.getMinKey() == "hello"
+    obj.inc("leet")
+    assert obj.getMaxKey() == "hello"
+    assert obj.getMinKey() == "leet"
+
+    obj.dec("hello")
+    obj.dec("hello")
+    assert "hello" not in obj
+    assert obj.getMaxKey() == obj.getMinKey() == "leet"
+    obj.dec("leet")
+    assert obj.getMaxKey() == obj.getMinKey() == ""
+    try:
+        obj.dec("leet")
+        assert False, "dec不存在的key应该抛出KeyError"
+    except KeyError:
+        pass
+    print("基本测试通过!")
+
+
+def test_all_one_batch():
+    import random
+    rng = random.Random(0)
+    obj = AllOne()
+    reference = Counter()
+    for _ in range(2000):
+        keys = [rng.randrange(30) for _ in range(rng.randint(1, 20))]
+        if rng.random() < 0.6:
+            obj.inc_many(keys)
+            reference.update(keys)
+        else:
+            keys = [key for key in keys if key in reference]
+            obj.dec_many(keys)
+            reference.subtract(keys)
+            reference = +reference
+        assert len(obj) == len(reference)
+        assert all(obj.count(key) == c for key, c in reference.items())
+        if reference:
+            assert obj.count(obj.getMaxKey()) == max(reference.values())
+            assert obj.count(obj.getMinKey()) == min(reference.values())
+    expected = sorted(reference.values(), reverse=True)
+    assert [c for _, c in obj.top_k()] == expected
+    assert [c for _, c in obj.top_k(5)] == expected[:5]
+    assert [c for _, c in obj.bottom_k(5)] == sorted(reference.values())[:5]
+    print("批量操作测试通过!")
+
+
+def benchmark(sizes, ops=200_000, naive_limit=100_000):
+    """在n个key上执行随机的 inc/dec/getMaxKey/getMinKey 混合操作，统计每次操作的平均耗时"""
+    import random
+    import time
+
+    print(f"\n{'keys':>12s} {'AllOne ns/op':>14s} {'dict+max() ns/op':>18s}")
+    for n in sizes:
+        rng = random.Random(n)
+        keys = [rng.randrange(n) for _ in range(ops)]
+        kinds = [rng.randrange(4) for _ in range(ops)]
+
+        results = []
+        for cls in (AllOne, NaiveAllOne):
+            if cls is NaiveAllOne and n > naive_limit:
+                results.append(None)
+                continue
+            obj = cls()
+            for key in range(n):
+                obj.inc(key)
+            # 基线的 getMaxKey 是O(n)，只跑少量操作
+            count = ops if cls is AllOne else max(100, ops * 1000 // n)
+            start = time.perf_counter()
+            for key, kind in zip(keys[:count], kinds[:count]):
+                if kind == 0:
+                    obj.inc(key)
+                elif kind == 1:
+                    if obj.count(key) > 1:
+                        obj.dec(key)
+                elif kind == 2:
+                    obj.getMaxKey()
+                else:
+                    obj.getMinKey()
+            results.append((time.perf_counter() - start) / count * 1e9)
+
+        naive = f"{results[1]:>18.0f}" if results[1] is not None else f"{'(跳过)':>16s}"
+        print(f"{n:>12,d} {results[0]:>14.0f} {naive}")
+
+
+def main():
+    import sys
+
+    test_all_one()
+    test_all_one_batch()
+    # 默认到100万个key；传入 --full 扩展到1000万（需要数GB内存）
+    sizes = [1_000, 10_000, 100_000, 1_000_000]
+    if "--full" in sys.argv:
+        sizes.append(10_000_000)
+    benchmark(sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# Spiral Matrix, boundary simulation
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+
+
+class Solution:
+    def spiralOrder(self, matrix: list[list[int]]) -> list[int]:
+        res = []      # result container 
+        
+        # if matrix is empty, return empty result
+        if not matrix or not matrix[0]:
+            return res
+        
+        # m rows, n cols
+        row, col = len(matrix), len(matrix[0])
+        # boundaries for current layer
+        top, bottom = 0, row  - 1          # current top row index, bottom row index
+        left, right = 0, col - 1          # current left col index, right col index   
+
+        # loop until boundaries cross
+        while top <= bottom and left <= right:
+            # traverse from left to right on the top row
+            for c in range(left, right + 1):
+                res.append(matrix[top][c])      # collect top row elements
+            top += 1                             # shrink top boundary
+
+            # traverse from top to bottom on the right column
+            for r in range(top, bottom + 1):
+                res.append(matrix[r][right])     # collect right column elements
+            right -= 1                           # shrink right boundary
+
+            # safeguard for single row or single column remaining
+            if top <= bottom:
+                # traverse from right to left on the bottom row
+                for c in range(right, left - 1, -1):
+                    res.append(matrix[bottom][c])  # collect bottom row elements
+                bottom -= 1                         # shrink bottom boundary
+
+            if left <= right:
+                # traverse from bottom to top on the left column
+                for r in range(bottom, top - 1, -1):
+                    res.append(matrix[r][left])     # collect left column elements
+                left += 1                            # shrink left boundary
+
+        return res
+
+
+# Shape-keyed cached permutation
+#
+# The walk above depends only on (rows, cols), so for many matrices of the same
+# shape we derive it once as a flat index permutation (index r * cols + c in
+# row-major order) and then just gather: operator.itemgetter on the flattened
+# list for plain Python, one fancy-index over a whole (k, rows, cols) stack with NumPy.
+
+@lru_cache(maxsize=128)
+def spiral_indices(rows: int, cols: int) -> tuple:
+    """flat row-major indices in spiral order, computed once per shape"""
+    grid = [range(r * cols, (r + 1) * cols) for r in range(rows)]
+    return tuple(Solution().spiralOrder(grid)) if rows and cols else ()
+
+
+@lru_cache(maxsize=128)
+def _spiral_getter(rows: int, cols: int):
+    perm = spiral_indices(rows, cols)
+    if len(perm) == 1:                  # itemgetter with one index returns a scalar
+        only = perm[0]
+        return lambda flat: (flat[only],)
+    return itemgetter(*perm)
+
+
+@lru_cache(maxsize=128)
+def _spiral_index_array(rows: int, cols: int):
+    import numpy as np                  # optional, only for 3-D stacks
+    return np.asarray(spiral_indices(rows, cols), dtype=np.intp)
+
+
+def spiral_order_cached(matrix: list[list[int]]) -> list[int]:
+    """same result as Solution().spiralOrder, but one flatten + one gather per call"""
+    if not matrix or not matrix[0]:
+        return []
+    getter = _spiral_getter(len(matrix), len(matrix[0]))
+    return list(getter(list(chain.from_iterable(matrix))))
+
+
+def spiral_order_batch(matrices):
+    """
+    spiral order of many same-shaped matrices
+
+    Args:
+        matrices: a NumPy array of shape (k, rows, cols), or a sequence of
+            list-of-lists matrices (shapes may differ; each uses its cached walk)
+
+    Returns:
+        (k, rows * cols) NumPy array for array input, otherwise a list of lists
+    """
+    shape = getattr(matrices, "shape", None)
+    if shape is not None and len(shape) == 3:
+        k, rows, cols = shape
+        # a single gather along the flattened axis for the whole stack
+        return matrices.reshape(k, rows * cols)[:, _spiral_index_array(rows, cols)]
+    result = []
+    getters = {}                        # skip the lru_cache lookup for repeated shapes
+    flatten = chain.from_iterable
+    for matrix in matrices:
+        if not matrix or not matrix[0]:
+            result.append([])
+            continue
+        shape = (len(matrix), len(matrix[0]))
+        getter = getters.get(shape)
+        if getter is None:
+            getter = getters[shape] = _spiral_getter(*shape)
+        result.append(list(getter(list(flatten(matrix)))))
+    return result
+
+
+def test_spiral_order():
+    import random
+    rng = random.Random(54)
+    solution = Solution()
+    assert spiral_order_cached([[1, 2, 3], [4, 5, 6], [7, 8, 9]]) == [1, 2, 3, 6, 9, 8, 7, 4, 5]
+    assert spiral_order_cached([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]]) == \
+        [1, 2, 3, 4, 8, 12, 11, 10, 9, 5, 6, 7]
+    assert spiral_order_cached([[7]]) == [7] and spiral_order_cached([]) == []
+    assert spiral_order_cached([[]]) == []
+    for _ in range(200):
+        rows, cols = rng.randint(1, 9), rng.randint(1, 9)
+        matrix = [[rng.randrange(100) for _ in range(cols)] for _ in range(rows)]
+        assert spiral_order_cached(matrix) == solution.spiralOrder(matrix), (rows, cols)
+    matrices = [[[rng.randrange(100)] * 3 for _ in range(2)] for _ in range(5)]
+    assert spiral_order_batch(matrices) == [solution.spiralOrder(m) for m in matrices]
+    try:
+        import numpy as np
+    except ImportError:
+        print("✅ spiral permutation tests passed (NumPy not installed, 3-D batch skipped)")
+        return
+    stack = np.arange(4 * 3 * 5).reshape(4, 3, 5)
+    expected = [solution.spiralOrder(m.tolist()) for m in stack]
+    assert spiral_order_batch(stack).tolist() == expected
+    print("✅ spiral permutation tests passed")
+
+
+def benchmark(shapes=((3, 3), (4, 5), (8, 8)), count=20_000):
+    import time
+
+    print(f"\nper-matrix time (µs), {count:,} matrices per shape:")
+    print(f"{'shape':>8s} {'spiralOrder':>12s} {'cached':>10s} {'numpy batch':>12s}")
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    solution = Solution()
+    for rows, cols in shapes:
+        matrices = [[[(i + r * cols + c) % 97 for c in range(cols)] for r in range(rows)]
+                    for i in range(count)]
+        start = time.perf_counter()
+        for matrix in matrices:
+            solution.spiralOrder(matrix)
+        walk = (time.perf_counter() - start) / count * 1e6
+        start = time.perf_counter()
+        spiral_order_batch(matrices)
+        cached = (time.perf_counter() - start) / count * 1e6
+        batch = "-"
+        if np is not None:
+            stack = np.asarray(matrices)
+            start = time.perf_counter()
+            spiral_order_batch(stack)
+            batch = f"{(time.perf_counter() - start) / count * 1e6:.3f}"
+        print(f"{f'{rows}x{cols}':>8s} {walk:>12.2f} {cached:>10.2f} {batch:>12s}")
+
+
+def main():
+    test_spiral_order()
+    benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,3 @@
-from sortedcontainers import SortedDict
-
 class MaxStack:
     class Node:
         def __init__(self, val):
@@ -8,6 +6,8 @@ class MaxStack:
             self.next=None
 
     def __init__(self):
+        from sortedcontainers import SortedDict   # 第三方依赖，创建实例时才导入
+
         self.head= self.Node(0)
         self.tail= self.Node(0)
         self.head.next= self.tail
@@ -134,9 +134,12 @@ def test_max_stack_edge_cases():
 
     print("边界测试通过!")
 
-if __name__ == "__main__":
+def main():
     test_max_stack()
     test_max_stack_complex()
     test_max_stack_edge_cases()
     print("所有测试通过!")
-        
\ No newline at end of file
+
+
+if __name__ == "__main__":
+    main()
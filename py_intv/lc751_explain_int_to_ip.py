@@ -135,5 +135,10 @@ def step_by_step_example():
     demonstrate_bit_operations()
     test_various_ips()
 
-# 执行一遍
-step_by_step_example()
\ No newline at end of file
+
+def main():
+    step_by_step_example()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
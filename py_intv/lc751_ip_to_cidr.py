@@ -1,4 +1,12 @@
-from typing import List
+from time import perf_counter
+
+from . import instrumentation
+
+_REGISTRY = instrumentation.REGISTRY
+_ITERATIONS = instrumentation.counter(
+    "ip_to_cidr_iterations_total", "ipToCIDR 贪心循环的轮数（即生成的CIDR块数）")
+_SECONDS = instrumentation.timer("ip_to_cidr_seconds", "ipToCIDR 耗时")
+
 
 def ipToCIDR(ip: str, n: int) -> list[str]:
     """
@@ -50,6 +58,10 @@ def ipToCIDR(ip: str, n: int) -> list[str]:
         # 取两者的最小值,The actual block size is the minimum of alignment constraint and count constraint
         return min(max_size_by_alignment, max_size_by_remaining)
     
+    enabled = _REGISTRY.enabled
+    if enabled:
+        t0 = perf_counter()
+
     # 将起始IP转换为整数
     start = ip_to_int(ip)
     result = []
@@ -70,6 +82,10 @@ def ipToCIDR(ip: str, n: int) -> list[str]:
         start += block_size
         n -= block_size
     
+    if enabled:
+        # 每轮恰好生成一个块，轮数不需要在循环里单独计数
+        _ITERATIONS.inc(len(result))
+        _SECONDS.observe(perf_counter() - t0)
     return result
 
 # Test with the provided examples
@@ -129,4 +145,11 @@ def trace_example1():
         n -= block_size
         step += 1
 
-trace_example1()
+
+def main():
+    test_examples()
+    trace_example1()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""插入排序系列、有序缓冲区和外部排序"""
@@ -0,0 +1,213 @@
+"""
+排序基准测试：不同输入分布 × 不同规模，统计耗时、比较次数和元素移动次数
+
+比较次数通过 CountingItem 包装元素得到（每次 < > <= >= 都计数）；
+移动次数通过 CountingList 得到（每次写入数组的元素个数，切片赋值按长度计）。
+计数运行和计时运行分开进行，包装带来的开销不影响计时。
+
+用法：
+    python -m py_intv.sort.benchmark_sorts                       # 打印表格
+    python -m py_intv.sort.benchmark_sorts --sizes 16 64 256     # 自定义规模
+    python -m py_intv.sort.benchmark_sorts --output sorts.json   # 同时写JSON
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from .insertion_sort import (hybrid_sort, insertion_sort, insertion_sort_optimized,
+                             insertion_sort_recursive)
+
+
+SORTS = {
+    "insertion_sort": insertion_sort,
+    "insertion_sort_optimized": insertion_sort_optimized,
+    "insertion_sort_recursive": insertion_sort_recursive,
+    "hybrid_sort": hybrid_sort,
+}
+
+
+class OpCounter:
+    __slots__ = ("comparisons", "moves")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0
+
+
+class CountingItem:
+    """包装一个元素，每次比较都记入共享的计数器"""
+
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other):
+        self.counter.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other):
+        self.counter.comparisons += 1
+        return self.value > other.value
+
+    def __le__(self, other):
+        self.counter.comparisons += 1
+        return self.value <= other.value
+
+    def __ge__(self, other):
+        self.counter.comparisons += 1
+        return self.value >= other.value
+
+
+class CountingList(list):
+    """
+    统计写入次数的list
+
+    各排序函数都以 arr.copy() 开始，所以 copy() 也返回 CountingList 并共享计数器。
+    """
+
+    def __init__(self, iterable, counter):
+        super().__init__(iterable)
+        self.counter = counter
+
+    def copy(self):
+        return CountingList(self, self.counter)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counter.moves += len(value)
+        else:
+            self.counter.moves += 1
+        super().__setitem__(index, value)
+
+
+def make_input(distribution, n, rng, swaps=None):
+    """
+    生成一种分布的输入
+
+    random      - 均匀随机
+    sorted      - 已排序
+    reversed    - 逆序
+    nearly      - 已排序后随机交换k对（默认 k = max(1, n // 100)）
+    duplicates  - 只有 ~sqrt(n) 种不同取值
+    """
+    if distribution == "random":
+        return [rng.random() for _ in range(n)]
+    if distribution == "sorted":
+        return list(range(n))
+    if distribution == "reversed":
+        return list(range(n, 0, -1))
+    if distribution == "nearly":
+        arr = list(range(n))
+        for _ in range(swaps if swaps is not None else max(1, n // 100)):
+            i, j = rng.randrange(n), rng.randrange(n)
+            arr[i], arr[j] = arr[j], arr[i]
+        return arr
+    if distribution == "duplicates":
+        distinct = max(1, int(n ** 0.5))
+        return [rng.randrange(distinct) for _ in range(n)]
+    raise ValueError(f"unknown distribution: {distribution}")
+
+
+DISTRIBUTIONS = ["random", "sorted", "reversed", "nearly", "duplicates"]
+
+
+def count_ops(sort_func, arr):
+    """在包装后的输入上运行一次，返回 (比较次数, 移动次数)"""
+    counter = OpCounter()
+    wrapped = CountingList((CountingItem(x, counter) for x in arr), counter)
+    result = sort_func(wrapped)
+    if [item.value for item in result] != sorted(arr):
+        raise AssertionError(f"{sort_func.__name__} produced an unsorted result")
+    return counter.comparisons, counter.moves
+
+
+def time_sort(sort_func, arr, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        sort_func(arr)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(sizes, distributions=DISTRIBUTIONS, sorts=SORTS, repeat=3, seed=0):
+    for distribution in distributions:
+        for n in sizes:
+            arr = make_input(distribution, n, random.Random(seed))
+            for name, sort_func in sorts.items():
+                comparisons, moves = count_ops(sort_func, arr)
+                yield {
+                    "distribution": distribution,
+                    "size": n,
+                    "algorithm": name,
+                    "seconds": time_sort(sort_func, arr, repeat),
+                    "comparisons": comparisons,
+                    "moves": moves,
+                }
+
+
+def print_crossovers(rows):
+    """对每种分布，列出每个规模下最快的算法，最快者变化的位置就是交叉点"""
+    print("\n各规模下最快的算法:")
+    by_case = {}
+    for row in rows:
+        by_case.setdefault((row["distribution"], row["size"]), []).append(row)
+    last = {}
+    for (distribution, n), case in by_case.items():
+        fastest = min(case, key=lambda r: r["seconds"])["algorithm"]
+        marker = ""
+        if distribution in last and last[distribution] != fastest:
+            marker = f"  ← 交叉点（之前是 {last[distribution]}）"
+        last[distribution] = fastest
+        print(f"  {distribution:<11s} n={n:<6d} {fastest}{marker}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="插入排序系列基准测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 64, 256, 1024, 2048])
+    parser.add_argument("--distribution", action="append", choices=DISTRIBUTIONS,
+                        help="只跑指定的分布，可以重复")
+    parser.add_argument("--repeat", type=int, default=3, help="计时重复次数，取最快一次")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="把结果写成JSON文件")
+    args = parser.parse_args(argv)
+
+    # 递归版本的递归深度等于数组长度
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), max(args.sizes) + 100))
+
+    print(f"{'distribution':<12s} {'n':>6s}  {'algorithm':<26s} "
+          f"{'ms':>10s} {'comparisons':>12s} {'moves':>12s}")
+    print("-" * 84)
+    rows = []
+    for row in run_benchmark(args.sizes, args.distribution or DISTRIBUTIONS,
+                             repeat=args.repeat, seed=args.seed):
+        print(f"{row['distribution']:<12s} {row['size']:>6d}  {row['algorithm']:<26s} "
+              f"{row['seconds'] * 1000:>10.3f} {row['comparisons']:>12d} {row['moves']:>12d}")
+        rows.append(row)
+
+    print_crossovers(rows)
+
+    if args.output:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "machine": platform.machine(),
+                "seed": args.seed,
+                "repeat": args.repeat,
+            },
+            "results": rows,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"\n结果已写入 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+import heapq
+import os
+from array import array
+
+from .insertion_sort import hybrid_sort_inplace
+
+
+DEFAULT_MEMORY_BUDGET = 64 << 20   # 64 MB
+DEFAULT_MAX_FANIN = 128            # 一次归并最多同时打开的run文件数
+# 归并时缓冲区以外的开销：每路一个生成器帧、文件对象和堆里的条目，外加堆本身和临时目录等杂项
+MERGE_OVERHEAD_PER_RUN = 1024
+MERGE_OVERHEAD_BASE = 16 * 1024
+
+
+def _read_into(f, chunk):
+    """
+    从文件当前位置直接读进预先分配好的 array，返回读到的记录数
+
+    frombytes / fromfile 都要先读出一个 bytes 再复制进数组，峰值是数据的两倍；
+    readinto 写进数组自己的缓冲区，不经过中间对象。
+    """
+    with memoryview(chunk) as items, items.cast("B") as view:
+        got = 0
+        while got < len(view):
+            n = f.readinto(view[got:])
+            if not n:
+                break
+            got += n
+    return got // chunk.itemsize
+
+
+def _write_from(f, chunk, count=None):
+    """
+    把 array 的前 count 条记录直接写进文件
+
+    tofile 按64KB一块先复制成 bytes 再写；这里写数组自己的缓冲区，不产生临时对象。
+    """
+    with memoryview(chunk) as items, items[:count].cast("B") as view:
+        written = 0
+        while written < len(view):
+            written += f.write(view[written:])
+
+
+def _sort_run(task):
+    """
+    生成一个有序run：读取输入文件的 [start, stop) 条记录，原地排序后写入run文件
+
+    在工作进程中运行，只接收文件名和偏移，不需要pickle数据本身。
+    """
+    input_path, start, stop, typecode, run_path = task
+    chunk = array(typecode, [0]) * (stop - start)
+    # buffering=0：整块读写不需要 io 模块再分配一个缓冲区
+    with open(input_path, "rb", buffering=0) as f:
+        f.seek(start * chunk.itemsize)
+        _read_into(f, chunk)
+    hybrid_sort_inplace(chunk)
+    with open(run_path, "wb", buffering=0) as out:
+        _write_from(out, chunk)
+    return run_path
+
+
+def _read_run(path, typecode, buffer_records):
+    """按块读取一个run文件，逐条产出记录"""
+    block = array(typecode, [0]) * buffer_records
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            count = _read_into(f, block)
+            if count < buffer_records:
+                del block[count:]
+            if not count:
+                return
+            yield from block
+
+
+def _merge_buffer_records(memory_budget, fanin, itemsize):
+    """k 个输入缓冲区加一个输出缓冲区平分预算（先扣掉固定开销），每个缓冲区的记录数"""
+    usable = memory_budget - MERGE_OVERHEAD_BASE - fanin * MERGE_OVERHEAD_PER_RUN
+    return max(1, usable // ((fanin + 1) * itemsize))
+
+
+def _merge_runs(run_paths, output_path, typecode, buffer_records):
+    """
+    k路归并：heapq.merge 用一个大小为k的堆每次弹出最小的队首记录
+
+    每个run和输出各有一个 buffer_records 条记录的缓冲区，内存占用 O(k * buffer_records)。
+    """
+    readers = [_read_run(path, typecode, buffer_records) for path in run_paths]
+    # 输出缓冲区预先分配好，按下标写入，不随 append 过量分配
+    out = array(typecode, [0]) * buffer_records
+    i = 0
+    with open(output_path, "wb", buffering=0) as f:
+        for value in heapq.merge(*readers):
+            out[i] = value
+            i += 1
+            if i == buffer_records:
+                _write_from(f, out)
+                i = 0
+        _write_from(f, out, i)
+
+
+def external_sort(input_path, output_path, typecode="q", memory_budget=DEFAULT_MEMORY_BUDGET,
+                  processes=None, tmp_dir=None, max_fanin=DEFAULT_MAX_FANIN):
+    """
+    外部归并排序：对比内存大得多的定长整数二进制文件排序
+
+    基本思想：
+    1. 生成run：按内存预算把文件切成若干块，每块用 readinto 直接读进一个 array，
+       用 hybrid_sort_inplace 原地排序后写成临时run文件（多个进程并行生成）
+    2. 归并：用堆做k路归并，读写都按块缓冲；run太多时分多趟归并，
+       每趟最多同时打开 max_fanin 个文件
+
+    内存预算的分配：
+    - 生成run时 processes 个进程同时各持有一块（readinto 直接读进数组，没有中间的 bytes），
+      每块排序时归并只复制较短的一段，临时数组最多再占半块，
+      所以每块记录数取 memory_budget / (processes * 2 * itemsize)
+    - 归并时扣掉每路的固定开销后，k 个输入缓冲区加一个输出缓冲区平分预算
+
+    时间复杂度：O(n log n) 次比较；磁盘I/O为 O(n * 归并趟数)，趟数 = ceil(log_fanin(run数))
+
+    Args:
+        input_path: 输入文件，内容是 array(typecode) 的原始字节（本机字节序）
+        output_path: 输出文件，可以与 input_path 相同
+        typecode: array 的类型码，例如 'q'（int64）、'i'（int32）、'd'（float64）
+        memory_budget: 内存预算（字节）
+        processes: 生成run的进程数，None表示CPU核数，1表示在当前进程中顺序执行
+        tmp_dir: 临时run文件所在目录，None表示系统默认临时目录
+        max_fanin: 每趟归并最多同时归并的run数
+
+    Returns:
+        int - 排序的记录数
+
+    Raises:
+        ValueError - 文件长度不是记录长度的整数倍，或者参数不合法
+    """
+    itemsize = array(typecode).itemsize
+    if max_fanin < 2:
+        raise ValueError("max_fanin must be at least 2")
+    size = os.path.getsize(input_path)
+    if size % itemsize:
+        raise ValueError(f"file size {size} is not a multiple of record size {itemsize}")
+    n = size // itemsize
+    processes = processes or os.cpu_count() or 1
+
+    chunk_records = max(1, memory_budget // (processes * 2 * itemsize))
+    if n <= chunk_records * processes:
+        # 整个文件装得下：不需要临时文件
+        chunk = array(typecode, [0]) * n
+        with open(input_path, "rb", buffering=0) as f:
+            _read_into(f, chunk)
+        hybrid_sort_inplace(chunk)
+        with open(output_path, "wb", buffering=0) as f:
+            _write_from(f, chunk)
+        return n
+
+    # 只有需要临时文件/进程池时才导入，单run的小文件和模块导入都不付这份开销
+    import multiprocessing as mp
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="external_sort_", dir=tmp_dir) as tmp:
+        # 1. 并行生成有序run
+        tasks = [(input_path, start, min(start + chunk_records, n), typecode,
+                  os.path.join(tmp, f"run_0_{i}.bin"))
+                 for i, start in enumerate(range(0, n, chunk_records))]
+        if processes == 1:
+            runs = [_sort_run(task) for task in tasks]
+        else:
+            with mp.Pool(processes) as pool:
+                runs = pool.map(_sort_run, tasks, chunksize=1)
+
+        # 2. 多趟k路归并，直到只剩一个run
+        level = 0
+        while len(runs) > max_fanin:
+            level += 1
+            merged = []
+            for i in range(0, len(runs), max_fanin):
+                group = runs[i:i + max_fanin]
+                path = os.path.join(tmp, f"run_{level}_{i // max_fanin}.bin")
+                buffer_records = _merge_buffer_records(memory_budget, len(group), itemsize)
+                _merge_runs(group, path, typecode, buffer_records)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+
+        buffer_records = _merge_buffer_records(memory_budget, len(runs), itemsize)
+        _merge_runs(runs, output_path, typecode, buffer_records)
+    return n
+
+
+def main():
+    import random
+    import tempfile
+    import time
+
+    def write_random_file(path, n, typecode="q", seed=0):
+        rng = random.Random(seed)
+        data = array(typecode, (rng.randrange(-2 ** 40, 2 ** 40) for _ in range(n)))
+        with open(path, "wb") as f:
+            data.tofile(f)
+        return data
+
+    def read_file(path, typecode="q"):
+        data = array(typecode)
+        with open(path, "rb") as f:
+            data.frombytes(f.read())
+        return data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "input.bin")
+        dst = os.path.join(tmp, "output.bin")
+
+        # 正确性：小内存预算，强制产生大量run和多趟归并
+        expected = sorted(write_random_file(src, 20_000, seed=1))
+        for processes, fanin in [(1, 4), (2, 128)]:
+            external_sort(src, dst, memory_budget=16 * 1024, processes=processes, max_fanin=fanin)
+            assert list(read_file(dst)) == expected
+        external_sort(src, src, memory_budget=1 << 30)
+        assert list(read_file(src)) == expected
+        print("正确性测试通过（多趟归并、并行生成run、原地覆盖输入）")
+
+        # 内存：单进程时整个排序过程（生成run + 归并）的峰值不超过预算，
+        # 随机输入和逆序输入（每块都是一整个要反转的递减run）都要满足
+        import tracemalloc
+        budget = 256 * 1024
+        external_sort(src, dst, memory_budget=budget, processes=1)     # 先跑一次，排除首次导入的开销
+        descending = os.path.join(tmp, "descending.bin")
+        with open(descending, "wb") as f:
+            array("q", reversed(expected)).tofile(f)
+        for name, path in [("随机", src), ("逆序", descending)]:
+            tracemalloc.start()
+            try:
+                base, _ = tracemalloc.get_traced_memory()
+                external_sort(path, dst, memory_budget=budget, processes=1)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert peak - base <= budget, (name, peak - base, budget)
+            assert list(read_file(dst)) == expected
+            print(f"内存测试通过（{name}输入，预算 {budget // 1024} KB，峰值 {(peak - base) // 1024} KB）")
+
+        # 性能：预算只有文件大小的1/4
+        n = 500_000
+        expected = sorted(write_random_file(src, n, seed=2))
+        file_bytes = os.path.getsize(src)
+        budget = file_bytes // 4
+        print(f"\n输入 {n:,} 条 int64（{file_bytes / 2**20:.1f} MB），内存预算 {budget / 2**20:.1f} MB:")
+        for processes in sorted({1, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            external_sort(src, dst, memory_budget=budget, processes=processes)
+            elapsed = time.perf_counter() - start
+            assert list(read_file(dst)) == expected
+            print(f"  processes={processes}: {elapsed:.2f} s（{n / elapsed:,.0f} 条/秒）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,488 @@
+import bisect
+from time import perf_counter
+
+from .. import instrumentation
+
+_REGISTRY = instrumentation.REGISTRY
+_SHIFTS = {name: instrumentation.counter("insertion_sort_shifts_total", "插入排序右移的元素个数",
+                                         {"algorithm": name})
+           for name in ("insertion_sort", "insertion_sort_optimized")}
+_SECONDS = {name: instrumentation.timer("insertion_sort_seconds", "插入排序耗时",
+                                        {"algorithm": name})
+            for name in ("insertion_sort", "insertion_sort_optimized")}
+
+
+def insertion_sort(arr):
+    """插入排序
+    
+    基本思想：
+    1. 将数组分为已排序区间和未排序区间
+    2. 初始时已排序区间只有第一个元素
+    3. 每次从未排序区间取出一个元素，插入到已排序区间的正确位置
+    
+    时间复杂度：
+    - 最好情况：O(n) - 数组已经有序
+    - 最坏情况：O(n²) - 数组逆序
+    - 平均情况：O(n²)
+    
+    🔍 关键理解：while循环结束后j的位置 
+    情况分析
+    当while循环while j >= 0 and arr_copy[j] > key:结束时，有两种可能：
+        j < 0：说明key比所有已排序元素都小
+        arr_copy[j] <= key：找到了合适位置
+    
+    空间复杂度：O(1) - 原地排序
+    
+    Args:
+        arr: List[int] - 待排序的数组
+    
+    Returns:
+        List[int] - 排序后的数组
+    """
+
+    enabled = _REGISTRY.enabled
+    if enabled:
+        t0 = perf_counter()
+    arr_copy = arr.copy()
+    n = len(arr)
+    
+    #从第二个元素开始(下标1), 因为第一个元素默认已经排序
+    for i in range(1,n):
+        #当前要插入的元素
+        key = arr_copy[i]
+        #已经排序区间的最后一个位置
+        j = i-1
+        
+        #在已经排序区间中找到合适的插入位置
+        #将所有大于key的元素向右移动一位
+        while j>=0 and arr_copy[j]  > key:
+            arr_copy[j+1] = arr_copy[j]
+            j-=1
+        
+        arr_copy[j+1]=key
+    
+    if enabled:
+        _SECONDS["insertion_sort"].observe(perf_counter() - t0)
+        # 内层while每右移一个元素恰好消除一个逆序对，移动次数 == 输入的逆序对数；
+        # 事后统计，热循环里不需要计数
+        _SHIFTS["insertion_sort"].inc(count_inversions(arr))
+    return arr_copy
+
+
+
+def insertion_sort_optimized(arr, key=None, reverse=False):
+    """
+    优化版插入排序：使用二分查找找插入位置
+    时间复杂度：O(n log n) for 查找 + O(n²) for 移动 = O(n²)
+    但是比较次数大大减少
+
+    二分查找直接在原数组的 [0, i) 区间上进行（bisect 的 hi=i 参数），
+    不再用 arr_copy[:i] 每轮复制一遍已排序前缀；移动用一次切片赋值整体完成。
+    使用 bisect_right，相等元素保持原有顺序（稳定排序）。
+
+    Args:
+        arr: List - 待排序的数组
+        key: 可选的键函数，与 sorted() 的 key 含义相同
+        reverse: 是否降序，与 sorted() 的 reverse 含义相同（仍然稳定）
+
+    Returns:
+        List - 排序后的数组
+    """
+    enabled = _REGISTRY.enabled
+    if enabled:
+        t0 = perf_counter()
+    arr_copy = arr.copy()
+    if reverse:
+        # 先反转、再稳定升序、最后再反转，相等元素的相对顺序与 sorted(reverse=True) 一致
+        arr_copy.reverse()
+
+    if key is None:
+        shifts = _binary_insertion(arr_copy, None, 0, len(arr_copy), 1)
+    else:
+        keys = [key(x) for x in arr_copy]
+        shifts = _binary_insertion(keys, arr_copy, 0, len(arr_copy), 1)
+
+    if reverse:
+        arr_copy.reverse()
+    if enabled:
+        _SHIFTS["insertion_sort_optimized"].inc(shifts)
+        _SECONDS["insertion_sort_optimized"].observe(perf_counter() - t0)
+    return arr_copy
+
+
+def _binary_insertion(keys, vals, lo, hi, start):
+    """
+    二分插入排序的内核：keys[lo:start] 已经有序，把 keys[start:hi] 逐个插入
+
+    vals 不为 None 时，keys 是预先算好的键，vals 是对应的元素，两者同步移动，
+    这样每个元素的 key() 只计算一次。
+
+    Returns:
+        int - 右移的元素总数（只在需要移动的分支里累加，已经就位的元素没有额外开销）
+    """
+    shifts = 0
+    for i in range(start, hi):
+        k = keys[i]
+        pos = bisect.bisect_right(keys, k, lo, i)
+        if pos == i:
+            continue  # 已经在正确位置，近乎有序的输入大多走这里
+        shifts += i - pos
+        # 块移动：把 [pos, i) 整体右移一位
+        keys[pos + 1:i + 1] = keys[pos:i]
+        keys[pos] = k
+        if vals is not None:
+            v = vals[i]
+            vals[pos + 1:i + 1] = vals[pos:i]
+            vals[pos] = v
+    return shifts
+
+
+def binary_insert(arr, x):
+    """
+    二分插入的单步：把x插入已经有序的arr（插在相等元素之后，保持稳定）
+
+    查找 O(log n)，移动由 list.insert 一次块移动完成。
+
+    Returns:
+        int - 插入的位置
+    """
+    pos = bisect.bisect_right(arr, x)
+    arr.insert(pos, x)
+    return pos
+
+
+def count_inversions(arr):
+    """
+    统计逆序对 (i < j 且 arr[i] > arr[j]) 的个数，自底向上归并，O(n log n)
+
+    插入排序（包括二分插入）把元素右移一位恰好消除一个逆序对，
+    所以逆序对数就是插入排序的移动次数，也是衡量输入"有多乱"的指标。
+
+    Args:
+        arr: List - 任意可比较元素的序列
+
+    Returns:
+        int - 逆序对个数
+    """
+    runs = [[x] for x in arr]
+    inversions = 0
+    while len(runs) > 1:
+        merged = []
+        for i in range(0, len(runs) - 1, 2):
+            left, right = runs[i], runs[i + 1]
+            # 右段每个元素与左段中严格大于它的元素构成逆序对
+            n_left = len(left)
+            for x in right:
+                inversions += n_left - bisect.bisect_right(left, x)
+            merged.append(sorted(left + right))   # 两段都有序，Timsort 线性归并
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return inversions
+
+
+def _min_run_length(n):
+    """
+    计算最小run长度（与 Timsort 相同）：返回 [32, 64] 之间的值，
+    使得 n / min_run 恰好是或略小于2的幂，归并时两边长度尽量平衡
+    """
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _reverse_range(seq, lo, hi):
+    """
+    原地反转 seq[lo:hi]
+
+    seq[lo:hi] = seq[lo:hi][::-1] 会先后生成切片和反转后的切片两份临时副本，
+    整块逆序时额外占用一整块的内存；两端交换不需要任何临时空间。
+    """
+    hi -= 1
+    while lo < hi:
+        seq[lo], seq[hi] = seq[hi], seq[lo]
+        lo += 1
+        hi -= 1
+
+
+def _count_run(keys, vals, lo, hi):
+    """
+    从lo开始找一段自然有序的run，返回run的结束位置
+
+    严格递减的run会被原地反转成递增（只认严格递减，保证稳定性）。
+    """
+    i = lo + 1
+    if i == hi:
+        return hi
+    if keys[i] < keys[lo]:
+        while i + 1 < hi and keys[i + 1] < keys[i]:
+            i += 1
+        _reverse_range(keys, lo, i + 1)
+        if vals is not None:
+            _reverse_range(vals, lo, i + 1)
+    else:
+        while i + 1 < hi and not keys[i + 1] < keys[i]:
+            i += 1
+    return i + 1
+
+
+def _merge(keys, vals, lo, mid, hi):
+    """
+    稳定地归并两个相邻的有序段 [lo, mid) 和 [mid, hi)
+
+    归并前先用二分查找裁掉两端已经就位的元素：
+    左段中 <= keys[mid] 的前缀、右段中 >= keys[mid-1] 的后缀都不用动。
+    对近乎有序的输入，这一步往往能让归并几乎不做事。
+
+    只复制较短的一段作为临时数组（与Timsort的 merge_lo / merge_hi 相同）：
+    左段短就从前往后归并，右段短就从后往前归并，另一段原地读取、不会被提前覆盖。
+    临时空间不超过两段总长的一半。
+    """
+    lo = bisect.bisect_right(keys, keys[mid], lo, mid)
+    if lo == mid:
+        return
+    hi = bisect.bisect_left(keys, keys[mid - 1], mid, hi)
+
+    if mid - lo <= hi - mid:
+        # 从前往后：写位置 k = lo + i + (j - mid) < j，右段还没读的元素不会被覆盖
+        left_keys = keys[lo:mid]
+        left_vals = vals[lo:mid] if vals is not None else None
+        i, j, k = 0, mid, lo
+        n_left = len(left_keys)
+        while i < n_left and j < hi:
+            # 只有右边严格更小时才取右边，相等时先取左边，保证稳定
+            if keys[j] < left_keys[i]:
+                keys[k] = keys[j]
+                if vals is not None:
+                    vals[k] = vals[j]
+                j += 1
+            else:
+                keys[k] = left_keys[i]
+                if vals is not None:
+                    vals[k] = left_vals[i]
+                i += 1
+            k += 1
+        # 右段剩下的元素本来就在正确位置；只需把左段剩下的元素搬到末尾
+        if i < n_left:
+            keys[k:hi] = left_keys[i:]
+            if vals is not None:
+                vals[k:hi] = left_vals[i:]
+    else:
+        # 从后往前：写位置 k = i + (j + 1) > i，左段还没读的元素不会被覆盖
+        right_keys = keys[mid:hi]
+        right_vals = vals[mid:hi] if vals is not None else None
+        i, j, k = mid - 1, len(right_keys) - 1, hi - 1
+        while i >= lo and j >= 0:
+            # 从后往前时相等先取右边，保证稳定
+            if right_keys[j] < keys[i]:
+                keys[k] = keys[i]
+                if vals is not None:
+                    vals[k] = vals[i]
+                i -= 1
+            else:
+                keys[k] = right_keys[j]
+                if vals is not None:
+                    vals[k] = right_vals[j]
+                j -= 1
+            k -= 1
+        # 左段剩下的元素本来就在正确位置；只需把右段剩下的元素搬到开头
+        if j >= 0:
+            keys[lo:k + 1] = right_keys[:j + 1]
+            if vals is not None:
+                vals[lo:k + 1] = right_vals[:j + 1]
+
+
+def _hybrid_sort_inplace(keys, vals, min_run=None):
+    """
+    自然归并 + 二分插入的混合排序（Timsort的简化版），原地排序 keys（以及 vals）
+    """
+    n = len(keys)
+    if n < 2:
+        return
+    if min_run is None:
+        min_run = _min_run_length(n)
+
+    # 栈中保存待归并的run：(起点, 长度)
+    runs = []
+    lo = 0
+    while lo < n:
+        end = _count_run(keys, vals, lo, n)
+        if end - lo < min_run:
+            # 自然run太短：用二分插入把它扩展到min_run
+            forced = min(lo + min_run, n)
+            _binary_insertion(keys, vals, lo, forced, end)
+            end = forced
+        runs.append((lo, end - lo))
+        lo = end
+
+        # 维持栈不变式，保证归并时两边长度平衡，总代价 O(n log n)
+        #   len(A) > len(B) + len(C) 且 len(B) > len(C)
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1])
+                    or (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            _merge_at(keys, vals, runs, i)
+
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        _merge_at(keys, vals, runs, i)
+
+
+def _merge_at(keys, vals, runs, i):
+    """归并栈中第i个和第i+1个run"""
+    lo, len_a = runs[i]
+    _, len_b = runs[i + 1]
+    _merge(keys, vals, lo, lo + len_a, lo + len_a + len_b)
+    runs[i] = (lo, len_a + len_b)
+    del runs[i + 1]
+
+
+def hybrid_sort(arr, key=None, reverse=False, min_run=None):
+    """
+    混合排序：识别自然有序的run，短run用二分插入排序扩展，再两两归并
+
+    基本思想：
+    1. 从左到右扫描，找出已经有序（或严格逆序，原地反转）的自然run
+    2. 短于min_run的run用二分插入排序扩展到min_run —— 小数组上插入排序最快
+    3. 按Timsort的栈不变式归并相邻run，归并前先二分裁掉已经就位的元素
+
+    时间复杂度：
+    - 最好情况：O(n) - 数组已经有序或逆序，只有一个run
+    - 最坏情况：O(n log n)
+    - 近乎有序：接近 O(n)，比较和移动都很少
+
+    空间复杂度：O(n) - 结果数组，归并时的临时数组不超过 n/2
+
+    Args:
+        arr: List - 待排序的数组
+        key: 可选的键函数，与 sorted() 的 key 含义相同
+        reverse: 是否降序，与 sorted() 的 reverse 含义相同（仍然稳定）
+        min_run: 最小run长度，None表示按数组长度自动选择（32~64）
+
+    Returns:
+        List - 排序后的数组
+    """
+    arr_copy = arr.copy()
+    hybrid_sort_inplace(arr_copy, key, reverse, min_run)
+    return arr_copy
+
+
+def hybrid_sort_inplace(arr, key=None, reverse=False, min_run=None):
+    """
+    hybrid_sort 的原地版本，不复制输入
+
+    arr 可以是 list，也可以是 array.array 这类支持切片赋值的可变序列 ——
+    对 array('q') 原地排序时每个元素只占8字节，适合在内存预算内排大块数据。
+
+    Args:
+        arr: 可变序列 - 待排序的数组，会被原地修改
+        key: 可选的键函数，与 sorted() 的 key 含义相同
+        reverse: 是否降序（仍然稳定）
+        min_run: 最小run长度，None表示自动选择
+    """
+    if reverse:
+        arr.reverse()
+
+    if key is None:
+        _hybrid_sort_inplace(arr, None, min_run)
+    else:
+        keys = [key(x) for x in arr]
+        _hybrid_sort_inplace(keys, arr, min_run)
+
+    if reverse:
+        arr.reverse()
+
+
+def insertion_sort_recursive(arr, n=None):
+    """
+    递归版本的插入排序
+    """
+    if n is None:
+        arr = arr.copy()
+        n = len(arr)
+    
+    # 基础情况：只有一个元素或没有元素
+    if n <= 1:
+        return arr
+    
+    # 递归排序前n-1个元素
+    insertion_sort_recursive(arr, n-1)
+    
+    # 将第n个元素插入到正确位置
+    last = arr[n-1]
+    j = n-2
+    
+    while j >= 0 and arr[j] > last:
+        arr[j+1] = arr[j]
+        j -= 1
+    
+    arr[j+1] = last
+    
+    return arr
+
+
+def main():
+    test_arrays = [
+        [64, 34, 25, 12, 22, 11, 90],
+        [5, 2, 4, 6, 1, 3],
+        [1],  # 单元素
+        [],   # 空数组
+        [3, 3, 3, 3],  # 重复元素
+        [1, 2, 3, 4, 5],  # 已排序
+        [5, 4, 3, 2, 1],  # 逆序
+    ]
+
+    print("🔄 插入排序算法测试")
+    print("=" * 60)
+
+    for i, arr in enumerate(test_arrays, 1):
+        print(f"\n测试用例 {i}:")
+        print(f"原数组: {arr}")
+        sorted_arr = insertion_sort(arr)
+        print(f"排序后: {sorted_arr}")
+        print(f"验证: {'✅' if sorted_arr == sorted(arr) else '❌'}")
+
+    # 二分插入排序、混合排序与内置sorted对比（包括key、reverse和稳定性）
+    print("\n" + "=" * 60)
+    print("🔀 二分插入排序 / 混合排序测试")
+    print("=" * 60)
+    import random
+    rng = random.Random(0)
+    cases = test_arrays + [
+        [rng.randint(0, 50) for _ in range(500)],                # 大量重复
+        list(range(1000)),                                      # 已排序
+        list(range(1000, 0, -1)),                               # 逆序
+        sorted(rng.random() for _ in range(1000))[::-1][:700] + [rng.random() for _ in range(20)],
+    ]
+    records = [(rng.randint(0, 9), i) for i in range(300)]      # 用于检查稳定性
+    all_ok = True
+    for arr in cases:
+        for sort_func in (insertion_sort_optimized, hybrid_sort):
+            for reverse in (False, True):
+                all_ok &= sort_func(arr, reverse=reverse) == sorted(arr, reverse=reverse)
+                all_ok &= (sort_func(arr, key=lambda x: -x, reverse=reverse)
+                           == sorted(arr, key=lambda x: -x, reverse=reverse))
+    for sort_func in (insertion_sort_optimized, hybrid_sort):
+        for reverse in (False, True):
+            all_ok &= (sort_func(records, key=lambda r: r[0], reverse=reverse)
+                       == sorted(records, key=lambda r: r[0], reverse=reverse))
+    print(f"与 sorted() 结果一致（含key/reverse/稳定性）: {'✅' if all_ok else '❌'}")
+
+    # 详细过程演示
+    print("\n" + "=" * 60)
+    print("📝 详细排序过程演示")
+    print("=" * 60)
+    demo_array = [64, 34, 25, 12, 22]
+    insertion_sort(demo_array)
+
+
+if __name__ == "__main__":
+    main()